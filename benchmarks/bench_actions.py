@@ -0,0 +1,51 @@
+"""
+Applying rounds of actions one `execute_action` call at a time against one `execute_actions` batch per round,
+on the trusted and on the validated path.
+
+Run from the project root with `python -m benchmarks.bench_actions`.
+"""
+from __future__ import annotations
+import time
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace
+from services import HistoryService
+
+
+def _round(players) -> list:
+    a, b, c, d, e = players
+    return [
+        (a, ActiveFace.JAB, b, None),
+        (b, ActiveFace.RECOVER, None, None),
+        (c, ActiveFace.POWER_MOVE, None, "gain_vp"),
+        (d, ActiveFace.PICKPOCKET, c, None),
+        (e, ActiveFace.RECOVER, None, None),
+    ]
+
+
+def main(rounds: int = 20_000) -> None:
+    for trusted in (False, True):
+        session = GameSession(("A", "B", "C", "D", "E"), seed=0)
+        actions = _round(session.players)
+        label = "trusted" if trusted else "validated"
+
+        service = Action_service(HistoryService(validate=not trusted), trusted=trusted)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for player, face, target, choice in actions:
+                service.execute_action(player, face, target, choice_action=choice)
+        single = time.perf_counter() - start
+
+        service = Action_service(HistoryService(validate=not trusted), trusted=trusted)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            service.execute_actions(actions)
+        batched = time.perf_counter() - start
+
+        count = rounds * len(actions)
+        print(f"{label:>9}: one by one {count / single:,.0f} actions/s, batched {count / batched:,.0f} actions/s")
+
+
+if __name__ == "__main__":
+    main()
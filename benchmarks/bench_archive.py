@@ -0,0 +1,111 @@
+"""
+Scanning simulated games for offline analysis: total damage dealt per face, from NDJSON (`NdjsonHistoryWriter`)
+against the binary archive (`BinaryArchiveWriter`), read tuple by tuple and as a NumPy view of the mapped file.
+Also prints the bytes per event on disk and the Python memory allocated by each scan.
+
+Run from the project root with `python -m benchmarks.bench_archive`.
+"""
+from __future__ import annotations
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace
+from services import HistoryService, NdjsonHistoryWriter, BinaryArchiveWriter, BinaryArchiveReader
+from services.EventLog import FACES
+
+
+def _game(rounds: int) -> HistoryService:
+    session = GameSession(("A", "B", "C", "D", "E"), seed=0)
+    a, b, c, d, e = session.players
+    actions = [
+        (a, ActiveFace.RECOVER, None, None),
+        (b, ActiveFace.RECOVER, None, None),
+        (c, ActiveFace.POWER_MOVE, None, "gain_vp"),
+        (d, ActiveFace.PICKPOCKET, c, None),
+        (e, ActiveFace.RECOVER, None, None),
+    ]
+    history = HistoryService(validate=False, columnar=True)
+    service = Action_service(history, trusted=True)
+    for _ in range(rounds):
+        service.execute_actions(actions)
+    return history
+
+
+def _scan_ndjson(paths: list[Path]) -> dict[str, int]:
+    totals: dict[str, int] = {}
+    for path in paths:
+        with open(path, "rb") as file:
+            for line in file:
+                event = json.loads(line)
+                for _, amount in event.get("dmg", ()):
+                    totals[event["face"]] = totals.get(event["face"], 0) + amount
+    return totals
+
+
+def _scan_tuples(reader: BinaryArchiveReader) -> dict[str, int]:
+    totals = [0] * len(FACES)
+    for _, _, _, _, face, kind, amount in reader:
+        if kind == 1:
+            totals[face] += amount
+    return {FACES[face].name: total for face, total in enumerate(totals) if total}
+
+
+def _scan_numpy(reader: BinaryArchiveReader) -> dict[str, int]:
+    import numpy as np
+
+    events = reader.array()
+    damage = events["kind"] == 1
+    totals = np.bincount(events["face"][damage], weights=events["amount"][damage], minlength=len(FACES))
+    return {FACES[face].name: int(total) for face, total in enumerate(totals) if total}
+
+
+def _timed(scan, *args) -> tuple[float, int, dict[str, int]]:
+    """Time of one scan, then its peak traced memory in a second one (tracing slows the scans unevenly)."""
+    start = time.perf_counter()
+    totals = scan(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    scan(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, totals
+
+
+def main(rounds: int = 20_000, games: int = 50) -> None:
+    history = _game(rounds)
+    per_game = len(history.history)
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        # NDJSON of a single game, its scan time is scaled to all the games
+        with NdjsonHistoryWriter(directory) as ndjson:
+            ndjson.attach(history)
+        with BinaryArchiveWriter(directory / "games.bin") as archive:
+            for game_id in range(games):
+                archive.write_log(game_id, history.history)
+
+        ndjson_bytes = sum(path.stat().st_size for path in ndjson.files())
+        elapsed, peak, expected = _timed(_scan_ndjson, ndjson.files())
+        print(f"NDJSON        : {ndjson_bytes / per_game:5.1f} bytes/event, {per_game / elapsed:>13,.0f} events/s, "
+              f"{games * elapsed:7.2f} s for {games} games, peak {peak / 2**10:,.0f} KiB")
+
+        reader = BinaryArchiveReader(directory / "games.bin")
+        size = (directory / "games.bin").stat().st_size
+        for label, scan in (("binary tuples", _scan_tuples), ("binary NumPy", _scan_numpy)):
+            try:
+                elapsed, peak, totals = _timed(scan, reader)
+            except ImportError as exc:
+                print(f"{label:<14}: skipped, {exc}")
+                continue
+            assert totals == {face: total * games for face, total in expected.items()}
+            print(f"{label:<14}: {size / len(reader):5.1f} bytes/event, {len(reader) / elapsed:>13,.0f} events/s, "
+                  f"{elapsed:7.2f} s for {games} games, peak {peak / 2**10:,.0f} KiB")
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Rollouts per second of the MCTS bot for a 50 ms move, from the opening position and from a late position.
+
+Run from the project root with `python -m benchmarks.bench_bot`.
+"""
+from __future__ import annotations
+
+from controllers.bot import search
+from models import GameState
+
+POSITIONS = {
+    "opening": GameState(tuple("ABCDE")),
+    "round 10": GameState(tuple("ABCDE"), hp=(12, 0, 7, 15, 3), vp=(11, 4, 9, 12, 8), alive=(True, False, True, True, True), round=10),
+}
+
+
+def main(budget: float = 0.05, moves: int = 20) -> None:
+    for name, state in POSITIONS.items():
+        rollouts = elapsed = 0.0
+        for i in range(moves):
+            # STRIKE: one child per alive opponent
+            result = search(state.snapshot(), 0, 5, budget, seed=i)
+            rollouts += result.rollouts
+            elapsed += result.elapsed
+        print(f"{name:<9} {rollouts / moves:>7.0f} rollouts/move  {rollouts / elapsed:>9,.0f} rollouts/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Compute saved by sequential evaluation: games, confidence interval width and wall time of `evaluate`
+compared with a fixed budget of 20 000 games, for a clear difference and for two equal policies.
+
+Run from the project root with `python -m benchmarks.bench_evaluator`.
+"""
+from __future__ import annotations
+
+from controllers.evaluator import evaluate
+from services import RandomPolicy
+
+FIXED_PAIRS = 10_000
+
+
+class Greedy(RandomPolicy):
+    """Always banks the POWER_MOVE VP."""
+
+    def choose_power_move(self, player, candidates):
+        return "gain_vp"
+
+
+def report(label: str, sequential, fixed) -> None:
+    print(f"{label}")
+    for name, result in (("sequential", sequential), ("fixed", fixed)):
+        print(f"  {name:<10} {result.verdict:<12} {result.games:>6} games  CI width {result.ci_width:.3f}  {result.wall_time:>6.1f}s")
+    print(f"  -> {fixed.games / sequential.games:.1f}x fewer games")
+
+
+def main() -> None:
+    for label, policy_a in (("greedy POWER_MOVE vs random", Greedy()), ("random vs random", RandomPolicy())):
+        sequential = evaluate(policy_a, RandomPolicy(), max_pairs=FIXED_PAIRS)
+        # one look over the whole budget is the fixed sample design
+        fixed = evaluate(policy_a, RandomPolicy(), batch_pairs=FIXED_PAIRS, max_pairs=FIXED_PAIRS)
+        report(label, sequential, fixed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Streaming simulated events to rotating NDJSON files while they are recorded: throughput with and without the
+writer attached, and the writer's peak memory, which stays at one batch whatever the number of events.
+
+Run from the project root with `python -m benchmarks.bench_export`.
+"""
+from __future__ import annotations
+import tempfile
+import time
+import tracemalloc
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace
+from services import HistoryService, NdjsonHistoryWriter
+
+
+def _play(history: HistoryService, rounds: int) -> float:
+    session = GameSession(("A", "B", "C", "D", "E"), seed=0)
+    a, b, c, d, e = session.players
+    actions = [
+        (a, ActiveFace.RECOVER, None, None),
+        (b, ActiveFace.RECOVER, None, None),
+        (c, ActiveFace.POWER_MOVE, None, "gain_vp"),
+        (d, ActiveFace.PICKPOCKET, c, None),
+        (e, ActiveFace.RECOVER, None, None),
+    ]
+    service = Action_service(history, trusted=True)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        service.execute_actions(actions)
+    return time.perf_counter() - start
+
+
+def _peak(history: HistoryService, rounds: int) -> int:
+    tracemalloc.start()
+    _play(history, rounds)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main(rounds: int = 40_000) -> None:
+    events = rounds * 5
+    elapsed = _play(HistoryService(validate=False, columnar=True), rounds)
+    print(f"    no export: {events / elapsed:,.0f} events/s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for flush_every in (1, 1024):
+            history = HistoryService(validate=False, columnar=True)
+            writer = NdjsonHistoryWriter(directory, prefix=f"run{flush_every}", max_bytes=4 * 2**20, flush_every=flush_every)
+            history.subscribe(writer.write)
+            elapsed = _play(history, rounds)
+            writer.close()
+            size = sum(path.stat().st_size for path in writer.files())
+            print(f"flush every {flush_every:>4}: {events / elapsed:,.0f} events/s, {size / 2**20:,.1f} MiB in {len(writer.files())} files")
+
+        # the writer's own memory: peak with it attached minus peak without, for growing runs
+        for traced_rounds in (rounds // 20, rounds // 4):
+            baseline = _peak(HistoryService(validate=False, columnar=True), traced_rounds)
+            history = HistoryService(validate=False, columnar=True)
+            with NdjsonHistoryWriter(directory, prefix=f"traced{traced_rounds}") as writer:
+                history.subscribe(writer.write)
+                peak = _peak(history, traced_rounds)
+            print(f"{traced_rounds * 5:>9,} events: writer peak {(peak - baseline) / 2**10:,.0f} KiB over the history alone")
+
+
+if __name__ == "__main__":
+    main()
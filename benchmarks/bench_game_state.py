@@ -0,0 +1,35 @@
+"""
+Cost of copying a game for look-ahead: `GameState.clone()` against `copy.deepcopy` of the player objects
+it replaces, plus `snapshot()` / `restore()` round trips.
+
+Run from the project root with `python -m benchmarks.bench_game_state`.
+"""
+from __future__ import annotations
+import copy
+import time
+
+from models import Player, GameState
+
+
+def rate(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return n / (time.perf_counter() - start)
+
+
+def main(n: int = 200_000) -> None:
+    Player.player_arrangement.clear()
+    players = [Player(f"P{i}") for i in range(1, 6)]
+    state = GameState.from_players(players)
+    snapshot = state.snapshot()
+
+    print(f"GameState.clone      {rate(state.clone, n):>12,.0f} /s")
+    print(f"snapshot + restore   {rate(lambda: state.restore(state.snapshot()), n):>12,.0f} /s")
+    print(f"from_snapshot        {rate(lambda: GameState.from_snapshot(snapshot), n):>12,.0f} /s")
+    print(f"deepcopy(players)    {rate(lambda: copy.deepcopy(players), n // 20):>12,.0f} /s")
+    Player.player_arrangement.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Per-player and per-face queries of a growing history: `HistoryService.find_events` through the secondary
+indexes against a scan of every `EventRecord`: the single PICKPOCKET of one player (other players roll it every
+round) and everything done to one player.
+
+Run from the project root with `python -m benchmarks.bench_history_index`.
+"""
+from __future__ import annotations
+import time
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace
+from services import HistoryService
+
+
+def _best(query, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        query()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes: tuple[int, ...] = (1_000, 10_000, 100_000)) -> None:
+    for rounds in sizes:
+        session = GameSession(("A", "B", "C", "D", "E"), seed=0)
+        a, b, c, d, e = session.players
+        actions = [
+            (a, ActiveFace.RECOVER, None, None),
+            (b, ActiveFace.RECOVER, None, None),
+            (c, ActiveFace.RECOVER, None, None),
+            (d, ActiveFace.RECOVER, None, None),
+            (e, ActiveFace.PICKPOCKET, c, None),
+        ]
+        # the last round of the game has a second PICKPOCKET, by a
+        history = HistoryService(validate=False)
+        service = Action_service(history, trusted=True)
+        for _ in range(rounds):
+            service.execute_actions(actions)
+        service.execute_action(a, ActiveFace.PICKPOCKET, c)
+
+        queries = (
+            ("PICKPOCKET by A", dict(rolled_by=a, dice_face_value=ActiveFace.PICKPOCKET),
+             lambda r: r.rolled_by is a and r.dice_face_value is ActiveFace.PICKPOCKET),
+            ("events done to C", dict(target=c), lambda r: r.participants[1] is c),
+        )
+        for label, filters, match in queries:
+            scan = _best(lambda: {i: r for i, r in history.history.items() if match(r)})
+            indexed = _best(lambda: history.find_events(**filters))
+            found = len(history.find_events(**filters))
+            print(f"{len(history.history):>9,} events, {label:<16} ({found:>7,} found): "
+                  f"scan {scan * 1e3:8.2f} ms, indexed {indexed * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
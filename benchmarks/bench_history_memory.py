@@ -0,0 +1,49 @@
+"""
+Memory and recording speed of the history backends: the dict of `EventRecord` against the `ColumnarEventLog`,
+measured with `tracemalloc` over the events of trusted simulated rounds.
+
+Run from the project root with `python -m benchmarks.bench_history_memory`.
+"""
+from __future__ import annotations
+import time
+import tracemalloc
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace
+from services import HistoryService
+
+
+def _record(columnar: bool, rounds: int) -> tuple[int, float, int]:
+    """Plays `rounds` rounds of five actions into a fresh history, returns (events, seconds, bytes held)."""
+    session = GameSession(("A", "B", "C", "D", "E"), seed=0)
+    a, b, c, d, e = session.players
+    actions = [
+        (a, ActiveFace.JAB, b, None),
+        (b, ActiveFace.RECOVER, None, None),
+        (c, ActiveFace.POWER_MOVE, None, "gain_vp"),
+        (d, ActiveFace.PICKPOCKET, c, None),
+        (e, ActiveFace.BACKFIRE, None, None),
+    ]
+    tracemalloc.start()
+    history = HistoryService(validate=False, columnar=columnar)
+    service = Action_service(history, trusted=True)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for player, face, target, choice in actions:
+            service.execute_action(player, face, target, choice_action=choice)
+    elapsed = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(history.history), elapsed, held
+
+
+def main(rounds: int = 40_000) -> None:
+    for label, columnar in (("dict of EventRecord", False), ("columnar", True)):
+        events, elapsed, held = _record(columnar, rounds)
+        print(f"{label:>19}: {events:,} events, {held / events:,.1f} bytes/event, "
+              f"{events / elapsed:,.0f} events/s recorded")
+
+
+if __name__ == "__main__":
+    main()
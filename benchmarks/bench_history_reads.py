@@ -0,0 +1,40 @@
+"""
+Reading the last event of growing histories: listing the whole history and slicing it, as `get_events` used to,
+against the positional `tail` read, on both history backends.
+
+Run from the project root with `python -m benchmarks.bench_history_reads`.
+"""
+from __future__ import annotations
+import time
+
+from controllers.session import GameSession
+from models import ActiveFace
+from services import HistoryService
+
+
+def main(reads: int = 10_000, listed_reads: int = 20) -> None:
+    session = GameSession(("A", "B"), seed=0)
+    a, b = session.players
+    for size in (1_000, 10_000, 100_000):
+        for columnar in (False, True):
+            history = HistoryService(validate=False, columnar=columnar)
+            for _ in range(size):
+                history.record_event(history.next_event_id(), a, ActiveFace.JAB, b, damage_dealt=2)
+
+            start = time.perf_counter()
+            for _ in range(listed_reads):
+                dict(list(history.history.items())[-1:])
+            listed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(reads):
+                history.tail(1)
+            tail = time.perf_counter() - start
+
+            label = "columnar" if columnar else "dict"
+            print(f"{size:>7} events {label:>8}: listed slice {listed / listed_reads * 1e6:,.1f} us/read, "
+                  f"tail {tail / reads * 1e6:,.2f} us/read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Per-player totals of a growing history: `HistoryService.player_totals` against recomputing them with a scan of
+every `EventRecord`, and what keeping the index and totals costs the recording (`indexed=True` against False).
+
+Run from the project root with `python -m benchmarks.bench_history_totals`.
+"""
+from __future__ import annotations
+import time
+
+from controllers.session import GameSession
+from models import ActiveFace
+from services import HistoryService
+
+
+def _scan_damage_taken(history: HistoryService, player) -> int:
+    return sum(amount for record in history.history.values() for target, amount in record.damage_dealt or () if target is player)
+
+
+def main(sizes: tuple[int, ...] = (1_000, 10_000, 100_000)) -> None:
+    session = GameSession(("A", "B", "C"), seed=0)
+    a, b, c = session.players
+    events = [
+        (a, ActiveFace.JAB, b, 2, None, None, None),
+        (b, ActiveFace.RECOVER, None, None, 3, None, None),
+        (c, ActiveFace.PICKPOCKET, a, None, None, None, 1),
+    ]
+    for rounds in sizes:
+        elapsed = {}
+        for indexed in (False, True):
+            history = HistoryService(validate=False, indexed=indexed)
+            start = time.perf_counter()
+            for _ in range(rounds):
+                history.record_events(events)
+            elapsed[indexed] = time.perf_counter() - start
+        count = len(history.history)
+
+        start = time.perf_counter()
+        scanned = _scan_damage_taken(history, b)
+        scan = time.perf_counter() - start
+        start = time.perf_counter()
+        read = history.player_totals(b).damage_taken
+        totals = time.perf_counter() - start
+        assert read == scanned
+        print(f"{count:>9,} events: recorded {elapsed[False] / count * 1e9:,.0f} ns/event plain, "
+              f"{elapsed[True] / count * 1e9:,.0f} indexed; damage taken by B: scan {scan * 1e3:8.2f} ms, "
+              f"totals {totals * 1e6:5.1f} us")
+
+
+if __name__ == "__main__":
+    main()
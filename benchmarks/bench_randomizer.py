@@ -0,0 +1,44 @@
+"""
+Microbenchmark for dice rolls: the old clock-derived roll against the seeded `RandomEngine`,
+single rolls and batched `roll_many`.
+
+Run from the project root with `python -m benchmarks.bench_randomizer`.
+"""
+from __future__ import annotations
+from datetime import datetime
+import timeit
+
+from helpers import Randomizer, RandomEngine
+
+
+def legacy_roll_dice() -> int:
+    """
+    The roll used before the engine existed, kept here only as the baseline.
+    `str(datetime.now())` drops the fraction when microsecond == 0, so the digits are taken via isoformat.
+    """
+    while not (dice_value := sum([int(num) for num in datetime.now().isoformat(timespec="microseconds").split('.')[-1]]) % 7):
+        ...
+    return dice_value
+
+
+def rolls_per_second(func, n: int) -> float:
+    return n / min(timeit.repeat(func, number=n, repeat=5))
+
+
+def main(n: int = 200_000) -> None:
+    Randomizer.use_engine(RandomEngine(seed=2029))
+    engine = RandomEngine(seed=2029)
+
+    legacy = rolls_per_second(legacy_roll_dice, n)
+    shared = rolls_per_second(Randomizer.roll_dice, n)
+    direct = rolls_per_second(engine.roll, n)
+    batched = n / min(timeit.repeat(lambda: engine.roll_many(n), number=1, repeat=5))
+
+    print(f"legacy datetime roll      : {legacy:>14,.0f} rolls/s")
+    print(f"Randomizer.roll_dice      : {shared:>14,.0f} rolls/s  ({shared / legacy:.1f}x)")
+    print(f"RandomEngine.roll (bound) : {direct:>14,.0f} rolls/s  ({direct / legacy:.1f}x)")
+    print(f"RandomEngine.roll_many    : {batched:>14,.0f} rolls/s  ({batched / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
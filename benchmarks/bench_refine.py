@@ -0,0 +1,36 @@
+"""
+Rendering the history with `refine_event` after every recorded event: the last 20 events (a scrolling log) and
+the whole history, rendered from scratch by a fresh service against the cached lines of the recording one.
+
+Run from the project root with `python -m benchmarks.bench_refine`.
+"""
+from __future__ import annotations
+import time
+
+from controllers.session import GameSession
+from models import ActiveFace
+from services import HistoryService
+
+
+def main(events: int = 2_000) -> None:
+    session = GameSession(("A", "B"), seed=0)
+    a, b = session.players
+    for label, count in (("last 20 events", 20), ("whole history", events)):
+        history = HistoryService()
+        fresh = cached = 0.0
+        for _ in range(events):
+            history.record_event(history.next_event_id(), a, ActiveFace.JAB, b, damage_dealt=2)
+            shown = history.tail(count)
+
+            start = time.perf_counter()
+            HistoryService().refine_event(shown)
+            fresh += time.perf_counter() - start
+
+            start = time.perf_counter()
+            history.refine_event(shown)
+            cached += time.perf_counter() - start
+        print(f"{label:>14} after each of {events:,} events: from scratch {fresh * 1e3:,.1f} ms, cached {cached * 1e3:,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
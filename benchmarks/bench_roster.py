@@ -0,0 +1,35 @@
+"""
+Player lookup by name and by id: a linear scan of a player list against the `PlayerRoster` index,
+for lobbies of growing size.
+
+Run from the project root with `python -m benchmarks.bench_roster`.
+"""
+from __future__ import annotations
+import timeit
+
+from models import Player, PlayerRoster
+
+
+def main(sizes: tuple[int, ...] = (5, 100, 10_000), lookups: int = 10_000) -> None:
+    for size in sizes:
+        players = []
+        for i in range(size):
+            # built outside the size capped lobby, the roster gives the ids
+            player = Player(f"p{i}")
+            Player.player_arrangement.clear()
+            player.player_id = None
+            players.append(player)
+        roster = PlayerRoster(players)
+        name, player_id = players[-1].name, players[-1].player_id
+
+        scan = timeit.timeit(lambda: next((p for p in players if p.name == name), None), number=lookups)
+        by_name = timeit.timeit(lambda: roster.by_name(name), number=lookups)
+        by_id = timeit.timeit(lambda: roster.by_id(player_id), number=lookups)
+        print(
+            f"{size:>6} players: scan {scan / lookups * 1e6:8.2f}us  "
+            f"by_name {by_name / lookups * 1e6:6.2f}us  by_id {by_id / lookups * 1e6:6.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark for the initial seat shuffle.
+
+1. Uniformity: shuffles a 5 player lobby many times and runs a chi-square test on how often each
+   player lands on each seat (20 degrees of freedom, 5% critical value 31.41).
+2. Scaling: times the in-place Fisher-Yates shuffle on very large lists and reports the cost per element,
+   which should stay flat as the list grows.
+
+Run from the project root with `python -m benchmarks.bench_seat_shuffle`.
+"""
+from __future__ import annotations
+import time
+
+from helpers import RandomEngine
+
+CHI_SQUARE_CRITICAL_DF20 = 31.41
+
+
+def seat_chi_square(trials: int = 300_000, players: int = 5) -> float:
+    engine = RandomEngine(seed=2029, stream="seats")
+    counts = [[0] * players for _ in range(players)]
+    lobby = list(range(players))
+    for _ in range(trials):
+        engine.shuffle(lobby)
+        for seat, player in enumerate(lobby):
+            counts[player][seat] += 1
+
+    expected = trials / players
+    return sum((c - expected) ** 2 / expected for row in counts for c in row)
+
+
+def ns_per_element(n: int) -> float:
+    engine = RandomEngine(seed=2029, stream="seats")
+    lobby = list(range(n))
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter_ns()
+        engine.shuffle(lobby)
+        best = min(best, time.perf_counter_ns() - start)
+    return best / n
+
+
+def main() -> None:
+    chi2 = seat_chi_square()
+    verdict = "uniform" if chi2 < CHI_SQUARE_CRITICAL_DF20 else "NOT uniform"
+    print(f"seat distribution chi-square (df=20): {chi2:.2f} -> {verdict}")
+
+    for n in (1_000, 10_000, 100_000, 1_000_000):
+        print(f"shuffle n={n:>9,}: {ns_per_element(n):6.1f} ns/element")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Many concurrent games in one process: `sessions` isolated `GameSession`s are kept alive at once and
+advanced one round each in turn, like a server hosting many tables.
+
+Run from the project root with `python -m benchmarks.bench_session`.
+"""
+from __future__ import annotations
+import time
+import tracemalloc
+
+from controllers.session import GameSession
+from services import RandomPolicy
+
+NAMES = ("Ana", "Ben", "Cy", "Dee", "Eli")
+
+
+def main(sessions: int = 2_000) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    tables = [GameSession(NAMES, seed=s) for s in range(sessions)]
+    created = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    policies = [RandomPolicy() for _ in NAMES]
+    rounds = 0
+    start = time.perf_counter()
+    live = tables
+    while live:
+        for session in live:
+            session.play_round(policies)
+            rounds += 1
+        live = [s for s in live if not s.is_over]
+    elapsed = time.perf_counter() - start
+
+    print(f"{sessions} sessions created in {created:.2f}s, {memory / sessions / 1024:.1f} KiB each")
+    print(f"{rounds} interleaved rounds in {elapsed:.2f}s -> {sessions / elapsed:,.0f} games/s")
+
+
+if __name__ == "__main__":
+    main()
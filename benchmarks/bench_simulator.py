@@ -0,0 +1,24 @@
+"""
+Throughput of the headless game engine: complete games per second on one core with `RandomPolicy`.
+
+Run from the project root with `python -m benchmarks.bench_simulator`.
+"""
+from __future__ import annotations
+import time
+
+from controllers.simulator import HeadlessGameController
+from services import RandomPolicy
+
+
+def main(games: int = 2_000) -> None:
+    controller = HeadlessGameController(RandomPolicy())
+    start = time.perf_counter()
+    summaries = controller.play_many(range(games))
+    elapsed = time.perf_counter() - start
+
+    rounds = sum(s.rounds_played for s in summaries) / games
+    print(f"{games} games in {elapsed:.2f}s -> {games / elapsed:,.0f} games/s (avg {rounds:.1f} rounds/game)")
+
+
+if __name__ == "__main__":
+    main()
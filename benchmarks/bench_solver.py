@@ -0,0 +1,36 @@
+"""
+Cost of exact endgame values: solve time, solved positions and transposition table hit rate
+for a few endgames. The cost grows quickly with the number of players and rounds left.
+
+Run from the project root with `python -m benchmarks.bench_solver`.
+"""
+from __future__ import annotations
+import time
+
+from controllers.solver import ExpectimaxSolver
+from models import GameState
+from configs import DEFAULT_RULESET
+
+LAST = DEFAULT_RULESET.max_rounds - 1
+
+POSITIONS = {
+    "2 players, 3 rounds": GameState(("A", "B"), hp=(12, 7), vp=(11, 9), round=LAST - 2),
+    "3 players, 2 rounds": GameState(("A", "B", "C"), hp=(12, 7, 15), vp=(11, 9, 12), round=LAST - 1),
+    "4 players, 1 round": GameState(tuple("ABCD"), hp=(12, 9, 7, 15), vp=(11, 9, 12, 10), round=LAST),
+    "5 players, 1 round": GameState(tuple("ABCDE"), hp=(12, 0, 7, 15, 3), vp=(11, 4, 9, 12, 8), alive=(True, False, True, True, True), round=LAST),
+}
+
+
+def main() -> None:
+    for name, state in POSITIONS.items():
+        solver = ExpectimaxSolver()
+        start = time.perf_counter()
+        value = solver.value(state)
+        elapsed = time.perf_counter() - start
+        table = solver.table
+        print(f"{name:<20} {elapsed:>7.2f}s  {len(table):>8,} positions  hit rate {table.hit_rate:.2f}  "
+              f"win p = {', '.join(f'{v:.3f}' for v in value)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Balance sweep over JAB_DMG x STRIKE_HP x POWER_MOVE_VP: cold run, cached rerun and an extension to
+twice the games, then the most and least balanced cells.
+
+Run from the project root with `python -m benchmarks.bench_sweep` (needs NumPy).
+"""
+from __future__ import annotations
+import tempfile
+import time
+
+from controllers.sweep import run_sweep, grid
+
+
+def main(games: int = 10_000) -> None:
+    cells = grid(jab_dmg=(1, 2, 3), strike_hp=(3, 4, 5), power_move_vp=(2, 3, 4))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for label, n in (("cold", games), ("rerun", games), ("extend x2", 2 * games)):
+            start = time.perf_counter()
+            stats = run_sweep(cells, n, cache_dir=cache_dir)
+            elapsed = time.perf_counter() - start
+            cached = sum(c.cached_chunks for c in stats)
+            print(f"{label:<10} {len(cells)} cells x {n:,} games in {elapsed:6.2f}s ({cached} cached chunks)")
+
+    stats.sort(key=lambda c: c.max_seat_advantage)
+    for cell in (stats[0], stats[-1]):
+        r = cell.rules
+        print(f"jab={r.jab_dmg} strike={r.strike_hp} pm_vp={r.power_move_vp}: "
+              f"max seat advantage {cell.max_seat_advantage:.4f}, {cell.mean_rounds:.2f} +- {cell.std_rounds:.2f} rounds, "
+              f"{cell.full_length_rate:.1%} full length")
+
+
+if __name__ == "__main__":
+    main()
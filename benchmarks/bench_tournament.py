@@ -0,0 +1,27 @@
+"""
+Scaling of the tournament runner: games per second for 1..cpu_count worker processes.
+The aggregated results are checked to be identical for every worker count.
+
+Run from the project root with `python -m benchmarks.bench_tournament`.
+"""
+from __future__ import annotations
+import os
+import time
+
+from controllers.tournament import run_tournament
+
+
+def main(games: int = 4_000, master_seed: int = 2029) -> None:
+    baseline = None
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    for workers in worker_counts:
+        start = time.perf_counter()
+        result = run_tournament(games, master_seed, workers=workers, chunk_size=200)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or result
+        same = "identical" if result == baseline else "DIFFERENT"
+        print(f"workers={workers:>2}: {games / elapsed:>8,.0f} games/s  results {same}  win rates {[round(w, 3) for w in result.win_rates]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Validated against trusted execution: the `Player` mutations with their checks and exceptions against the
+unchecked primitives returning status codes, and complete headless games on both `Action_service` paths.
+
+Run from the project root with `python -m benchmarks.bench_trusted`.
+"""
+from __future__ import annotations
+import time
+import timeit
+from typing import Callable
+
+from controllers.simulator import HeadlessGameController
+from models import Player
+from services import RandomPolicy
+
+
+def _mutations(player: Player, other: Player, suffix: str) -> Callable[[], None]:
+    """One damage, heal, vp gain and vp steal, through the methods ending in `suffix`."""
+    take_damage, heal = getattr(player, f"take_damage{suffix}"), getattr(player, f"heal{suffix}")
+    gain_vp, steal_vp = getattr(player, f"gain_vp{suffix}"), getattr(other, f"steal_vp{suffix}")
+
+    def run() -> None:
+        take_damage(2)
+        heal(2)
+        gain_vp(1)
+        steal_vp(player, 1)
+    return run
+
+
+def main(calls: int = 200_000, games: int = 1_000) -> None:
+    player, other = Player("A"), Player("B")
+    Player.player_arrangement.clear()
+    for label, suffix in (("validated", ""), ("unchecked", "_unchecked")):
+        elapsed = timeit.timeit(_mutations(player, other, suffix), number=calls)
+        print(f"{label:>9} mutations: {4 * calls / elapsed:,.0f} calls/s")
+
+    for label, trusted in (("validated", False), ("trusted", True)):
+        controller = HeadlessGameController(RandomPolicy(), trusted=trusted)
+        start = time.perf_counter()
+        controller.play_many(range(games))
+        elapsed = time.perf_counter() - start
+        print(f"{label:>9} games: {games} in {elapsed:.2f}s -> {games / elapsed:,.0f} games/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Apply and undo through inverse deltas against copying the state: a search move on growing states, taking an
+action back in a session, and the cost of recording the deltas on `execute_action`.
+
+Run from the project root with `python -m benchmarks.bench_undo`.
+"""
+from __future__ import annotations
+import time
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace, GameState
+from models.GameState import OPTION_HP
+from services import HistoryService, UndoStack
+
+
+def main(actions: int = 100_000) -> None:
+    # search side: one move applied and taken back on one state, against a clone per move
+    for seats in (5, 50, 500):
+        state = GameState([f"P{i}" for i in range(seats)])
+        start = time.perf_counter()
+        for _ in range(actions):
+            child = state.clone()
+            child.apply(0, 4, (1, OPTION_HP))
+        clones = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(actions):
+            saved = state.checkpoint(0, 1)
+            state.apply(0, 4, (1, OPTION_HP))
+            state.rollback(saved)
+        deltas = time.perf_counter() - start
+        print(f"{seats:>4} seats: clone + apply {actions / clones:,.0f}/s, apply + rollback {actions / deltas:,.0f}/s")
+
+    # action side: a move taken back through its delta, against a snapshot restore and history pop
+    session = GameSession(("A", "B", "C", "D", "E"), seed=0)
+    player, target = session.players[0], session.players[1]
+    state = session.state
+    history = HistoryService(validate=False)
+    service = Action_service(history, trusted=True)
+    start = time.perf_counter()
+    for _ in range(actions):
+        snapshot = state.snapshot()
+        service.execute_action(player, ActiveFace.JAB, target)
+        state.restore(snapshot)
+        history.history.popitem()
+    snapshots = time.perf_counter() - start
+
+    stack = UndoStack(history)
+    service = Action_service(history, trusted=True, undo_stack=stack)
+    start = time.perf_counter()
+    for _ in range(actions):
+        service.execute_action(player, ActiveFace.JAB, target)
+        stack.undo()
+    undos = time.perf_counter() - start
+    print(f"take back: snapshot restore {actions / snapshots:,.0f}/s, undo stack {actions / undos:,.0f}/s")
+
+    for label, stack in (("without deltas", None), ("with deltas", UndoStack(limit=64))):
+        service = Action_service(HistoryService(validate=False), trusted=True, undo_stack=stack)
+        start = time.perf_counter()
+        for _ in range(actions):
+            service.execute_action(player, ActiveFace.RECOVER)
+        print(f"execute_action {label}: {actions / (time.perf_counter() - start):,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,2 @@
-from .constants import *
\ No newline at end of file
+from .constants import *
+from .rules import Ruleset, DEFAULT_RULESET
\ No newline at end of file
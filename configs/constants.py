@@ -13,14 +13,25 @@ def _int_env(key: str, default: int) -> int:
 		return int(default)
 
 
+def _seats_env(key: str, seats: int) -> tuple[int, ...]:
+	"""Comma separated seat numbers, e.g. "1,3", invalid or out of range entries are ignored."""
+	val = os.getenv(key) or ""
+	return tuple(sorted({int(part) for part in val.split(",") if part.strip().isdigit() and int(part) < seats}))
+
+
 MAX_ROUNDS: Final[int] = _int_env("MAX_ROUNDS", 12)
 TOTAL_PLAYERS: Final[int] = _int_env("TOTAL_PLAYERS", 5)
+# seats (0 based) the ui hands to the MCTS bot, none by default
+AI_SEATS: Final[tuple[int, ...]] = _seats_env("AI_SEATS", TOTAL_PLAYERS)
 BACK_FIRE_DMG: Final[int] = _int_env("BACK_FIRE_DMG", 3)
 JAB_DMG: Final[int] = _int_env("JAB_DMG", 2)
 PICK_POCKET_VP: Final[int] = _int_env("PICK_POCKET_VP", 1)
 STRIKE_HP: Final[int] = _int_env("STRIKE_HP", 4)
 RECOVER_HP: Final[int] = _int_env("RECOVER_HP", 3)
-POWER_MOVE_HP: Final[int] = _int_env("POWER_MOVE_HP", 5)
+POWER_MOVE_HP: Final[int] = _int_env("POWER_MOVE_HP", 6)
 POWER_MOVE_VP: Final[int] = _int_env("POWER_MOVE_VP", 3)
+FALLEN_HP: Final[int] = _int_env("FALLEN_HP", 2)
+FALLEN_VP: Final[int] = _int_env("FALLEN_VP", 1)
+SURVIVOR_VP: Final[int] = _int_env("SURVIVOR_VP", 1)
 DB_HOST: Final[str] = os.getenv("DB_HOST", "localhost")
 DB_PORT: Final[int] = _int_env("DB_PORT", 5432)
\ No newline at end of file
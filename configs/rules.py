@@ -0,0 +1,39 @@
+from typing import NamedTuple
+from . import constants
+
+
+class Ruleset(NamedTuple):
+    """
+    Every tunable amount of the game rules in one immutable, hashable record.
+    Each field is the lower-case name of its `configs.constants` value, which is also its default;
+    engines that accept a ruleset can be run with any variation of it (e.g. for balance sweeps).
+    """
+    max_rounds: int = constants.MAX_ROUNDS
+    back_fire_dmg: int = constants.BACK_FIRE_DMG
+    jab_dmg: int = constants.JAB_DMG
+    strike_hp: int = constants.STRIKE_HP
+    recover_hp: int = constants.RECOVER_HP
+    pick_pocket_vp: int = constants.PICK_POCKET_VP
+    power_move_hp: int = constants.POWER_MOVE_HP
+    power_move_vp: int = constants.POWER_MOVE_VP
+    fallen_hp: int = constants.FALLEN_HP
+    fallen_vp: int = constants.FALLEN_VP
+    survivor_vp: int = constants.SURVIVOR_VP
+
+    @property
+    def max_vp_amount(self) -> int:
+        """Largest VP amount a single effect of these rules moves, the limit of the validated `Player` VP methods."""
+        return max(self.pick_pocket_vp, self.power_move_vp, self.fallen_vp, self.survivor_vp)
+
+    @property
+    def max_heal_amount(self) -> int:
+        """Largest healing a single effect of these rules applies, the limit of the validated `Player.heal`."""
+        return max(self.recover_hp, self.fallen_hp)
+
+    @classmethod
+    def from_constants(cls) -> "Ruleset":
+        """Builds a ruleset from the current values of `configs.constants` (e.g. after a reload)."""
+        return cls(**{name: getattr(constants, name.upper()) for name in cls._fields})
+
+
+DEFAULT_RULESET = Ruleset()
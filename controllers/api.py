@@ -1,10 +1,19 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
-from models import Player, FallenFace, ActiveFace, Status, active_face_vals, fallen_face_vals 
+from functools import partial
+from typing import TYPE_CHECKING, Iterable
+from models import Player, MutationStatus, FallenFace, ActiveFace, Status
+from models.Effects import effect_table, OTHER_CHOICE, NO_EFFECT, DAMAGE, HEAL, GAIN_VP, STEAL_VP, REDUCE_VP
 from utils import InvalidPlayerActionValidator, GameStateValidator
+from configs import Ruleset, DEFAULT_RULESET
+from services.Undo import Checkpoints, checkpoints, new_delta
 
 if TYPE_CHECKING:
     from services import HistoryService
+    from services.History import EventArgs
+    from services.Undo import UndoStack
+
+# (player, face, target, choice_action) of one action of a batch, see Action_service.execute_actions
+BatchAction = tuple[Player, FallenFace | ActiveFace, Player | None, str | None]
 
 class Action_service:
     """
@@ -12,11 +21,34 @@ class Action_service:
     
     __init__ method parameters:
     - ingame_history_service (HistoryService): An instance of HistoryService to manage game history.
+    - trusted (bool): Trusted mode for engine driven bulk simulation, the player mutations go through the
+      unchecked `Player` primitives and the fallen targeting rules are not re-checked. A mutation a primitive
+      refuses (see `models.MutationStatus`) returns False with a no-effect event. Defaults to False,
+      the validated path for UI and API callers.
+    - rules (Ruleset): The amounts of every effect, compiled once into the dispatch table `effects`
+      (see `models.Effects.effect_table`). Defaults to the configured rules.
+    - undo_stack (UndoStack | None): Receives the inverse delta (`services.Undo.Delta`) of every applied action,
+      so the actions can be undone and redone. None, the default, records no deltas.
 
     """
     ...
-    def __init__(self, ingame_history_service: HistoryService):
+    def __init__(self, ingame_history_service: HistoryService, trusted: bool = False, rules: Ruleset = DEFAULT_RULESET, undo_stack: UndoStack | None = None):
         self.in_game_history_service = ingame_history_service
+        self.trusted = trusted
+        self.undo_stack = undo_stack
+        self.rules = rules
+        self.effects = effect_table(rules)
+        # the player mutations are bound once, so both modes share the one execute_action below
+        if trusted:
+            self.__take_damage, self.__heal = Player.take_damage_unchecked, Player.heal_unchecked
+            self.__gain_vp, self.__steal_vp = Player.gain_vp_unchecked, Player.steal_vp_unchecked
+            self.__reduce_vp = Player.reduce_vp_unchecked
+        else:
+            # the validated primitives accept the amounts of these rules, not only the default ones
+            vp_limit = rules.max_vp_amount
+            self.__take_damage, self.__heal = Player.take_damage, partial(Player.heal, limit=rules.max_heal_amount)
+            self.__gain_vp, self.__steal_vp = partial(Player.gain_vp, limit=vp_limit), partial(Player.steal_vp, limit=vp_limit)
+            self.__reduce_vp = partial(Player.reduce_vp, limit=vp_limit)
 
     def __validate_action(self, player: Player, action: FallenFace | ActiveFace) -> bool:
         """
@@ -44,7 +76,7 @@ class Action_service:
         - `target`: required when the face or chosen option affects another player.
         - `choice_action` (in `kwargs`): when a face offers choices — see below.
 
-        choice_action values by face:
+        choice_action values by face (amounts of the default rules, see `rules`):
         - Active faces:
             - `BACKFIRE`: no `target`; actor takes 3 HP.
             - `RECOVER`: no `target`; actor heals 3 HP.
@@ -55,200 +87,127 @@ class Action_service:
         - Fallen faces:
             - `PLUS2HP_OR_PLUS1VP*`: `'heal_hp'` (target heals 2) or `'gain_vp'` (target gains 1).
             - `REMOVE2HP_OR_MINUS1VP*`: `'damage_hp'` (target takes 2) or `'steal_vp'` (fallen steals 1 VP).
+        The effect is one lookup of (action, choice_action, target given) in the `effects` table.
+
+        With an `undo_stack`, the seats the action touched are checkpointed before and after it and pushed
+        as one `Delta`, a rejected action pushes nothing.
 
         Returns `True` on success. Raises `InvalidPlayerActionValidator` or
         `GameStateValidator` for invalid inputs or missing arguments.
         """
-        
-        choice = kwargs.get("choice_action")
-
-        if isinstance(action, ActiveFace):
-            #  faces that do not require a target
-            if target is None:
-                if action == ActiveFace.BACKFIRE:
-                    player.take_damage(3)
-                    self.in_game_history_service.record_event(
-                        event_id=len(self.in_game_history_service.history) + 1,
-                        rolled_by=player,
-                        dice_face_value=action,
-                        damage_dealt=3
-                    )
-                    return True
-                if action == ActiveFace.RECOVER:
-                    player.heal(3)
-                    self.in_game_history_service.record_event(
-                        event_id=len(self.in_game_history_service.history) + 1,
-                        rolled_by=player,
-                        dice_face_value=action,
-                        healing_done=3
-                    )
-                    return True
-                if action == ActiveFace.POWER_MOVE:
-                    # POWER_MOVE without a target => assume VP gain unless specified otherwise
-                    if choice is None or choice == "gain_vp":
-                        player.gain_vp(3)
-                        self.in_game_history_service.record_event(
-                            event_id=len(self.in_game_history_service.history) + 1,
-                            rolled_by=player,
-                            dice_face_value=action,
-                            vp_gained=3
-                        )
-                        return True
-                    # Explicit damage choice requires a target
-                    if choice == "damage_hp":
-                        raise InvalidPlayerActionValidator("POWER_MOVE with 'damage_hp' requires a target")
-                    raise InvalidPlayerActionValidator("Invalid choice_action provided for POWER_MOVE")
-
-            # Targeted active faces
-            if target is None:
-                raise InvalidPlayerActionValidator("This action requires a target")
-
-            if action == ActiveFace.POWER_MOVE:
-                if choice == "damage_hp":
-                    target.take_damage(6)
-                    # recording players targets
-                    player.last_targetedto = target.name
-                    target.last_targetedby = player.name
-                    self.in_game_history_service.record_event(
-                        event_id=len(self.in_game_history_service.history) + 1,
-                        rolled_by=player,
-                        dice_face_value=action,
-                        damage_dealt=6,
-                        consumer=target
-                    )
-                    return True
-                if choice == "gain_vp":
-                    player.gain_vp(3)
-                    self.in_game_history_service.record_event(
-                        event_id=len(self.in_game_history_service.history) + 1,
-                        rolled_by=player,
-                        dice_face_value=action,
-                        vp_gained=3
-                    )
-                    return True
-                raise InvalidPlayerActionValidator("Invalid choice_action provided for POWER_MOVE")
-            if action == ActiveFace.JAB:
-                target.take_damage(2)
-                player.last_targetedto = target.name
-                target.last_targetedby = player.name
-                self.in_game_history_service.record_event(
-                    event_id=len(self.in_game_history_service.history) + 1,
-                    rolled_by=player,
-                    dice_face_value=action,
-                    damage_dealt=2,
-                    consumer=target
-                )
-                return True
-            if action == ActiveFace.STRIKE:
-                target.take_damage(4)
-                player.last_targetedto = target.name
-                target.last_targetedby = player.name
-                self.in_game_history_service.record_event(
-                    event_id=len(self.in_game_history_service.history) + 1,
-                    rolled_by=player,
-                    dice_face_value=action,
-                    damage_dealt=4,
-                    consumer=target
-                )
-                return True
-            if action == ActiveFace.PICKPOCKET:
-                # Guard against stealing when target has no VP to give.
-                if target.vp < 1:
-                    # No VP to steal — record a no-effect event into history
-                    self.in_game_history_service.record_event(
-                        event_id=len(self.in_game_history_service.history) + 1,
-                        rolled_by=player,
-                        dice_face_value=action,
-                        consumer=target,
-                    )
-                    return False
-                player.steal_vp(target, 1)
-                player.last_targetedto = target.name
-                target.last_targetedby = player.name
-                self.in_game_history_service.record_event(
-                    event_id=len(self.in_game_history_service.history) + 1,
-                    rolled_by=player,
-                    dice_face_value=action,
-                    vp_stolen=1,
-                    consumer=target
-                )
-                return True
-
-        if isinstance(action, FallenFace):
-            # eat 5 star do nothing lol
-            if target is None:
-                # record a no-effect event for fallen player's solo/no-target roll
-                self.in_game_history_service.record_event(
-                    event_id=len(self.in_game_history_service.history) + 1,
-                    rolled_by=player,
-                    dice_face_value=action,
-                )
-                return True
-
-            # Fallen players can only target alive players and cannot target the same player twice
+        history = self.in_game_history_service
+        if self.undo_stack is None:
+            result, event = self.__resolve(player, action, target, kwargs.get("choice_action"))
+            history.record_event(history.next_event_id(), *event)
+            return result
+
+        before = checkpoints(player, target)
+        result, event = self.__resolve(player, action, target, kwargs.get("choice_action"))
+        event_id = history.next_event_id()
+        recorded = history.record_event(event_id, *event) is True
+        self.undo_stack.push(new_delta((player, before, checkpoints(player, target), event_id if recorded else None)))
+        return result
+
+    def record_no_effect(self, player: Player, action: FallenFace | ActiveFace) -> bool:
+        """
+        Records `action` rolled by `player` as an event without effect, for a targeted face rolled while no
+        player is a valid target. Nothing changes; with an `undo_stack` the event is undone and redone like an action.
 
+        :return: False, the face had no effect.
+        """
+        history = self.in_game_history_service
+        event_id = history.next_event_id()
+        recorded = history.record_event(event_id, player, action) is True
+        if self.undo_stack is not None:
+            unchanged = checkpoints(player)
+            self.undo_stack.push(new_delta((player, unchanged, unchanged, event_id if recorded else None)))
+        return False
+
+    def __resolve(self, player: Player, action: FallenFace | ActiveFace, target: Player | None, choice: str | None) -> tuple[bool, EventArgs]:
+        """Applies the effect of the action and returns the `execute_action` result with the event to record."""
+        effect = self.effects.get((action, choice, target is not None))
+        if effect is None:
+            # any other choice_action behaves like an invalid (or, for faces without choices, ignored) one
+            effect = self.effects.get((action, OTHER_CHOICE, target is not None))
+            if effect is None:
+                raise InvalidPlayerActionValidator("Unhandled action or invalid parameters")
+        kind, amount, on_target, _, fallen_rules, error, needs_vp, recorded = effect
+
+        # Fallen players can only target alive players and cannot target the same player twice
+        if fallen_rules and not self.trusted:
             if player.last_targetedto is not None and player.last_targetedto == target.name:
                 raise InvalidPlayerActionValidator("Fallen player cannot affect the same target two rounds in a row")
             if target.status != Status.ALIVE:
                 raise InvalidPlayerActionValidator("Fallen players can only affect alive players")
+        if error is not None:
+            raise InvalidPlayerActionValidator(error)
+
+        if kind == NO_EFFECT:
+            # e.g. a fallen player's solo/no-target roll
+            return True, (player, action, None, None, None, None, None)
+        if needs_vp and target.vp < amount:
+            # No VP to take from the target — record a no-effect event into history
+            return False, (player, action, target, None, None, None, None)
+
+        if kind == DAMAGE:
+            status = self.__take_damage(target if on_target else player, amount)
+        elif kind == HEAL:
+            status = self.__heal(target if on_target else player, amount)
+        elif kind == GAIN_VP:
+            status = self.__gain_vp(target if on_target else player, amount)
+        elif kind == STEAL_VP:
+            status = self.__steal_vp(player, target, amount)
+        elif kind == REDUCE_VP:
+            status = self.__reduce_vp(target, amount)
+        else:
+            raise InvalidPlayerActionValidator("Unhandled action or invalid parameters")
+        if self.trusted and status > MutationStatus.KNOCKED_OUT:
+            # the unchecked primitive changed nothing (fallen or short of VP), recorded like the validated no-effect event
+            return False, (player, action, target, None, None, None, None)
+
+        if on_target:
+            # recording players targets
+            player.last_targetedto = target.name
+            target.last_targetedby = player.name
+            return True, (player, action, target, *recorded)
+        return True, (player, action, None, *recorded)
+
+    def execute_actions(self, actions: Iterable[BatchAction]) -> list[bool | InvalidPlayerActionValidator | GameStateValidator]:
+        """
+        Applies a batch of actions in order, each exactly like `execute_action` would.
+        The events of the whole batch are recorded at once, with ids from the history's monotonic counter,
+        in one write to the history. An invalid action does not abort the batch: its validator exception is
+        put in its slot of the results, no event is recorded for it and the next action is applied.
 
-            if action in (FallenFace.PLUS2HP_OR_PLUS1VP, FallenFace.PLUS2HP_OR_PLUS1VP_2):
-                if choice == "heal_hp":
-                    target.heal(2)
-                    self.in_game_history_service.record_event(
-                        event_id=len(self.in_game_history_service.history) + 1,
-                        rolled_by=player,
-                        dice_face_value=action,
-                        healing_done=2,
-                        consumer=target
-                    )
-                elif choice == "gain_vp":
-                    target.gain_vp(1)
-                    self.in_game_history_service.record_event(
-                        event_id=len(self.in_game_history_service.history) + 1,
-                        rolled_by=player,
-                        dice_face_value=action,
-                        vp_gained=1,
-                        consumer=target
-                    )
-                else:
-                    raise InvalidPlayerActionValidator("Invalid choice_action provided for PLUS2HP_OR_PLUS1VP")
-                player.last_targetedto = target.name
-                target.last_targetedby = player.name
-                return True
-
-            if action in (FallenFace.REMOVE2HP_OR_MINUS1VP, FallenFace.REMOVE2HP_OR_MINUS1VP_2):
-                if choice == "damage_hp":
-                    target.take_damage(2)
-                    self.in_game_history_service.record_event(
-                        event_id=len(self.in_game_history_service.history) + 1,
-                        rolled_by=player,
-                        dice_face_value=action,
-                        damage_dealt=2,
-                        consumer=target
-                    )
-                elif choice == "steal_vp":
-                    if target.vp < 1:
-                        self.in_game_history_service.record_event(
-                            event_id=len(self.in_game_history_service.history) + 1,
-                            rolled_by=player,
-                            dice_face_value=action,
-                            consumer=target,
-                        )
-                        return False
-                    target.reduce_vp(1)
-                    self.in_game_history_service.record_event(
-                        event_id=len(self.in_game_history_service.history) + 1,
-                        rolled_by=player,
-                        dice_face_value=action,
-                        vp_stolen=1,
-                        consumer=target
-                    )
+        :param actions: (player, face, target, choice_action) per action, target and choice_action may be None.
+        :return: One result per action, in order: the `execute_action` return value, or the exception it raised.
+        """
+        results: list[bool | InvalidPlayerActionValidator | GameStateValidator] = []
+        events: list[EventArgs] = []
+        # (player, before, after) of every applied action when deltas are recorded
+        changes: list[tuple[Player, Checkpoints, Checkpoints]] | None = None if self.undo_stack is None else []
+        resolve = self.__resolve
+        for player, action, target, choice in actions:
+            try:
+                if changes is None:
+                    result, event = resolve(player, action, target, choice)
                 else:
-                    raise InvalidPlayerActionValidator("Invalid choice_action provided for REMOVE2HP_OR_MINUS1VP")
-                player.last_targetedto = target.name
-                target.last_targetedby = player.name
-                return True
-
-        # If we fall through, action was not handled
-        raise InvalidPlayerActionValidator("Unhandled action or invalid parameters")
\ No newline at end of file
+                    before = checkpoints(player, target)
+                    result, event = resolve(player, action, target, choice)
+                    changes.append((player, before, checkpoints(player, target)))
+            except (InvalidPlayerActionValidator, GameStateValidator) as error:
+                results.append(error)
+                continue
+            results.append(result)
+            events.append(event)
+
+        history = self.in_game_history_service
+        ids = history.record_events(events)
+        if changes:
+            # the batch took consecutive ids, the ones missing from `ids` were rejected by the history
+            recorded = set(ids)
+            first = history.last_event_id - len(events) + 1
+            push = self.undo_stack.push
+            for event_id, (player, before, after) in enumerate(changes, start=first):
+                push(new_delta((player, before, after, event_id if event_id in recorded else None)))
+        return results
@@ -0,0 +1,312 @@
+"""
+Vectorized lockstep engine: plays thousands of games at once with NumPy.
+Every game of a batch resolves the same seat on the same turn, so one turn is a handful of
+array operations over the whole batch instead of one `Action_service.execute_action` call per game.
+
+NumPy is an optional dependency, install it with `pip install do-or-dice[sim]`.
+"""
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError("The batch simulator needs NumPy, install it with `pip install do-or-dice[sim]`.") from exc
+
+from models import ActiveFace, FallenFace, active_face_vals, fallen_face_vals
+from models.GameState import MAX_HP, OPTION_HP, OPTION_VP
+from models.Standings import seat_ranks
+from configs import TOTAL_PLAYERS, Ruleset, DEFAULT_RULESET
+
+_ACTIVE_ROLL = {face: roll for roll, face in active_face_vals.items()}
+BACKFIRE = _ACTIVE_ROLL[ActiveFace.BACKFIRE]
+POWER_MOVE = _ACTIVE_ROLL[ActiveFace.POWER_MOVE]
+RECOVER = _ACTIVE_ROLL[ActiveFace.RECOVER]
+JAB = _ACTIVE_ROLL[ActiveFace.JAB]
+STRIKE = _ACTIVE_ROLL[ActiveFace.STRIKE]
+PICKPOCKET = _ACTIVE_ROLL[ActiveFace.PICKPOCKET]
+# the *_2 fallen faces are enum aliases of the first ones, so match the faces rather than their names
+BLESS_ROLLS = np.array([roll for roll, face in fallen_face_vals.items() if face is FallenFace.PLUS2HP_OR_PLUS1VP])
+CURSE_ROLLS = np.array([roll for roll, face in fallen_face_vals.items() if face is FallenFace.REMOVE2HP_OR_MINUS1VP])
+
+
+class BatchState:
+    """
+    State of a batch of games as `(games, players)` arrays.
+
+    Attributes:
+        hp (ndarray[int16]): Health points.
+        vp (ndarray[int32]): Victory points.
+        alive (ndarray[bool]): True while the player is alive (Status.ALIVE).
+        targeted_to (ndarray[int8]): Seat last affected by each player this round, -1 for none.
+        targeted_by (ndarray[int8]): Seat that last affected each player this round, -1 for none.
+        running (ndarray[bool]): Per game, False once the game is over.
+        rounds_played (ndarray[int16]): Per game, number of rounds resolved.
+    """
+
+    __slots__ = ("hp", "vp", "alive", "targeted_to", "targeted_by", "running", "rounds_played")
+
+    def __init__(self, games: int, players: int = TOTAL_PLAYERS) -> None:
+        self.hp = np.full((games, players), MAX_HP, dtype=np.int16)
+        self.vp = np.zeros((games, players), dtype=np.int32)
+        self.alive = np.ones((games, players), dtype=bool)
+        self.targeted_to = np.full((games, players), -1, dtype=np.int8)
+        self.targeted_by = np.full((games, players), -1, dtype=np.int8)
+        self.running = np.ones(games, dtype=bool)
+        self.rounds_played = np.zeros(games, dtype=np.int16)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.hp.shape
+
+
+class VectorPolicy(ABC):
+    """
+    Base class of batch policies, the vectorized counterpart of `services.Policy.DecisionPolicy`.
+    Sub classes implement both abstract choose methods.
+    """
+
+    @abstractmethod
+    def choose_targets(self, state: BatchState, seat: int, rolls: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """
+        Picks one target per game.
+
+        :param state: The batch state.
+        :param seat: The seat whose turn it is.
+        :param rolls: The dice value rolled in every game, shape (games,).
+        :param candidates: Valid targets per game, bool array of shape (games, players).
+        :return: int array of shape (games,) holding a candidate seat, or -1 where a game has no candidate.
+        """
+        ...
+
+    @abstractmethod
+    def choose_options(self, state: BatchState, seat: int, rolls: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Picks OPTION_HP or OPTION_VP per game for POWER_MOVE and the fallen buff/curse faces.
+
+        :return: int array of shape (games,).
+        """
+        ...
+
+
+class RandomVectorPolicy(VectorPolicy):
+    """
+    Uniformly random targets and options for every game of the batch.
+
+    __init__ method parameters:
+    - rng (np.random.Generator): The generator the choices are drawn from.
+    """
+
+    def __init__(self, rng: np.random.Generator) -> None:
+        self.rng = rng
+
+    def choose_targets(self, state: BatchState, seat: int, rolls: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        return pick_targets(self.rng.random(candidates.shape), candidates)
+
+    def choose_options(self, state: BatchState, seat: int, rolls: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        return self.rng.integers(0, 2, size=rolls.shape[0], dtype=np.int8)
+
+
+def pick_targets(scores: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Picks the candidate with the highest score in every game, -1 for games without candidate.
+
+    :param scores: float array of shape (games, players), higher is preferred.
+    :param candidates: bool array of shape (games, players).
+    :return: int array of shape (games,).
+    """
+    masked = np.where(candidates, scores, -np.inf)
+    targets = masked.argmax(axis=1)
+    return np.where(candidates.any(axis=1), targets, -1)
+
+
+@dataclass
+class BatchResult:
+    """
+    Final standings of every game of a batch, arrays of shape (games, players) unless noted.
+    Ranks follow `IngameRankService` (see `models.Standings.standing_key`): vp desc, then hp desc, then name.
+    A win is shared between the seats tied for first place on (vp, hp), see `win_shares`, so the name
+    tie-break of the ranks never biases the win rates towards some seats.
+    """
+    hp: np.ndarray
+    vp: np.ndarray
+    alive: np.ndarray
+    rank: np.ndarray
+    rounds_played: np.ndarray  # shape (games,)
+
+    @property
+    def win_shares(self) -> np.ndarray:
+        """Share of the win of every seat: 1 / k for each of the k seats tied for first place, 0 for the others."""
+        top_vp = self.vp.max(axis=1, keepdims=True)
+        top_hp = np.where(self.vp == top_vp, self.hp, -1).max(axis=1, keepdims=True)
+        first = (self.vp == top_vp) & (self.hp == top_hp)
+        return first / first.sum(axis=1, keepdims=True)
+
+    @property
+    def win_rates(self) -> np.ndarray:
+        return self.win_shares.mean(axis=0)
+
+
+class BatchSimulator:
+    """
+    Docstring for BatchSimulator
+    Plays a batch of games in lockstep. The rules mirror `Action_service.execute_action` and
+    `TurnResolverService.play_turn` exactly, so identical rolls and choices give identical outcomes.
+
+    __init__ method parameters:
+    - games (int): Number of games in the batch.
+    - players (int): Number of seats per game, defaults to TOTAL_PLAYERS.
+    - rules (Ruleset): The amounts of every effect, defaults to the configured rules.
+    - names (Sequence[str] | None): Player name per seat, they break the rank ties. Defaults to P1..P{players}
+      like `HeadlessGameController`.
+    """
+
+    def __init__(self, games: int, players: int = TOTAL_PLAYERS, rules: Ruleset = DEFAULT_RULESET, names: Sequence[str] | None = None) -> None:
+        self.rules = rules
+        self.state = BatchState(games, players)
+        self.names = tuple(names) if names is not None else tuple(f"P{seat}" for seat in range(1, players + 1))
+        if len(self.names) != players:
+            raise ValueError(f"Expected {players} names, got {len(self.names)}")
+        self._rows = np.arange(games)
+        self._seats = np.arange(players)
+        # the rank of every seat when vp and hp are equal, i.e. its place in the name tie-break of `standing_key`
+        zeros = [0] * players
+        self._tiebreak = np.array(seat_ranks(zeros, zeros, self.names))
+
+    def candidates(self, seat: int) -> np.ndarray:
+        """
+        Valid targets of `seat` in every running game: alive opponents while the seat is alive,
+        alive players other than its last target once it has fallen.
+
+        :return: bool array of shape (games, players).
+        """
+        state = self.state
+        alive = state.alive
+        opponents = alive & (self._seats != seat)
+        haunted = alive & (self._seats != state.targeted_to[:, seat, None])
+        return np.where(alive[:, seat, None], opponents, haunted) & state.running[:, None]
+
+    def __damage(self, rows: np.ndarray, seats: np.ndarray, amount: int) -> None:
+        """Player.take_damage for many games at once, players reaching 0 hp fall."""
+        hp = self.state.hp
+        hp[rows, seats] -= amount
+        fallen = hp[rows, seats] <= 0
+        rows, seats = rows[fallen], seats[fallen]
+        hp[rows, seats] = 0
+        self.state.alive[rows, seats] = False
+
+    def __heal(self, rows: np.ndarray, seats: np.ndarray, amount: int) -> None:
+        hp = self.state.hp
+        hp[rows, seats] = np.minimum(hp[rows, seats] + amount, MAX_HP)
+
+    def __mark(self, rows: np.ndarray, seat: int, targets: np.ndarray) -> None:
+        self.state.targeted_to[rows, seat] = targets
+        self.state.targeted_by[rows, targets] = seat
+
+    def step(self, seat: int, rolls: np.ndarray, policy: VectorPolicy | None = None, targets: np.ndarray | None = None, options: np.ndarray | None = None) -> None:
+        """
+        Resolves the turn of `seat` in every running game.
+
+        :param seat: The seat whose turn it is.
+        :param rolls: The dice value (1-6) rolled in every game, shape (games,).
+        :param policy: Policy asked for the `targets` / `options` that are not given.
+        :param targets: Target seat per game (-1 for none), must be valid candidates.
+        :param options: OPTION_HP or OPTION_VP per game.
+        """
+        state, rules, rows = self.state, self.rules, self._rows
+        if targets is None:
+            targets = policy.choose_targets(state, seat, rolls, self.candidates(seat))
+        if options is None:
+            options = policy.choose_options(state, seat, rolls, targets)
+
+        running = state.running
+        actor_alive = state.alive[:, seat] & running
+        actor_fallen = ~state.alive[:, seat] & running
+        has_target = targets >= 0
+        seat_col = np.full(rows.shape[0], seat)
+
+        # --- active faces ---
+        hit = actor_alive & (rolls == BACKFIRE)
+        self.__damage(rows[hit], seat_col[hit], rules.back_fire_dmg)
+
+        hit = actor_alive & (rolls == RECOVER)
+        self.__heal(rows[hit], seat_col[hit], rules.recover_hp)
+
+        power_move = actor_alive & (rolls == POWER_MOVE)
+        hit = power_move & (options == OPTION_HP) & has_target
+        self.__damage(rows[hit], targets[hit], rules.power_move_hp)
+        self.__mark(rows[hit], seat, targets[hit])
+        state.vp[power_move & ~hit, seat] += rules.power_move_vp
+
+        for roll, amount in ((JAB, rules.jab_dmg), (STRIKE, rules.strike_hp)):
+            hit = actor_alive & (rolls == roll) & has_target
+            self.__damage(rows[hit], targets[hit], amount)
+            self.__mark(rows[hit], seat, targets[hit])
+
+        hit = actor_alive & (rolls == PICKPOCKET) & has_target
+        hit_rows, hit_targets = rows[hit], targets[hit]
+        enough = state.vp[hit_rows, hit_targets] >= rules.pick_pocket_vp
+        hit_rows, hit_targets = hit_rows[enough], hit_targets[enough]
+        state.vp[hit_rows, hit_targets] -= rules.pick_pocket_vp
+        state.vp[hit_rows, seat] += rules.pick_pocket_vp
+        self.__mark(hit_rows, seat, hit_targets)
+
+        # --- fallen faces ---
+        haunting = actor_fallen & has_target
+        bless = haunting & np.isin(rolls, BLESS_ROLLS)
+        curse = haunting & np.isin(rolls, CURSE_ROLLS)
+
+        hit = bless & (options == OPTION_HP)
+        self.__heal(rows[hit], targets[hit], rules.fallen_hp)
+        hit = bless & (options == OPTION_VP)
+        state.vp[rows[hit], targets[hit]] += rules.fallen_vp
+        self.__mark(rows[bless], seat, targets[bless])
+
+        hit = curse & (options == OPTION_HP)
+        self.__damage(rows[hit], targets[hit], rules.fallen_hp)
+        self.__mark(rows[hit], seat, targets[hit])
+        hit = curse & (options == OPTION_VP)
+        hit_rows, hit_targets = rows[hit], targets[hit]
+        enough = state.vp[hit_rows, hit_targets] >= rules.fallen_vp
+        hit_rows, hit_targets = hit_rows[enough], hit_targets[enough]
+        state.vp[hit_rows, hit_targets] -= rules.fallen_vp
+        self.__mark(hit_rows, seat, hit_targets)
+
+    def end_round(self) -> None:
+        """Rewards the survivors, clears the targeting of the round and stops finished games."""
+        state = self.state
+        running = state.running
+        state.vp[running[:, None] & state.alive] += self.rules.survivor_vp
+        state.targeted_to[running] = -1
+        state.targeted_by[running] = -1
+        state.rounds_played[running] += 1
+        state.running &= (state.alive.sum(axis=1) > 1) & (state.rounds_played < self.rules.max_rounds)
+
+    def play(self, seed: int, policy: VectorPolicy | None = None) -> BatchResult:
+        """
+        Plays every game of the batch to the end.
+
+        :param seed: Seed of the dice and of the default random policy.
+        :param policy: The policy of every seat, defaults to `RandomVectorPolicy`.
+        :return: The final standings.
+        """
+        dice_seq, policy_seq = np.random.SeedSequence(seed).spawn(2)
+        dice = np.random.default_rng(dice_seq)
+        policy = policy or RandomVectorPolicy(np.random.default_rng(policy_seq))
+        games, players = self.state.shape
+
+        while self.state.running.any():
+            for seat in range(players):
+                self.step(seat, dice.integers(1, 7, size=games, dtype=np.int8), policy)
+            self.end_round()
+        return self.result()
+
+    def result(self) -> BatchResult:
+        """Ranks the current state of every game."""
+        state = self.state
+        order = np.lexsort((np.broadcast_to(self._tiebreak, state.hp.shape), -state.hp, -state.vp), axis=-1)
+        rank = np.empty_like(order)
+        np.put_along_axis(rank, order, self._seats + 1, axis=1)
+        return BatchResult(state.hp.copy(), state.vp.copy(), state.alive.copy(), rank, state.rounds_played.copy())
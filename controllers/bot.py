@@ -0,0 +1,256 @@
+"""
+Monte Carlo tree search bot for AI seats.
+The bot decides a rolled face (target and POWER_MOVE / fallen option) by playing random games to the end
+from clones of the current `GameState`, it never touches the real players, history or dice engine.
+"""
+from __future__ import annotations
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Sequence
+import math
+import multiprocessing
+import random
+import time
+
+from helpers import derive_seed
+from models import Player, GameState, ActiveFace, FallenFace, active_face_vals, fallen_face_vals
+from models.GameState import Move, Snapshot, OPTION_HP
+from services.Policy import DecisionPolicy
+from configs import Ruleset, DEFAULT_RULESET
+
+# per move search budget of AI seats in seconds
+DEFAULT_BUDGET = 0.05
+EXPLORATION = math.sqrt(2)
+
+_ROLL_OF = {face: roll for roll, face in active_face_vals.items()} | {face: roll for roll, face in fallen_face_vals.items()}
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """
+    Outcome of one search.
+    :param move: The chosen (target seat, option), target -1 when no other player is affected.
+    :param rollouts: Number of random games played.
+    :param elapsed: Wall time of the search in seconds.
+    :param stats: (move, visits, mean score) of every legal move.
+    """
+    move: Move
+    rollouts: int
+    elapsed: float
+    stats: tuple[tuple[Move, int, float], ...]
+
+    @property
+    def rollouts_per_second(self) -> float:
+        return self.rollouts / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def rollout(state: GameState, rng: random.Random, rules: Ruleset = DEFAULT_RULESET) -> list[int]:
+    """
+    Plays `state` to the end in place with random dice and random decisions, drawn like `RandomPolicy` does.
+
+    :return: The final rank of every seat.
+    """
+    rand = rng.random
+    seats = len(state.names)
+    while not state.is_over(rules):
+        seat = state.turn
+        roll = int(rand() * 6) + 1
+        moves = state.moves(seat, roll)
+        if len(moves) == 1:
+            move = moves[0]
+        elif moves[0][0] < 0:
+            # POWER_MOVE: gain vp or damage, then a random target
+            move = moves[0] if rand() < 0.5 else moves[1 + int(rand() * (len(moves) - 1))]
+        else:
+            move = moves[int(rand() * len(moves))]
+        state.apply(seat, roll, move, rules)
+        state.turn += 1
+        if state.turn >= seats:
+            state.end_round(rules)
+    return state.ranks()
+
+
+def search(
+    snapshot: Snapshot,
+    seat: int,
+    roll: int,
+    budget: float = DEFAULT_BUDGET,
+    rules: Ruleset = DEFAULT_RULESET,
+    seed: int | None = None,
+    max_rollouts: int | None = None,
+    exploration: float = EXPLORATION,
+) -> SearchResult:
+    """
+    Flat Monte Carlo tree search: the legal moves of the rolled face are the children of the root,
+    picked with UCB1 and scored by random playouts to the end of the game. The opponents' dice make every
+    deeper node a chance node, so the statistics are only kept at the root.
+    Module level function taking a snapshot so it can run in a worker process.
+
+    :param snapshot: `GameState.snapshot()` of the position, `turn` must be `seat`.
+    :param seat: The seat to decide for.
+    :param roll: The dice value `seat` rolled.
+    :param budget: Search time in seconds.
+    :param rules: The rules to play the rollouts with.
+    :param seed: Seed of the rollouts, drawn from the OS when None.
+    :param max_rollouts: Stops earlier after that many rollouts (for reproducible searches).
+    :param exploration: The UCB1 exploration constant.
+    :return: The chosen move and the search statistics.
+    """
+    start = time.perf_counter()
+    deadline = start + budget
+    root = GameState.from_snapshot(snapshot)
+    moves = root.moves(seat, roll)
+    rng = random.Random(seed)
+    seats = len(root.names)
+    visits = [0] * len(moves)
+    totals = [0.0] * len(moves)
+
+    rollouts = 0
+    if len(moves) > 1:
+        while max_rollouts is None or rollouts < max_rollouts:
+            if rollouts >= len(moves):
+                log_n = math.log(rollouts)
+                child = max(
+                    range(len(moves)),
+                    key=lambda i: totals[i] / visits[i] + exploration * math.sqrt(log_n / visits[i]),
+                )
+            else:
+                child = rollouts
+            state = root.clone()
+            state.apply(seat, roll, moves[child], rules)
+            state.advance(rules)
+            rank = rollout(state, rng, rules)[seat]
+            visits[child] += 1
+            totals[child] += (seats - rank) / (seats - 1)
+            rollouts += 1
+            # the clock is only read every few rollouts, it costs about as much as a turn
+            if rollouts & 7 == 0 and time.perf_counter() >= deadline:
+                break
+
+    best = max(range(len(moves)), key=lambda i: (visits[i], totals[i]))
+    return SearchResult(
+        move=moves[best],
+        rollouts=rollouts,
+        elapsed=time.perf_counter() - start,
+        stats=tuple((m, v, t / v if v else 0.0) for m, v, t in zip(moves, visits, totals)),
+    )
+
+
+class BotWorker:
+    """
+    Docstring for BotWorker
+    Runs searches off the caller's thread so a render loop can keep drawing while an AI seat thinks:
+    `submit` starts a search, `poll` is called every frame and returns the result once it is ready.
+    Searches run in a single worker process by default, because a search thread would compete with the
+    render loop for the GIL.
+
+    __init__ method parameters:
+    - budget (float): Search time per move in seconds, defaults to DEFAULT_BUDGET.
+    - rules (Ruleset): The rules the rollouts are played with.
+    - use_processes (bool): False runs the searches on a worker thread instead.
+    """
+
+    def __init__(self, budget: float = DEFAULT_BUDGET, rules: Ruleset = DEFAULT_RULESET, use_processes: bool = True) -> None:
+        self.budget = budget
+        self.rules = rules
+        # spawn: never fork a process that already initialised SDL
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            if use_processes else ThreadPoolExecutor(max_workers=1)
+        )
+        self._future: Future[SearchResult] | None = None
+        self.last_result: SearchResult | None = None
+        if use_processes:
+            # start the worker now rather than on the first AI move
+            self._executor.submit(int)
+
+    @property
+    def busy(self) -> bool:
+        return self._future is not None
+
+    @property
+    def rollouts_per_second(self) -> float:
+        """Rollouts per second of the last finished search."""
+        return self.last_result.rollouts_per_second if self.last_result else 0.0
+
+    def submit(self, state: GameState, seat: int, roll: int, seed: int | None = None) -> None:
+        """Starts searching the move of `seat` for `roll`, the state is snapshotted so it may change meanwhile."""
+        if self._future is not None:
+            raise RuntimeError("A search is already running")
+        self._future = self._executor.submit(search, state.snapshot(), seat, roll, self.budget, self.rules, seed)
+
+    def poll(self) -> SearchResult | None:
+        """Returns the result of the running search once it is done, None while it is still running."""
+        if self._future is None or not self._future.done():
+            return None
+        future, self._future = self._future, None
+        self.last_result = future.result()
+        return self.last_result
+
+    def cancel(self) -> None:
+        """Forgets the running search, its result is discarded."""
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    def shutdown(self) -> None:
+        """Stops the worker, waits at most for the running search."""
+        self.cancel()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class MCTSPolicy(DecisionPolicy):
+    """
+    Decision policy searching every decision with `search`, so bots can play headless games and tournaments.
+    The state of the turn is read from the `GameState` the players are bound to, one search covers
+    all the decisions of a turn (e.g. POWER_MOVE option and target).
+
+    __init__ method parameters:
+    - budget (float): Search time per move in seconds.
+    - max_rollouts (int | None): Rollouts per move, makes the policy reproducible when set.
+    - rules (Ruleset): The rules the rollouts are played with.
+    """
+
+    def __init__(self, budget: float = DEFAULT_BUDGET, max_rollouts: int | None = None, rules: Ruleset = DEFAULT_RULESET) -> None:
+        self.budget = budget
+        self.max_rollouts = max_rollouts
+        self.rules = rules
+        self._seed = 0
+        self._searches = 0
+        # (player, face, round, turn) -> move of the last search, shared by the decisions of that turn only
+        self._decided: tuple[tuple[Player, ActiveFace | FallenFace, int, int], Move] | None = None
+
+    def reset(self, seed: int) -> None:
+        self._seed = seed
+        self._searches = 0
+        self._decided = None
+
+    def __decide(self, player: Player, face: ActiveFace | FallenFace) -> Move:
+        key = (player, face, player.state.round, player.state.turn)
+        if self._decided is not None and self._decided[0] == key:
+            return self._decided[1]
+        state = player.state.clone()
+        state.turn = player.seat
+        self._searches += 1
+        result = search(
+            state.snapshot(), player.seat, _ROLL_OF[face], self.budget, self.rules,
+            derive_seed(self._seed, "mcts", self._searches), self.max_rollouts,
+        )
+        self._decided = (key, result.move)
+        return result.move
+
+    def __seat_player(self, candidates: Sequence[Player], seat: int) -> Player:
+        return next((p for p in candidates if p.seat == seat), candidates[0])
+
+    def choose_target(self, player: Player, face: ActiveFace | FallenFace, candidates: Sequence[Player]) -> Player:
+        return self.__seat_player(candidates, self.__decide(player, face)[0])
+
+    def choose_power_move(self, player: Player, candidates: Sequence[Player]) -> str:
+        target, option = self.__decide(player, ActiveFace.POWER_MOVE)
+        return "damage_hp" if target >= 0 and option == OPTION_HP else "gain_vp"
+
+    def choose_fallen_option(self, player: Player, face: FallenFace, target: Player) -> str:
+        option = self.__decide(player, face)[1]
+        if face is FallenFace.PLUS2HP_OR_PLUS1VP:
+            return "heal_hp" if option == OPTION_HP else "gain_vp"
+        return "damage_hp" if option == OPTION_HP else "steal_vp"
@@ -0,0 +1,165 @@
+"""
+Sequential A/B evaluation of two decision policies with early stopping.
+Games are played in paired batches through `HeadlessGameController`: both games of a pair share the seed
+and the seat of the evaluated player, one with policy A on that seat and one with policy B, the other
+seats always play B. Every seat has its own policy instance reset with its own stream, derived from
+(master seed, pair, seat label), so the opponents draw the same decisions in both games of a pair.
+The paired win difference is tracked online and the evaluation stops at the first
+look where its confidence interval excludes 0, or fits inside the negligible margin.
+"""
+from __future__ import annotations
+from copy import deepcopy
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Sequence
+import math
+import time
+
+from services.Policy import DecisionPolicy
+from helpers import derive_seed
+from configs import MAX_ROUNDS, TOTAL_PLAYERS
+from .simulator import HeadlessGameController
+from .tournament import game_seed
+
+A_BETTER = "A"
+B_BETTER = "B"
+EQUIVALENT = "equivalent"
+INCONCLUSIVE = "inconclusive"
+
+
+@dataclass
+class PairedStats:
+    """
+    Online (Welford) mean and variance of the paired win differences.
+    :param pairs: Number of pairs played.
+    :param wins_a: Games won by the evaluated seat playing A.
+    :param wins_b: Games won by the evaluated seat playing B.
+    """
+    pairs: int = 0
+    wins_a: int = 0
+    wins_b: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, won_a: bool, won_b: bool) -> None:
+        self.pairs += 1
+        self.wins_a += won_a
+        self.wins_b += won_b
+        delta = (won_a - won_b) - self.mean
+        self.mean += delta / self.pairs
+        self.m2 += delta * ((won_a - won_b) - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.pairs - 1) if self.pairs > 1 else 0.0
+
+    def interval(self, z: float) -> tuple[float, float]:
+        """Normal confidence interval of the mean difference for the critical value `z`."""
+        half = z * math.sqrt(self.variance / self.pairs) if self.pairs else math.inf
+        return self.mean - half, self.mean + half
+
+
+@dataclass(frozen=True)
+class EvaluationResult:
+    """
+    Outcome of a sequential evaluation.
+    :param verdict: A_BETTER, B_BETTER, EQUIVALENT or INCONCLUSIVE (budget exhausted).
+    :param games: Number of games played, two per pair.
+    :param looks: Number of interim analyses made.
+    :param win_rate_a: Win rate of the evaluated seat playing A.
+    :param win_rate_b: Win rate of the evaluated seat playing B.
+    :param difference: Mean paired win difference, A minus B.
+    :param ci: Confidence interval of the difference at the last look.
+    :param wall_time: Seconds spent.
+    """
+    verdict: str
+    games: int
+    looks: int
+    win_rate_a: float
+    win_rate_b: float
+    difference: float
+    ci: tuple[float, float]
+    wall_time: float
+
+    @property
+    def ci_width(self) -> float:
+        return self.ci[1] - self.ci[0]
+
+
+def _lineup(policy: DecisionPolicy, field: DecisionPolicy, seat: int, seats: int) -> list[DecisionPolicy]:
+    # a copy per opponent seat, so no seat draws from the stream of another one
+    return [policy if s == seat else deepcopy(field) for s in range(seats)]
+
+
+def _policy_seeds(master_seed: int, pair: int, seat: int, seats: int) -> list[int]:
+    """Policy seed of every seat in both games of `pair`: the evaluated seat and each opponent seat get their own stream."""
+    return [derive_seed(master_seed, "evaluate", pair, "evaluated" if s == seat else f"opponent-{s}") for s in range(seats)]
+
+
+def evaluate(
+    policy_a: DecisionPolicy,
+    policy_b: DecisionPolicy,
+    master_seed: int = 0,
+    alpha: float = 0.05,
+    margin: float = 0.02,
+    batch_pairs: int = 200,
+    max_pairs: int = 20_000,
+    player_names: Sequence[str] | None = None,
+    max_rounds: int = MAX_ROUNDS,
+) -> EvaluationResult:
+    """
+    Plays A against B until the win rate difference is significant, negligible, or `max_pairs` is reached.
+    Every look uses the critical value of alpha / (2 * number of possible looks) (Bonferroni), so the
+    overall error rate stays below `alpha` whichever look stops the evaluation.
+    The evaluated seat rotates over all seats, so seat advantages cancel out.
+
+    :param policy_a: The policy evaluated.
+    :param policy_b: The reference policy, also played by every other seat.
+    :param master_seed: Seed every game seed (see `tournament.game_seed`) and policy seed is derived from.
+    :param alpha: Overall probability of a wrong A_BETTER / B_BETTER verdict.
+    :param margin: Differences within +-margin are considered negligible.
+    :param batch_pairs: Pairs played between two looks.
+    :param max_pairs: Pairs played at most.
+    :param player_names: Names of the players, see `HeadlessGameController`.
+    :param max_rounds: Number of rounds of a full game.
+    :return: The verdict with games played, confidence interval and wall time.
+    """
+    start = time.perf_counter()
+    seats = len(player_names) if player_names is not None else TOTAL_PLAYERS
+    max_looks = math.ceil(max_pairs / batch_pairs)
+    z = NormalDist().inv_cdf(1 - alpha / (2 * max_looks))
+    games_a = [HeadlessGameController(_lineup(policy_a, policy_b, s, seats), player_names, max_rounds) for s in range(seats)]
+    games_b = [HeadlessGameController(_lineup(policy_b, policy_b, s, seats), player_names, max_rounds) for s in range(seats)]
+
+    stats = PairedStats()
+    verdict, looks, ci = INCONCLUSIVE, 0, (-math.inf, math.inf)
+    while stats.pairs < max_pairs:
+        for pair in range(stats.pairs, min(stats.pairs + batch_pairs, max_pairs)):
+            seat, seed = pair % seats, game_seed(master_seed, pair)
+            policy_seeds = _policy_seeds(master_seed, pair, seat, seats)
+            won_a = games_a[seat].play(seed, policy_seeds).seats[seat].rank == 1
+            won_b = games_b[seat].play(seed, policy_seeds).seats[seat].rank == 1
+            stats.add(won_a, won_b)
+
+        looks += 1
+        ci = stats.interval(z)
+        if ci[0] > 0:
+            verdict = A_BETTER
+        elif ci[1] < 0:
+            verdict = B_BETTER
+        elif -margin < ci[0] and ci[1] < margin:
+            verdict = EQUIVALENT
+        else:
+            continue
+        break
+
+    return EvaluationResult(
+        verdict=verdict,
+        games=2 * stats.pairs,
+        looks=looks,
+        win_rate_a=stats.wins_a / stats.pairs if stats.pairs else 0.0,
+        win_rate_b=stats.wins_b / stats.pairs if stats.pairs else 0.0,
+        difference=stats.mean,
+        ci=ci,
+        wall_time=time.perf_counter() - start,
+    )
@@ -25,6 +25,8 @@ class GameController:
         self.ingame_action_service : Action_service = ingame_action_service
         self.ingame_player_model : Player = ingame_player_model
         self.ingame_ranking_service : IngameRankService = ingame_ranking_service
+        # per controller, so two controllers never share a round counter
+        self.CURRENT_ROUND : int = 0
 
     @property
     def get_participants(self) -> list[Player]:
@@ -0,0 +1,114 @@
+from __future__ import annotations
+from typing import Sequence
+
+from models import Player, GameState, PlayerRoster
+from helpers import RandomEngine, DiceEngine
+from helpers.randomizer import SEAT_STREAM
+from services import HistoryService, TurnResolverService, IngameRankService, UndoStack
+from services.Policy import DecisionPolicy
+from utils import GameStateValidator
+from .api import Action_service
+from configs import MAX_ROUNDS
+
+
+class GameSession:
+    """
+    Docstring for GameSession
+    One isolated game: the session owns its players, dice engine, history, services, ranks and round counter,
+    and never reads or writes the class level defaults (`Player.player_arrangement`, `IngameRankService.ranks`,
+    `TurnResolverService.participants`), so any number of sessions can run side by side in one process.
+
+    __init__ method parameters:
+    - player_names (Sequence[str]): Players to join and start the game with, empty to join them later.
+    - seed (int | None): Seed of the dice and of the seat order, drawn from the OS when None.
+    - max_rounds (int): Number of rounds of a full game, defaults to MAX_ROUNDS.
+    - trusted (bool): Resolve the actions in the trusted mode of `Action_service` and record the history unvalidated
+      in a `ColumnarEventLog` without index or totals (`HistoryService.indexed`), for engine driven simulations.
+      Defaults to False.
+    - undoable (bool): Keep an `UndoStack` of the actions of the current round in `undo_stack`, for front ends
+      offering to take moves back. Defaults to False, `undo_stack` is then None.
+
+    """
+
+    def __init__(self, player_names: Sequence[str] = (), seed: int | None = None, max_rounds: int = MAX_ROUNDS, trusted: bool = False, undoable: bool = False) -> None:
+        self.engine: DiceEngine = RandomEngine(seed)
+        self.max_rounds = max_rounds
+        self.players = PlayerRoster()
+        self.history = HistoryService(validate=not trusted, columnar=trusted, indexed=not trusted)
+        self.undo_stack = UndoStack(self.history) if undoable else None
+        self.action_service = Action_service(self.history, trusted=trusted, undo_stack=self.undo_stack)
+        self.turn_resolver = TurnResolverService(self.action_service)
+        self.ranking = IngameRankService(self.players)
+        self.round = 0
+        self.started = False
+
+        for name in player_names:
+            self.join(name)
+        if player_names:
+            self.start()
+
+    @property
+    def seed(self) -> int:
+        return self.engine.seed
+
+    @property
+    def state(self) -> GameState:
+        """The state the session's players are views over, available once the session started."""
+        if self.turn_resolver.state is None or not self.started:
+            raise GameStateValidator("The session has not started yet")
+        return self.turn_resolver.state
+
+    def join(self, name: str, **player_kwargs) -> Player:
+        """
+        Adds a player to the session, before it starts.
+
+        :param name: Name of the player.
+        :param player_kwargs: Other `Player` arguments (hp, vp, avatar, ...).
+        :return: The new player.
+        """
+        if self.started:
+            raise GameStateValidator("Players cannot join a session that already started")
+        return Player(name, session=self, **player_kwargs)
+
+    def start(self) -> None:
+        """Shuffles the seat order, binds the players to one `GameState` and builds the initial ranks."""
+        if self.started:
+            raise GameStateValidator("The session already started")
+        if len(self.players) < 2:
+            raise GameStateValidator("A game needs at least 2 players")
+        self.engine.spawn(SEAT_STREAM).shuffle(self.players)
+        self.turn_resolver.set_participants(self.players)
+        self.ranking.initiate_ranks()
+        self.started = True
+
+    def play_round(self, policies: Sequence[DecisionPolicy]) -> None:
+        """
+        Resolves one full round headlessly, see `TurnResolverService.play_round`, then ends it.
+
+        :param policies: One policy per player, in seat order.
+        """
+        self.turn_resolver.play_round(policies)
+        self.__finish_round()
+
+    def end_round(self) -> None:
+        """Rewards the survivors and ends the round, for front ends resolving the turns themselves."""
+        self.turn_resolver.reward_vp_for_survivors
+        self.__finish_round()
+
+    def __finish_round(self) -> None:
+        # the survivors' rewards are not deltas, so the actions of an ended round cannot be taken back
+        if self.undo_stack is not None:
+            self.undo_stack.clear()
+        self.round += 1
+        state = self.state
+        state.round = self.round
+        state.clear_targets()
+
+    @property
+    def alive_count(self) -> int:
+        return self.state.alive_count
+
+    @property
+    def is_over(self) -> bool:
+        """True after the last round, or once at most one player is left alive."""
+        return self.round >= self.max_rounds or self.alive_count <= 1
@@ -0,0 +1,76 @@
+from __future__ import annotations
+from itertools import repeat
+from typing import Sequence
+from models import Status
+from services.Policy import DecisionPolicy
+from services.types import GameSummary, SeatSummary
+from utils import GameStateValidator
+from .session import GameSession
+from configs import MAX_ROUNDS, TOTAL_PLAYERS
+
+
+class HeadlessGameController:
+    """
+    Docstring for HeadlessGameController
+    This controller plays complete games without a human: every roll goes through `Action_service.execute_action`
+    via `TurnResolverService.play_round`, and every decision is taken by a `DecisionPolicy`.
+    Every game is its own `GameSession`, so controllers never share state with each other or with the ui.
+    It never reads stdin and never imports pygame, so it can run thousands of games in tests or simulations.
+
+    __init__ method parameters:
+    - policies (DecisionPolicy | Sequence[DecisionPolicy]): One policy for every seat, or one policy per seat.
+    - player_names (Sequence[str] | None): Names of the players, defaults to P1..P{TOTAL_PLAYERS}.
+    - max_rounds (int): Number of rounds of a full game, defaults to MAX_ROUNDS.
+    - trusted (bool): Play through the trusted, unvalidated action path, every input comes from the engine and the
+      policies only ever get valid candidates. Defaults to True, False replays the games on the validated path.
+
+    """
+
+    def __init__(self, policies: DecisionPolicy | Sequence[DecisionPolicy], player_names: Sequence[str] | None = None, max_rounds: int = MAX_ROUNDS, trusted: bool = True) -> None:
+        self.player_names: list[str] = list(player_names) if player_names is not None else [f"P{i}" for i in range(1, TOTAL_PLAYERS + 1)]
+        if not 1 < len(self.player_names) <= TOTAL_PLAYERS:
+            raise GameStateValidator(f"A game needs between 2 and {TOTAL_PLAYERS} players")
+        if isinstance(policies, DecisionPolicy):
+            policies = [policies] * len(self.player_names)
+        if len(policies) != len(self.player_names):
+            raise GameStateValidator("Exactly one policy per seat is required")
+        self.policies: list[DecisionPolicy] = list(policies)
+        self.max_rounds = max_rounds
+        self.trusted = trusted
+
+    def play(self, seed: int, policy_seeds: Sequence[int] | None = None) -> GameSummary:
+        """
+        Plays one complete game.
+        The game ends after `max_rounds` rounds, or earlier once at most one player is left alive.
+
+        :param seed: Seed of the dice, seat order and policies, the same seed replays the same game.
+        :param policy_seeds: Seed every seat's policy is reset with instead of `seed`, one per seat. Only useful
+            when every seat has its own policy instance, a shared instance keeps the seed of its last seat.
+        :return: The final standing of every seat.
+        """
+        for policy, policy_seed in zip(self.policies, policy_seeds if policy_seeds is not None else repeat(seed)):
+            policy.reset(policy_seed)
+
+        session = GameSession(self.player_names, seed, self.max_rounds, self.trusted)
+        while not session.is_over:
+            session.play_round(self.policies)
+
+        ranking = session.ranking
+        ranking.check_rank()
+        return GameSummary(
+            seed=seed,
+            rounds_played=session.round,
+            seats=tuple(
+                SeatSummary(p.name, p.vp, p.hp, ranking.rank_of(p.player_id)["rank"], p.status == Status.ALIVE)
+                for p in session.players
+            ),
+        )
+
+    def play_many(self, seeds: Sequence[int]) -> list[GameSummary]:
+        """
+        Plays one game per seed.
+
+        :param seeds: The seeds of the games to play.
+        :return: One summary per seed, in the same order.
+        """
+        return [self.play(seed) for seed in seeds]
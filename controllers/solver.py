@@ -0,0 +1,168 @@
+"""
+Exact game values by expectimax over `GameState`.
+Every roll is a chance node with its face odds, every decision is taken by the player to move maximizing
+its own win probability (max-n), values are the win probability of every seat. Values of positions are
+memoized in a size bounded transposition table, so positions reached by different move orders are solved once.
+The full game is far too large to solve from the opening, this is meant for endgame positions.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Hashable
+
+from models import GameState, active_face_vals, fallen_face_vals
+from models.GameState import Move
+from configs import Ruleset, DEFAULT_RULESET
+
+# win probability of every seat
+Value = tuple[float, ...]
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+
+def _chance(faces: dict) -> tuple[tuple[int, float], ...]:
+    """One (roll, probability) pair per distinct face, the aliased fallen faces share one node."""
+    odds: dict[object, list] = {}
+    for roll, face in faces.items():
+        odds.setdefault(face, [roll, 0.0])[1] += 1 / len(faces)
+    return tuple((roll, p) for roll, p in odds.values())
+
+
+_ALIVE_ROLLS = _chance(active_face_vals)
+_FALLEN_ROLLS = _chance(fallen_face_vals)
+
+
+class TranspositionTable:
+    """
+    Least recently used cache of solved positions.
+
+    __init__ method parameters:
+    - max_entries (int): Number of positions kept, the least recently used one is evicted beyond that.
+    """
+
+    __slots__ = ("max_entries", "_entries", "hits", "misses", "evictions")
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Value] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Value | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Hashable, value: Value) -> None:
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+
+class ExpectimaxSolver:
+    """
+    Docstring for ExpectimaxSolver
+    Solves positions exactly under the given rules. Ties between moves go to the first legal move,
+    so the returned decisions are deterministic.
+
+    __init__ method parameters:
+    - rules (Ruleset): The rules positions are solved under, defaults to the configured rules.
+    - max_entries (int): Size of the transposition table.
+    """
+
+    def __init__(self, rules: Ruleset = DEFAULT_RULESET, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.rules = rules
+        self.table = TranspositionTable(max_entries)
+
+    @staticmethod
+    def key(state: GameState) -> tuple:
+        """
+        Canonical encoding of a position: two states with the same key have the same value.
+        `targeted_by` never affects the rules, and the last targets of the seats that already played this
+        round are cleared before they play again, so only the last targets of the seats still to play count.
+        """
+        turn = state.turn
+        return (state.names, tuple(state.hp), tuple(state.vp), tuple(state.alive),
+                tuple(state.targeted_to[turn:]), state.round, turn)
+
+    def value(self, state: GameState) -> Value:
+        """
+        Win probability of every seat, with `state.turn` about to roll and every player playing optimally.
+
+        :param state: The position, it is not modified.
+        :return: One probability per seat, summing to 1.
+        """
+        key = self.key(state)
+        cached = self.table.get(key)
+        if cached is not None:
+            return cached
+
+        rules = self.rules
+        if state.is_over(rules):
+            ranks = state.ranks()
+            result = tuple(1.0 if rank == 1 else 0.0 for rank in ranks)
+        else:
+            seat = state.turn
+            totals = [0.0] * len(state.names)
+            for roll, probability in (_ALIVE_ROLLS if state.alive[seat] else _FALLEN_ROLLS):
+                _, child_value = self.best_move(state, roll)
+                for i, v in enumerate(child_value):
+                    totals[i] += probability * v
+            result = tuple(totals)
+
+        self.table.put(key, result)
+        return result
+
+    def best_move(self, state: GameState, roll: int) -> tuple[Move, Value]:
+        """
+        Optimal decision of `state.turn` after rolling `roll`.
+
+        :param state: The position, it is not modified.
+        :param roll: The dice value (1-6).
+        :return: The move maximizing the mover's win probability and the value it leads to.
+        """
+        seat, rules = state.turn, self.rules
+        # the last seat of a round ends it, which touches every seat
+        round_ends = seat + 1 >= len(state.names)
+        best: tuple[Move, Value] | None = None
+        for move in state.moves(seat, roll):
+            # apply and undo in place instead of cloning the state per child
+            saved = state.snapshot() if round_ends else state.checkpoint(seat, move[0])
+            state.apply(seat, roll, move, rules)
+            state.advance(rules)
+            child_value = self.value(state)
+            if round_ends:
+                state.restore(saved)
+            else:
+                state.rollback(saved)
+            if best is None or child_value[seat] > best[1][seat]:
+                best = (move, child_value)
+        return best
+
+    def win_probability(self, state: GameState, seat: int) -> float:
+        """Win probability of `seat` in `state` under optimal play."""
+        return self.value(state)[seat]
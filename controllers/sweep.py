@@ -0,0 +1,248 @@
+"""
+Balance sweeps: plays many games for every cell of a grid (or random sample) of rulesets and reports
+seat advantage and game length per cell. Games are played by the NumPy `BatchSimulator` in fixed size
+chunks of seeds, and every chunk result is cached on disk under a hash of (ruleset, policy, seed chunk),
+so rerunning a sweep, adding cells or adding games only plays the chunks not played yet.
+
+NumPy is an optional dependency, install it with `pip install do-or-dice[sim]`.
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import product
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+import hashlib
+import json
+import math
+import os
+import random
+
+import numpy as np
+
+from helpers import derive_seed
+from configs import Ruleset, DEFAULT_RULESET, TOTAL_PLAYERS
+from .batch_simulator import BatchSimulator, RandomVectorPolicy, VectorPolicy
+
+# bump when the engine or the chunk format changes, so stale cache entries are never read
+# 2: tied wins are shared between the tied seats instead of going to the lowest seat
+CACHE_VERSION = 2
+DEFAULT_CHUNK_SIZE = 2_000
+
+# policy name -> factory building the policy of every seat from the chunk's generator
+POLICIES: dict[str, Callable[[np.random.Generator], VectorPolicy]] = {
+    "random": RandomVectorPolicy,
+}
+
+
+def grid(base: Ruleset = DEFAULT_RULESET, **values: Iterable[int]) -> list[Ruleset]:
+    """
+    Every combination of the given field values, the other fields keep their `base` value.
+    e.g. `grid(jab_dmg=range(1, 4), strike_hp=(3, 4, 5))` is 9 rulesets.
+    """
+    fields = list(values)
+    return [base._replace(**dict(zip(fields, combo))) for combo in product(*values.values())]
+
+
+def random_sample(n: int, seed: int, base: Ruleset = DEFAULT_RULESET, **ranges: tuple[int, int]) -> list[Ruleset]:
+    """
+    `n` rulesets with every given field drawn uniformly from its inclusive (low, high) range.
+    """
+    rng = random.Random(derive_seed(seed, "sweep", "sample"))
+    return [base._replace(**{name: rng.randint(low, high) for name, (low, high) in ranges.items()}) for _ in range(n)]
+
+
+def cell_key(rules: Ruleset, policy: str, master_seed: int, chunk: int, chunk_size: int, players: int) -> str:
+    """Content address of one chunk of one cell: the sha256 of everything its result depends on."""
+    material = json.dumps({
+        "version": CACHE_VERSION,
+        "rules": rules._asdict(),
+        "policy": policy,
+        "seeds": [master_seed, chunk, chunk_size],
+        "players": players,
+    }, sort_keys=True)
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Directory of JSON chunk results named by their `cell_key`.
+
+    __init__ method parameters:
+    - directory (str | Path): Where the results are stored, created when missing.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        try:
+            return json.loads(self.__path(key).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, result: dict) -> None:
+        # write then rename, so an interrupted sweep never leaves a truncated entry behind
+        path = self.__path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(result))
+        tmp.replace(path)
+
+    def __contains__(self, key: str) -> bool:
+        return self.__path(key).exists()
+
+
+def _play_chunk(rules: Ruleset, policy: str, master_seed: int, chunk: int, chunk_size: int, players: int) -> dict:
+    """Worker entry point: plays one chunk of one cell and returns its JSON-able totals."""
+    seed = derive_seed(master_seed, "sweep", chunk)
+    policy_seed = np.random.SeedSequence(derive_seed(seed, "policy"))
+    result = BatchSimulator(chunk_size, players, rules).play(seed, POLICIES[policy](np.random.default_rng(policy_seed)))
+    rounds = result.rounds_played.astype(np.int64)
+    return {
+        "games": chunk_size,
+        # a first place tied between k seats is 1/k of a win each, a rank tie-break would favour some seats
+        "wins": result.win_shares.sum(axis=0).tolist(),
+        "survived": result.alive.sum(axis=0).tolist(),
+        "vp": result.vp.sum(axis=0).tolist(),
+        "rounds": int(rounds.sum()),
+        "rounds_sq": int((rounds ** 2).sum()),
+        "rounds_hist": np.bincount(rounds, minlength=rules.max_rounds + 1).tolist(),
+    }
+
+
+def _play_task(task: tuple) -> dict:
+    return _play_chunk(*task)
+
+
+@dataclass
+class CellStats:
+    """
+    Totals of every game played for one ruleset.
+    :param rules: The ruleset of the cell.
+    :param games: Number of games played.
+    :param wins: Games won per seat, a game tied for first place between k seats counts 1/k for each.
+    :param survived: Games finished alive per seat.
+    :param vp: Total final VP per seat.
+    :param rounds: Total rounds played.
+    :param rounds_sq: Total of the squared game lengths, for the variance.
+    :param rounds_hist: rounds_hist[r] is the number of games that lasted r rounds.
+    :param cached_chunks: Chunks read from the cache rather than played.
+    """
+    rules: Ruleset
+    games: int = 0
+    wins: list[float] = field(default_factory=list)
+    survived: list[int] = field(default_factory=list)
+    vp: list[int] = field(default_factory=list)
+    rounds: int = 0
+    rounds_sq: int = 0
+    rounds_hist: list[int] = field(default_factory=list)
+    cached_chunks: int = 0
+
+    def add(self, chunk: dict) -> None:
+        """Reduces one chunk result into the totals."""
+        self.games += chunk["games"]
+        self.rounds += chunk["rounds"]
+        self.rounds_sq += chunk["rounds_sq"]
+        for name in ("wins", "survived", "vp", "rounds_hist"):
+            totals = getattr(self, name)
+            if not totals:
+                totals.extend([0] * len(chunk[name]))
+            for i, value in enumerate(chunk[name]):
+                totals[i] += value
+
+    @property
+    def win_rates(self) -> list[float]:
+        return [w / self.games for w in self.wins] if self.games else []
+
+    @property
+    def seat_advantage(self) -> list[float]:
+        """Win rate of every seat minus the fair share 1 / seats."""
+        fair = 1 / len(self.wins) if self.wins else 0.0
+        return [rate - fair for rate in self.win_rates]
+
+    @property
+    def max_seat_advantage(self) -> float:
+        """Largest absolute seat advantage, 0 for a perfectly balanced ruleset."""
+        return max((abs(a) for a in self.seat_advantage), default=0.0)
+
+    @property
+    def mean_rounds(self) -> float:
+        return self.rounds / self.games if self.games else 0.0
+
+    @property
+    def std_rounds(self) -> float:
+        if self.games < 2:
+            return 0.0
+        mean = self.mean_rounds
+        return math.sqrt(max(0.0, (self.rounds_sq - self.games * mean * mean) / (self.games - 1)))
+
+    @property
+    def full_length_rate(self) -> float:
+        """Share of games that lasted every round, the others ended with at most one player alive."""
+        return self.rounds_hist[self.rules.max_rounds] / self.games if self.games else 0.0
+
+
+def run_sweep(
+    rulesets: Sequence[Ruleset],
+    games: int,
+    master_seed: int = 0,
+    policy: str = "random",
+    cache_dir: str | Path | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    players: int = TOTAL_PLAYERS,
+) -> list[CellStats]:
+    """
+    Plays `games` games (rounded up to whole chunks) for every ruleset, reusing cached chunks.
+    Chunk `i` of a cell is always played with the same seeds, so every cell sees the same dice
+    and a cell's statistics do not depend on the worker count or on the other cells of the sweep.
+
+    :param rulesets: The cells of the sweep, e.g. from `grid` or `random_sample`.
+    :param games: Games per cell.
+    :param master_seed: Seed every chunk seed is derived from.
+    :param policy: Name of the policy of every seat, a key of `POLICIES`.
+    :param cache_dir: Directory of the result cache, None disables caching.
+    :param workers: Number of worker processes, defaults to the cpu count. 1 plays in this process.
+    :param chunk_size: Games per chunk, the unit of caching and of work sent to a worker.
+    :param players: Number of seats per game.
+    :return: One `CellStats` per ruleset, in the same order.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}, expected one of {sorted(POLICIES)}")
+    cache = ResultCache(cache_dir) if cache_dir is not None else None
+    chunks = math.ceil(games / chunk_size)
+    cells = [CellStats(rules) for rules in rulesets]
+
+    missing: list[tuple[CellStats, str, tuple]] = []
+    for cell in cells:
+        for chunk in range(chunks):
+            task = (cell.rules, policy, master_seed, chunk, chunk_size, players)
+            key = cell_key(cell.rules, policy, master_seed, chunk, chunk_size, players)
+            cached = cache.get(key) if cache is not None else None
+            if cached is not None:
+                cell.add(cached)
+                cell.cached_chunks += 1
+            else:
+                missing.append((cell, key, task))
+
+    workers = workers or os.cpu_count() or 1
+    tasks = [task for _, _, task in missing]
+    if workers == 1 or len(tasks) <= 1:
+        results = map(_play_task, tasks)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(_play_task, tasks)
+    try:
+        for (cell, key, _), result in zip(missing, results):
+            if cache is not None:
+                cache.put(key, result)
+            cell.add(result)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return cells
@@ -0,0 +1,144 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Sequence
+import multiprocessing
+import os
+
+from helpers import derive_seed
+from services.Policy import DecisionPolicy, RandomPolicy
+from configs import MAX_ROUNDS, TOTAL_PLAYERS
+from .simulator import HeadlessGameController
+
+# (game_id, rounds_played, ((vp, hp, rank, alive), ...) per seat)
+CompactGame = tuple[int, int, tuple[tuple[int, int, int, bool], ...]]
+
+
+def game_seed(master_seed: int, game_id: int) -> int:
+    """
+    Seed of game `game_id` of a tournament, derived from the master seed only,
+    so every game is the same whichever worker plays it.
+    """
+    return derive_seed(master_seed, "game", game_id)
+
+
+def _play_chunk(
+    policy_factory: Callable[[], DecisionPolicy | Sequence[DecisionPolicy]],
+    player_names: Sequence[str] | None,
+    max_rounds: int,
+    master_seed: int,
+    game_ids: range,
+) -> list[CompactGame]:
+    """Worker entry point: plays `game_ids` and returns one compact tuple per game."""
+    controller = HeadlessGameController(policy_factory(), player_names, max_rounds)
+    compact = []
+    for game_id in game_ids:
+        summary = controller.play(game_seed(master_seed, game_id))
+        compact.append((
+            game_id,
+            summary.rounds_played,
+            tuple((seat.vp, seat.hp, seat.rank, seat.alive) for seat in summary.seats),
+        ))
+    return compact
+
+
+@dataclass
+class TournamentResult:
+    """
+    Aggregated results of a tournament, all totals are integers so the reduction does not depend on
+    the order in which games come back.
+    :param master_seed: The master seed of the tournament.
+    :param seats: Number of seats per game.
+    :param games: Number of games played.
+    :param rounds: Total rounds played over all games.
+    :param wins: Number of games won per seat.
+    :param vp: Total final VP per seat.
+    :param hp: Total final HP per seat.
+    :param survived: Number of games each seat finished alive.
+    :param rank_counts: rank_counts[seat][rank - 1] is how often the seat finished on that rank.
+    """
+    master_seed: int
+    seats: int
+    games: int = 0
+    rounds: int = 0
+    wins: list[int] = field(default_factory=list)
+    vp: list[int] = field(default_factory=list)
+    hp: list[int] = field(default_factory=list)
+    survived: list[int] = field(default_factory=list)
+    rank_counts: list[list[int]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        for name in ("wins", "vp", "hp", "survived"):
+            if not getattr(self, name):
+                setattr(self, name, [0] * self.seats)
+        if not self.rank_counts:
+            self.rank_counts = [[0] * self.seats for _ in range(self.seats)]
+
+    def add(self, game: CompactGame) -> None:
+        """Reduces one compact game into the totals."""
+        _, rounds_played, seats = game
+        self.games += 1
+        self.rounds += rounds_played
+        for seat, (vp, hp, rank, alive) in enumerate(seats):
+            self.vp[seat] += vp
+            self.hp[seat] += hp
+            self.survived[seat] += alive
+            self.rank_counts[seat][rank - 1] += 1
+            if rank == 1:
+                self.wins[seat] += 1
+
+    @property
+    def win_rates(self) -> list[float]:
+        return [w / self.games for w in self.wins] if self.games else [0.0] * self.seats
+
+    @property
+    def mean_vp(self) -> list[float]:
+        return [v / self.games for v in self.vp] if self.games else [0.0] * self.seats
+
+    @property
+    def mean_rounds(self) -> float:
+        return self.rounds / self.games if self.games else 0.0
+
+
+def run_tournament(
+    games: int,
+    master_seed: int,
+    workers: int | None = None,
+    policy_factory: Callable[[], DecisionPolicy | Sequence[DecisionPolicy]] = RandomPolicy,
+    player_names: Sequence[str] | None = None,
+    max_rounds: int = MAX_ROUNDS,
+    chunk_size: int = 250,
+    mp_context: str | None = None,
+) -> TournamentResult:
+    """
+    Plays `games` headless games spread over a pool of worker processes and reduces their summaries.
+    Game `i` is always played with `game_seed(master_seed, i)`, so the result is identical for a given
+    master seed whatever the number of workers or the chunk size.
+
+    :param games: Number of games to play.
+    :param master_seed: Seed every game seed is derived from.
+    :param workers: Number of worker processes, defaults to the cpu count. 1 plays in this process.
+    :param policy_factory: Picklable callable building the policy (or per seat policies) in each worker.
+    :param player_names: Names of the players, see `HeadlessGameController`.
+    :param max_rounds: Number of rounds of a full game.
+    :param chunk_size: Number of games sent to a worker at once.
+    :param mp_context: Multiprocessing start method ("fork", "forkserver", "spawn"), defaults to the platform's.
+    :return: The aggregated tournament result.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = [range(start, min(start + chunk_size, games)) for start in range(0, games, chunk_size)]
+    args = (policy_factory, player_names, max_rounds, master_seed)
+
+    if workers == 1 or len(chunks) <= 1:
+        results = [_play_chunk(*args, chunk) for chunk in chunks]
+    else:
+        context = multiprocessing.get_context(mp_context) if mp_context else None
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            results = list(pool.map(partial(_play_chunk, *args), chunks))
+
+    tournament = TournamentResult(master_seed, len(player_names) if player_names is not None else TOTAL_PLAYERS)
+    for chunk_result in results:
+        for game in chunk_result:
+            tournament.add(game)
+    return tournament
@@ -1,2 +1,2 @@
-from .randomizer import Randomizer
-__all__ = ['Randomizer']
\ No newline at end of file
+from .randomizer import Randomizer, RandomEngine, DiceEngine, derive_seed
+__all__ = ['Randomizer', 'RandomEngine', 'DiceEngine', 'derive_seed']
@@ -1,41 +1,269 @@
 from __future__ import annotations
-from models import Player
-from datetime import datetime
+from typing import TYPE_CHECKING, Protocol, MutableSequence, TypeVar
+from hashlib import blake2b
+from array import array
+import random
+import os
+
+if TYPE_CHECKING:
+    from models import Player
+
+T = TypeVar("T")
+
+# maps a random byte onto a dice face; the 4 bytes above 251 are dropped so every face keeps 42/252 odds
+_FACE_TABLE = bytes(i % 6 + 1 for i in range(256))
+_REJECTED_BYTES = bytes(range(252, 256))
+
+# stream key reserved for the initial seat shuffle
+SEAT_STREAM = "seats"
+
+def derive_seed(seed: int, *keys: int | str) -> int:
+    """
+    Derives a 64 bit child seed from a parent seed and any number of stream keys.
+    The derivation is a keyed hash so it is stable across processes and python versions.
+    Args:
+        seed (int): The parent seed.
+        *keys (int | str): Stream keys (e.g. a stream name) mixed into the parent seed.
+    Returns:
+        int: The derived 64 bit seed.
+    """
+    material = "/".join(str(k) for k in (seed, *keys)).encode()
+    return int.from_bytes(blake2b(material, digest_size=8).digest(), "little")
+
+
+class DiceEngine(Protocol):
+    """
+    Interface every random engine plugged into `Randomizer` has to provide.
+    """
+
+    seed: int
+
+    def roll(self) -> int:
+        """Returns a dice value between 1 and 6, inclusive."""
+        ...
+
+    def roll_many(self, n: int) -> array:
+        """Returns `n` dice values as an unsigned byte array, continuing the `roll` sequence."""
+        ...
+
+    def shuffle(self, items: MutableSequence[T]) -> MutableSequence[T]:
+        """Shuffles `items` in place and returns it."""
+        ...
+
+    def spawn(self, stream: int | str) -> DiceEngine:
+        """Returns an independent engine for `stream` derived from this engine's seed."""
+        ...
+
+
+class RandomEngine:
+    """
+    Seedable dice engine backed by the Mersenne Twister of `random.Random`.
+    Rolls are pre-generated in blocks of `buffer_size` random bytes and handed out from that buffer,
+    so `roll()` and `roll_many()` walk the same sequence and two engines created with the same
+    seed and stream produce bit-identical rolls however the calls are mixed.
+
+    Attributes:
+        seed (int): The seed the engine was created with (drawn from the OS when not provided).
+        stream (int | str): The stream key mixed into the seed. Default is 0.
+        buffer_size (int): Number of random bytes drawn per refill. Default is 4096.
+    """
+
+    __slots__ = ("seed", "stream", "buffer_size", "_rng", "_randbytes", "_buffer", "_pos")
+
+    def __init__(self, seed: int | None = None, stream: int | str = 0, buffer_size: int = 4096) -> None:
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be a positive integer")
+        self.seed = seed
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self._rng = random.Random(derive_seed(seed, stream))
+        self._randbytes = self._rng.randbytes
+        self._buffer = b""
+        self._pos = 0
+
+    def __refill(self) -> None:
+        """Replaces the exhausted buffer with the next block of dice values."""
+        buffer = b""
+        while not buffer:
+            buffer = self._randbytes(self.buffer_size).translate(_FACE_TABLE, _REJECTED_BYTES)
+        self._buffer = buffer
+        self._pos = 0
+
+    def roll(self) -> int:
+        """
+        Rolls a single dice from the pre-rolled buffer, refilling it when exhausted.
+        Returns:
+            int: An integer between 1 and 6, inclusive.
+        """
+        pos = self._pos
+        try:
+            value = self._buffer[pos]
+        except IndexError:
+            self.__refill()
+            pos = 0
+            value = self._buffer[0]
+        self._pos = pos + 1
+        return value
+
+    def roll_many(self, n: int) -> array:
+        """
+        Rolls `n` dice at once.
+        Args:
+            n (int): Number of rolls wanted.
+        Returns:
+            array: An `array('B')` of `n` integers between 1 and 6, the same values `n` calls of `roll()` would give.
+        """
+        rolls = array("B")
+        while n > 0:
+            if self._pos >= len(self._buffer):
+                self.__refill()
+            end = min(self._pos + n, len(self._buffer))
+            rolls.frombytes(self._buffer[self._pos:end])
+            n -= end - self._pos
+            self._pos = end
+        return rolls
+
+    def shuffle(self, items: MutableSequence[T]) -> MutableSequence[T]:
+        """
+        Shuffles `items` in place with the Fisher-Yates (Durstenfeld) algorithm of `random.Random.shuffle`:
+        one unbiased swap per element, so every permutation is equally likely and the cost is O(n).
+        Args:
+            items (MutableSequence): The sequence to shuffle.
+        Returns:
+            MutableSequence: The same sequence, shuffled.
+        """
+        self._rng.shuffle(items)
+        return items
+
+    @classmethod
+    def for_game(cls, master_seed: int, game_id: int, stream: int | str = 0) -> RandomEngine:
+        """
+        Creates the engine of one simulated game from a master seed.
+        The game seed is a hash of (master_seed, game_id) only, so a game rolls the same dice no matter
+        which worker process runs it or how many workers the run is split over, while distinct game ids
+        get statistically independent streams.
+        Args:
+            master_seed (int): The seed of the whole simulation run.
+            game_id (int): The id of the game within the run.
+            stream (int | str): Stream key within the game (e.g. "seats"). Default is 0.
+        Returns:
+            RandomEngine: The engine for that game and stream.
+        """
+        return cls(derive_seed(master_seed, "game", game_id), stream)
+
+    def spawn(self, stream: int | str) -> RandomEngine:
+        """
+        Creates an independent engine for another stream of the same seed.
+        Args:
+            stream (int | str): The stream key of the new engine.
+        Returns:
+            RandomEngine: A new engine whose sequence does not overlap with this one.
+        """
+        return RandomEngine(self.seed, stream, self.buffer_size)
+
+    def __repr__(self) -> str:
+        return f"RandomEngine(seed={self.seed}, stream={self.stream!r})"
+
 
 class Randomizer():
     """
-    Service class for returning extreme random values for game mechanics for  dice rolls and initial players arrangement 
+    Service class for returning random values for game mechanics for dice rolls and initial players arrangement.
+    All rolls are drawn from the shared `engine`, so seeding it makes a whole game reproducible.
     """
 
+    engine: DiceEngine = RandomEngine()
+    # False while `engine` is still the implicit import-time engine
+    seeded: bool = False
+    # (engine, its "seats" stream): the seat stream is kept and advanced until `engine` is replaced
+    _seats: tuple[DiceEngine, DiceEngine] | None = None
+
+    @classmethod
+    def seed(cls, seed: int | None = None) -> DiceEngine:
+        """
+        Replaces the shared engine with a freshly seeded `RandomEngine`.
+        Args:
+            seed (int | None): The game seed, a random one is drawn from the OS when None.
+        Returns:
+            DiceEngine: The engine now used by `roll_dice`.
+        """
+        return cls.use_engine(RandomEngine(seed))
+
+    @classmethod
+    def use_engine(cls, engine: DiceEngine) -> DiceEngine:
+        """
+        Plugs a custom engine into the randomizer.
+        Args:
+            engine (DiceEngine): Any object implementing the `DiceEngine` interface.
+        Returns:
+            DiceEngine: The engine now used by `roll_dice`.
+        """
+        cls.engine = engine
+        cls.seeded = True
+        return engine
+
+    @classmethod
+    def seed_game(cls, master_seed: int, game_id: int) -> DiceEngine:
+        """
+        Seeds the shared engine for one game of a simulation run, see `RandomEngine.for_game`.
+        Args:
+            master_seed (int): The seed of the whole simulation run.
+            game_id (int): The id of the game within the run.
+        Returns:
+            DiceEngine: The engine now used by `roll_dice`.
+        """
+        return cls.use_engine(RandomEngine.for_game(master_seed, game_id))
+
+    @classmethod
+    def _reseed_after_fork(cls) -> None:
+        """A forked worker must not replay its parent's implicit engine, so draw a fresh OS seed."""
+        if not cls.seeded:
+            cls.engine = RandomEngine()
+
     @staticmethod
     def roll_dice()-> int:
         """
-        Simulates a dice roll by generating a pseudo-random number between 1 and 6.
-        The randomness is derived from the current time's microseconds.
+        Simulates a dice roll using the shared engine.
         Returns:
             int: A pseudo-random integer between 1 and 6, inclusive.
         """
-        while  not (dice_value := sum([int(num) for num in str(datetime.now()).split()[-1].split('.')[-1]]) % 7) :
-            ...
-        return dice_value
-    
+        return Randomizer.engine.roll()
+
+    @staticmethod
+    def roll_many(n: int) -> array:
+        """
+        Rolls `n` dice at once from the shared engine, for simulations that consume rolls in bulk.
+        Args:
+            n (int): Number of rolls wanted.
+        Returns:
+            array: An `array('B')` of pseudo-random integers between 1 and 6, inclusive.
+        """
+        return Randomizer.engine.roll_many(n)
+
     @staticmethod
-    def arrange_players_initially(player_instance: list[Player]) -> list[Player]:
+    def arrange_players_initially(player_instance: list[Player], seed: int | None = None) -> list[Player]:
         """
-        Arranges players in a pseudo-random order based on the current time's microseconds.
+        Arranges players in a uniformly random seat order, shuffling the given list in place.
+        The shuffle draws from the "seats" stream so it never shifts the dice roll sequence.
+        Without `seed`, the "seats" stream of the shared engine is spawned once and advanced by every call,
+        so successive arrangements differ while the sequence of arrangements still replays from the engine's seed.
         Args:
-            player_instance (list): A list of player instance to be arranged.         
+            player_instance (list): A list of player instance to be arranged, of any size.
+            seed (int | None): Seed to replay a seat order from, defaults to the shared engine's seat stream.
         Returns:
-            list: A new list of player instance arranged in a pseudo-random order.
+            list: The same list of player instance arranged in a pseudo-random order.
 
         """
-        arranged_players = player_instance.copy()
-        microseconds = [int(num) for num in str(datetime.now()).split()[-1].split('.')[-1]]
-        n = len(arranged_players)
-        for i in range(n):
-            swap_index = microseconds[i % len(microseconds)] % n
-            arranged_players[i], arranged_players[swap_index] = arranged_players[swap_index], arranged_players[i]
-        return arranged_players
-    
+        if seed is None:
+            seats = Randomizer._seats
+            if seats is None or seats[0] is not Randomizer.engine:
+                seats = Randomizer._seats = (Randomizer.engine, Randomizer.engine.spawn(SEAT_STREAM))
+            engine = seats[1]
+        else:
+            engine = RandomEngine(seed, SEAT_STREAM)
+        return engine.shuffle(player_instance)
 
 
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=Randomizer._reseed_after_fork)
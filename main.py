@@ -1,4 +1,17 @@
+import argparse
+from multiprocessing import freeze_support
+
 from ui import run_game
 
+
+def parse_seats(value: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in value.split(",") if part.strip())
+
+
 if __name__ == "__main__":
-    run_game()
+    # the bot searches in a spawned process, a frozen build must not start the game again in it
+    freeze_support()
+    parser = argparse.ArgumentParser(description="DO OR DICE")
+    parser.add_argument("--ai-seats", type=parse_seats, default=None,
+                        help="comma separated seats (0 based) played by the bot, defaults to the AI_SEATS setting")
+    run_game(parser.parse_args().ai_seats)
@@ -1,6 +1,10 @@
 from enum import Enum
 
 class ActiveFace(Enum):
+    # members are singletons compared by identity, so hash them by identity too: faces key the dispatch
+    # tables of the engines, and Enum.__hash__ is a Python level call on every lookup
+    __hash__ = object.__hash__
+
     BACKFIRE = "Backfire"
     POWER_MOVE = "Power Move"
     RECOVER = "Recover"
@@ -15,6 +19,8 @@ class Status(Enum):
 
 
 class FallenFace(Enum):
+    __hash__ = object.__hash__
+
     NOTHING_1 = "Nothing"
     PLUS2HP_OR_PLUS1VP = "+2 HP OR +1 VP to any alive player"
     REMOVE2HP_OR_MINUS1VP = "Remove −2 HP OR −1 VP from any alive player"
@@ -0,0 +1,123 @@
+"""
+Rules of every rolled face compiled into a dispatch table, see `effect_table`.
+`Action_service.execute_action` resolves a roll with a single lookup in it instead of branching over
+faces and choices, and the amounts always follow the `Ruleset` the table was built from.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import NamedTuple
+
+from .Dice import ActiveFace, FallenFace
+from configs.rules import Ruleset, DEFAULT_RULESET
+
+# what an effect does to its subject
+NO_EFFECT = 0
+DAMAGE = 1
+HEAL = 2
+GAIN_VP = 3
+# the roller takes the amount of vp from the target
+STEAL_VP = 4
+# the target loses the amount of vp, nobody gains it
+REDUCE_VP = 5
+
+# choice_action values of the faces offering a choice, any other value is looked up as OTHER_CHOICE
+CHOICES = frozenset(("damage_hp", "gain_vp", "heal_hp", "steal_vp"))
+OTHER_CHOICE = "?"
+
+# (face, choice_action, target given) -> Effect
+EffectKey = tuple[ActiveFace | FallenFace, str | None, bool]
+
+
+class Effect(NamedTuple):
+    """
+    Precomputed effect of one (face, choice_action, target given) combination.
+    :param kind: NO_EFFECT, DAMAGE, HEAL, GAIN_VP, STEAL_VP or REDUCE_VP.
+    :param amount: The hp or vp amount, from the ruleset.
+    :param on_target: The target is affected (and marked, and recorded as consumer), else the roller is.
+    :param record: Keyword of `HistoryService.record_event` the amount is recorded under, None records no amount.
+    :param fallen_rules: A fallen player targets someone, the fallen targeting rules apply.
+    :param error: Message of the `InvalidPlayerActionValidator` raised for an invalid combination, None when valid.
+    :param needs_vp: The target must have `amount` vp, else the effect is recorded without effect.
+    :param recorded: (damage_dealt, healing_done, vp_gained, vp_stolen) arguments of `record_event`, precomputed from `record` and `amount`.
+    """
+    kind: int
+    amount: int = 0
+    on_target: bool = False
+    record: str | None = None
+    fallen_rules: bool = False
+    error: str | None = None
+    needs_vp: bool = False
+    recorded: tuple[int | None, ...] = (None, None, None, None)
+
+
+def _effect(kind: int, amount: int = 0, on_target: bool = False, record: str | None = None, fallen_rules: bool = False) -> Effect:
+    recorded = tuple(amount if record == name else None for name in _RECORDED)
+    return Effect(kind, amount, on_target, record, fallen_rules, None, kind in (STEAL_VP, REDUCE_VP), recorded)
+
+
+def _invalid(message: str, fallen_rules: bool = False) -> Effect:
+    return Effect(NO_EFFECT, fallen_rules=fallen_rules, error=message)
+
+
+# the amount arguments of HistoryService.record_event, in order
+_RECORDED = ("damage_dealt", "healing_done", "vp_gained", "vp_stolen")
+
+_UNHANDLED = "Unhandled action or invalid parameters"
+_NEEDS_TARGET = "This action requires a target"
+
+
+@lru_cache(maxsize=None)
+def effect_table(rules: Ruleset = DEFAULT_RULESET) -> dict[EffectKey, Effect]:
+    """
+    Compiles the rules into a table keyed by (face, choice_action, target given), covering every face, every
+    choice in CHOICES plus None and OTHER_CHOICE, with and without a target. Invalid combinations hold the
+    error they raise. Tables are cached per ruleset, so every service playing the same rules shares one.
+
+    :param rules: The amounts of every effect, defaults to the configured rules.
+    :return: The dispatch table.
+    """
+    table: dict[EffectKey, Effect] = {}
+    choices = (None, OTHER_CHOICE, *sorted(CHOICES))
+
+    def every_choice(face, targeted: bool, effect: Effect) -> None:
+        for choice in choices:
+            table[face, choice, targeted] = effect
+
+    # active faces affecting the roller only, a target is never expected
+    every_choice(ActiveFace.BACKFIRE, False, _effect(DAMAGE, rules.back_fire_dmg, record="damage_dealt"))
+    every_choice(ActiveFace.RECOVER, False, _effect(HEAL, rules.recover_hp, record="healing_done"))
+    every_choice(ActiveFace.BACKFIRE, True, _invalid(_UNHANDLED))
+    every_choice(ActiveFace.RECOVER, True, _invalid(_UNHANDLED))
+
+    # active faces hitting a target, the choice is ignored
+    for face, effect in (
+        (ActiveFace.JAB, _effect(DAMAGE, rules.jab_dmg, True, "damage_dealt")),
+        (ActiveFace.STRIKE, _effect(DAMAGE, rules.strike_hp, True, "damage_dealt")),
+        (ActiveFace.PICKPOCKET, _effect(STEAL_VP, rules.pick_pocket_vp, True, "vp_stolen")),
+    ):
+        every_choice(face, True, effect)
+        every_choice(face, False, _invalid(_NEEDS_TARGET))
+
+    # POWER_MOVE: vp for the roller, or damage to a target
+    power_vp = _effect(GAIN_VP, rules.power_move_vp, record="vp_gained")
+    invalid_power = _invalid("Invalid choice_action provided for POWER_MOVE")
+    every_choice(ActiveFace.POWER_MOVE, False, invalid_power)
+    every_choice(ActiveFace.POWER_MOVE, True, invalid_power)
+    table[ActiveFace.POWER_MOVE, None, False] = power_vp
+    table[ActiveFace.POWER_MOVE, "gain_vp", False] = power_vp
+    table[ActiveFace.POWER_MOVE, "gain_vp", True] = power_vp
+    table[ActiveFace.POWER_MOVE, "damage_hp", False] = _invalid("POWER_MOVE with 'damage_hp' requires a target")
+    table[ActiveFace.POWER_MOVE, "damage_hp", True] = _effect(DAMAGE, rules.power_move_hp, True, "damage_dealt")
+
+    # fallen faces: without a target nothing happens, with one the fallen targeting rules apply
+    for face in FallenFace:
+        every_choice(face, False, _effect(NO_EFFECT))
+        every_choice(face, True, _invalid(_UNHANDLED, fallen_rules=True))
+    bless, curse = FallenFace.PLUS2HP_OR_PLUS1VP, FallenFace.REMOVE2HP_OR_MINUS1VP
+    every_choice(bless, True, _invalid("Invalid choice_action provided for PLUS2HP_OR_PLUS1VP", fallen_rules=True))
+    every_choice(curse, True, _invalid("Invalid choice_action provided for REMOVE2HP_OR_MINUS1VP", fallen_rules=True))
+    table[bless, "heal_hp", True] = _effect(HEAL, rules.fallen_hp, True, "healing_done", fallen_rules=True)
+    table[bless, "gain_vp", True] = _effect(GAIN_VP, rules.fallen_vp, True, "vp_gained", fallen_rules=True)
+    table[curse, "damage_hp", True] = _effect(DAMAGE, rules.fallen_hp, True, "damage_dealt", fallen_rules=True)
+    table[curse, "steal_vp", True] = _effect(REDUCE_VP, rules.fallen_vp, True, "vp_stolen", fallen_rules=True)
+    return table
@@ -0,0 +1,296 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Optional
+from .Dice import ActiveFace, FallenFace, active_face_vals, fallen_face_vals
+from .Standings import seat_ranks
+from configs.rules import Ruleset, DEFAULT_RULESET
+
+if TYPE_CHECKING:
+    from .Player import Player
+
+# Immutable, hashable copy of a GameState, see GameState.snapshot
+Snapshot = tuple[tuple[str, ...], tuple[int, ...], tuple[int, ...], tuple[bool, ...], tuple[Optional[str], ...], tuple[Optional[str], ...], int, int]
+
+# (round, turn) followed by (seat, hp, vp, alive, targeted_by, targeted_to) of one or two seats, see GameState.checkpoint
+Checkpoint = tuple[int | bool | str | None, ...]
+
+# Player.heal caps health at 20, it is also the starting hp
+MAX_HP = 20
+
+# option codes shared by every face offering a choice: the hp effect or the vp effect
+OPTION_HP = 0
+OPTION_VP = 1
+
+# (target seat, option) decided for a rolled face, target -1 when the face affects no other player
+Move = tuple[int, int]
+NO_MOVE: Move = (-1, OPTION_HP)
+
+_TARGETED_ACTIVE = (ActiveFace.JAB, ActiveFace.STRIKE, ActiveFace.PICKPOCKET)
+_NO_EFFECT_FALLEN = (FallenFace.NOTHING_1, FallenFace.NOTHING_2)
+
+
+class GameState:
+    """
+    Struct-of-arrays state of one game: one flat list per attribute, indexed by seat.
+    `Player` objects are views over one seat of a state, so copying the state never copies players.
+
+    Attributes:
+        names (tuple[str, ...]): Player name per seat, shared between clones.
+        hp (list[int]): Health points per seat.
+        vp (list[int]): Victory points per seat.
+        alive (list[bool]): True while the seat is alive (Status.ALIVE).
+        targeted_by (list[str | None]): Name of the player that last affected the seat this round.
+        targeted_to (list[str | None]): Name of the player the seat last affected this round.
+        round (int): Number of completed rounds.
+        turn (int): Seat whose turn is next within the round.
+    """
+
+    __slots__ = ("names", "hp", "vp", "alive", "targeted_by", "targeted_to", "round", "turn")
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        hp: Iterable[int] | None = None,
+        vp: Iterable[int] | None = None,
+        alive: Iterable[bool] | None = None,
+        targeted_by: Iterable[str | None] | None = None,
+        targeted_to: Iterable[str | None] | None = None,
+        round: int = 0,
+        turn: int = 0,
+    ) -> None:
+        self.names = tuple(names)
+        seats = len(self.names)
+        self.hp = list(hp) if hp is not None else [20] * seats
+        self.vp = list(vp) if vp is not None else [0] * seats
+        self.alive = list(alive) if alive is not None else [True] * seats
+        self.targeted_by = list(targeted_by) if targeted_by is not None else [None] * seats
+        self.targeted_to = list(targeted_to) if targeted_to is not None else [None] * seats
+        self.round = round
+        self.turn = turn
+
+    @classmethod
+    def from_players(cls, players: list[Player]) -> GameState:
+        """
+        Gathers the current values of `players` into one shared state and rebinds every player
+        to its seat, so from now on the players read and write that state.
+
+        :param players: The players in seat order.
+        :return: The shared state.
+        """
+        state = cls(
+            (p.name for p in players),
+            (p.hp for p in players),
+            (p.vp for p in players),
+            (p.is_alive for p in players),
+            (p.last_targetedby for p in players),
+            (p.last_targetedto for p in players),
+        )
+        for seat, player in enumerate(players):
+            player.bind(state, seat)
+        return state
+
+    def clone(self) -> GameState:
+        """
+        Returns an independent copy in O(players): only the per seat lists are copied,
+        the names tuple is shared and no player objects are touched.
+        """
+        clone = object.__new__(GameState)
+        clone.names = self.names
+        clone.hp = self.hp[:]
+        clone.vp = self.vp[:]
+        clone.alive = self.alive[:]
+        clone.targeted_by = self.targeted_by[:]
+        clone.targeted_to = self.targeted_to[:]
+        clone.round = self.round
+        clone.turn = self.turn
+        return clone
+
+    def snapshot(self) -> Snapshot:
+        """Returns an immutable, hashable copy of the state."""
+        return (self.names, tuple(self.hp), tuple(self.vp), tuple(self.alive),
+                tuple(self.targeted_by), tuple(self.targeted_to), self.round, self.turn)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Snapshot) -> GameState:
+        """Builds a new state from `snapshot`."""
+        return cls(*snapshot)
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """Overwrites this state in place with `snapshot`, players bound to it see the restored values."""
+        names, hp, vp, alive, targeted_by, targeted_to, self.round, self.turn = snapshot
+        if names != self.names:
+            raise ValueError("Snapshot belongs to a game with other players")
+        self.hp[:] = hp
+        self.vp[:] = vp
+        self.alive[:] = alive
+        self.targeted_by[:] = targeted_by
+        self.targeted_to[:] = targeted_to
+
+    def checkpoint(self, seat: int, other: int = -1) -> Checkpoint:
+        """
+        Saves `round`, `turn` and every attribute of `seat` (and of `other`), the inverse delta of a change
+        touching at most those two seats. Costs O(1) where `snapshot` costs O(players).
+
+        :param seat: The seat the change touches.
+        :param other: A second seat it touches, -1 for none.
+        :return: The checkpoint to hand to `rollback`.
+        """
+        hp, vp, alive, targeted_by, targeted_to = self.hp, self.vp, self.alive, self.targeted_by, self.targeted_to
+        if other < 0 or other == seat:
+            return self.round, self.turn, seat, hp[seat], vp[seat], alive[seat], targeted_by[seat], targeted_to[seat]
+        return (self.round, self.turn, seat, hp[seat], vp[seat], alive[seat], targeted_by[seat], targeted_to[seat],
+                other, hp[other], vp[other], alive[other], targeted_by[other], targeted_to[other])
+
+    def rollback(self, checkpoint: Checkpoint) -> None:
+        """Restores the seats, `round` and `turn` saved by `checkpoint`, the other seats are left as they are."""
+        hp, vp, alive, targeted_by, targeted_to = self.hp, self.vp, self.alive, self.targeted_by, self.targeted_to
+        if len(checkpoint) == 8:
+            self.round, self.turn, seat, hp[seat], vp[seat], alive[seat], targeted_by[seat], targeted_to[seat] = checkpoint
+        else:
+            (self.round, self.turn, seat, hp[seat], vp[seat], alive[seat], targeted_by[seat], targeted_to[seat],
+             other, hp[other], vp[other], alive[other], targeted_by[other], targeted_to[other]) = checkpoint
+
+    @property
+    def seats(self) -> int:
+        return len(self.names)
+
+    @property
+    def alive_count(self) -> int:
+        return sum(self.alive)
+
+    def clear_targets(self) -> None:
+        """Resets the last targeted fields of every seat, done after every round."""
+        seats = len(self.names)
+        self.targeted_by[:] = [None] * seats
+        self.targeted_to[:] = [None] * seats
+
+    # --- forward model, mirrors Action_service.execute_action and TurnResolverService.play_turn ---
+
+    def candidates(self, seat: int) -> list[int]:
+        """
+        Valid targets of `seat`: alive opponents while the seat is alive,
+        alive players other than its last target once it has fallen.
+        """
+        alive = self.alive
+        if alive[seat]:
+            return [s for s in range(len(alive)) if alive[s] and s != seat]
+        last, names = self.targeted_to[seat], self.names
+        return [s for s in range(len(alive)) if alive[s] and names[s] != last]
+
+    def moves(self, seat: int, roll: int) -> list[Move]:
+        """
+        Every legal decision of `seat` after rolling `roll`, never empty.
+
+        :param seat: The seat whose turn it is.
+        :param roll: The dice value (1-6).
+        :return: (target, option) pairs, `NO_MOVE` when the roll leaves nothing to decide.
+        """
+        if self.alive[seat]:
+            face = active_face_vals[roll]
+            if face is ActiveFace.POWER_MOVE:
+                return [(-1, OPTION_VP)] + [(t, OPTION_HP) for t in self.candidates(seat)]
+            if face in _TARGETED_ACTIVE:
+                return [(t, OPTION_HP) for t in self.candidates(seat)] or [NO_MOVE]
+            return [NO_MOVE]
+        if fallen_face_vals[roll] in _NO_EFFECT_FALLEN:
+            return [NO_MOVE]
+        return [(t, option) for t in self.candidates(seat) for option in (OPTION_HP, OPTION_VP)] or [NO_MOVE]
+
+    def __damage(self, seat: int, amount: int) -> None:
+        hp = self.hp[seat] - amount
+        if hp <= 0:
+            hp = 0
+            self.alive[seat] = False
+        self.hp[seat] = hp
+
+    def __mark(self, seat: int, target: int) -> None:
+        self.targeted_to[seat] = self.names[target]
+        self.targeted_by[target] = self.names[seat]
+
+    def apply(self, seat: int, roll: int, move: Move = NO_MOVE, rules: Ruleset = DEFAULT_RULESET) -> None:
+        """
+        Resolves the turn of `seat` in place, with the same effects `Action_service.execute_action` has on players.
+        Does not advance `turn`, see `advance`.
+
+        :param seat: The seat whose turn it is.
+        :param roll: The dice value (1-6).
+        :param move: One of `moves(seat, roll)`.
+        :param rules: The amounts of every effect.
+        """
+        target, option = move
+        if self.alive[seat]:
+            face = active_face_vals[roll]
+            if face is ActiveFace.BACKFIRE:
+                self.__damage(seat, rules.back_fire_dmg)
+            elif face is ActiveFace.RECOVER:
+                self.hp[seat] = min(self.hp[seat] + rules.recover_hp, MAX_HP)
+            elif face is ActiveFace.POWER_MOVE:
+                if target < 0 or option == OPTION_VP:
+                    self.vp[seat] += rules.power_move_vp
+                else:
+                    self.__damage(target, rules.power_move_hp)
+                    self.__mark(seat, target)
+            elif target < 0:
+                return
+            elif face is ActiveFace.JAB:
+                self.__damage(target, rules.jab_dmg)
+                self.__mark(seat, target)
+            elif face is ActiveFace.STRIKE:
+                self.__damage(target, rules.strike_hp)
+                self.__mark(seat, target)
+            elif self.vp[target] >= rules.pick_pocket_vp:
+                self.vp[target] -= rules.pick_pocket_vp
+                self.vp[seat] += rules.pick_pocket_vp
+                self.__mark(seat, target)
+            return
+
+        if target < 0:
+            return
+        face = fallen_face_vals[roll]
+        if face is FallenFace.PLUS2HP_OR_PLUS1VP:
+            if option == OPTION_HP:
+                self.hp[target] = min(self.hp[target] + rules.fallen_hp, MAX_HP)
+            else:
+                self.vp[target] += rules.fallen_vp
+            self.__mark(seat, target)
+        elif face is FallenFace.REMOVE2HP_OR_MINUS1VP:
+            if option == OPTION_HP:
+                self.__damage(target, rules.fallen_hp)
+            elif self.vp[target] >= rules.fallen_vp:
+                self.vp[target] -= rules.fallen_vp
+            else:
+                return
+            self.__mark(seat, target)
+
+    def end_round(self, rules: Ruleset = DEFAULT_RULESET) -> None:
+        """Rewards the survivors, clears the targeting of the round and starts the next round."""
+        vp = self.vp
+        for seat, alive in enumerate(self.alive):
+            if alive:
+                vp[seat] += rules.survivor_vp
+        self.clear_targets()
+        self.round += 1
+        self.turn = 0
+
+    def advance(self, rules: Ruleset = DEFAULT_RULESET) -> None:
+        """Moves `turn` to the next seat, ending the round after the last seat."""
+        self.turn += 1
+        if self.turn >= len(self.names):
+            self.end_round(rules)
+
+    def is_over(self, rules: Ruleset = DEFAULT_RULESET) -> bool:
+        """True once the game has ended: after the last round, or at the end of a round with at most one player alive."""
+        return self.turn == 0 and (self.round >= rules.max_rounds or sum(self.alive) <= 1)
+
+    def ranks(self) -> list[int]:
+        """Rank of every seat, ordered like `IngameRankService` (see `models.Standings.standing_key`): vp desc, then hp desc, then name."""
+        return seat_ranks(self.vp, self.hp, self.names)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return self.snapshot() == other.snapshot()
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return f"GameState(round={self.round}, turn={self.turn}, hp={self.hp}, vp={self.vp}, alive={self.alive})"
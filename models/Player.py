@@ -2,13 +2,32 @@ from __future__ import annotations
 from utils import MaxPlayersValidator, InvalidPlayerActionValidator, GameStateValidator
 from helpers import Randomizer
 from colorama import init, Fore
-from typing import Union
+from enum import IntEnum
+from typing import TYPE_CHECKING, Union
 from .Dice import ActiveFace, FallenFace, Status, active_face_vals, fallen_face_vals
+from .GameState import GameState
+from .Roster import PlayerRoster
 from configs.constants import TOTAL_PLAYERS
 
+if TYPE_CHECKING:
+    from controllers.session import GameSession
+
 init(autoreset=True)
 
 
+class MutationStatus(IntEnum):
+    """
+    Status code returned by the unchecked `Player` primitives in place of raising.
+    OK and KNOCKED_OUT mean the change was applied, the other codes mean nothing changed.
+    """
+    OK = 0
+    KNOCKED_OUT = 1
+    FALLEN = 2
+    INSUFFICIENT_VP = 3
+
+
+_OK, _KNOCKED_OUT, _FALLEN, _INSUFFICIENT_VP = MutationStatus
+
 
 class Player:
     """
@@ -19,7 +38,11 @@ class Player:
         hp (int): The health points of the player Default is 20.
         vp (int): The victory points of the player Default is 0.
         status (Status): The status of the player (Status.ALIVE or Status.FALLEN). Default is Status.ALIVE.
+        state (GameState): The state the player is a view over, a state of its own until `bind` is called.
+        seat (int): The index of the player within `state`.
+        player_id (int | None): Stable id given by the roster the player joins, see `PlayerRoster`.
         avatar_url (str): The URL of the player's avatar image Default is "../assests/default.png".
+        session (GameSession | None): The session the player joined, None for the default lobby `player_arrangement`.
 
     Methods:
         participate_in_game(): Method for player to participate in the game player list.
@@ -29,9 +52,11 @@ class Player:
         heal(heal_hp): Method for player to heal and update health points (hp).
         gain_vp(vp): Method for player to gain victory points (vp).
         steal_vp(target_player, vp): Method for player to steal victory points (vp) from another player.
+        *_unchecked(...): Trusted variants of the methods above for engine driven bulk simulation, they skip the
+            input validation and return a `MutationStatus` instead of raising for the game rule outcomes.
     """
 
-    player_arrangement : list [Player] = list()
+    player_arrangement : PlayerRoster = PlayerRoster()
 
     
 
@@ -42,40 +67,49 @@ class Player:
         vp=0,
         status: Status = Status.ALIVE,
         avatar="../assests/default.png",
+        session: GameSession | None = None,
     ) -> None:
         self.name = name
-        self.__hp = hp
-        self.__vp = vp
+        self.session = session
+        # hp, vp, status and targeting live in a GameState, the player is a view over one seat of it
+        self._state = GameState((name,), (hp,), (vp,), (status == Status.ALIVE,))
+        self._seat = 0
         self.avatar_url = avatar
-        self.status = status
-        self.player_id = None
-        self.last_targetedby = None
-        self.last_targetedto = None
+        self.player_id: int | None = None
         self.rounds_survived = 0
 
         try:
             self.participlate_in_game()
         except MaxPlayersValidator as e:
+            # a full session is reported to its caller, only the interactive lobby exits
+            if session is not None:
+                raise
             print(Fore.RED + str(e))
             raise SystemExit("Syxtem existing gracefully.")
             # exit()   # Currently commenint gthis down fro the sake of testing
 
-        # Arrange players automatically when 5 players have participated
-        if len(Player.player_arrangement) == 5:
+        # Arrange players automatically once the lobby is full, a session arranges its players when it starts
+        if session is None and len(Player.player_arrangement) == TOTAL_PLAYERS:
             Player.arrange_players_initially()
 
+    @property
+    def roster(self) -> PlayerRoster:
+        """The player list the player joins: its session's players, or the default lobby."""
+        return Player.player_arrangement if self.session is None else self.session.players
+
     def participlate_in_game(self) -> bool | MaxPlayersValidator:
         """
         Method for player to participate in the game player list.
-        Maximum 5 players are allowed to participate.
+        Maximum 5 players are allowed to participate, joining gives the player its `player_id`.
         Raises:
             MaxPlayersValidator: If maximum player limit is reached.
 
         Returns:
             bool: True if participation is successful, False otherwise.
         """
-        if len(Player.player_arrangement) < TOTAL_PLAYERS:
-            Player.player_arrangement.append(self)
+        roster = self.roster
+        if len(roster) < TOTAL_PLAYERS:
+            roster.append(self)
             return True
         else:
             raise MaxPlayersValidator(
@@ -83,21 +117,77 @@ class Player:
             )
 
     @classmethod
-    def arrange_players_initially(cls) -> bool:
+    def arrange_players_initially(cls, seed: int | None = None) -> bool:
         """
-        Class method to arrange players initially in a pseudo-random order.
+        Class method to shuffle the joined players into a pseudo-random seat order, in place.
+        Works for any lobby size and can be called manually before the lobby is full.
+        Args:
+            seed (int | None): Seed to replay a seat order from, defaults to the shared engine's seed.
         Returns:
            bool: True if arrangement is successful, False otherwise.
         """
         try:
-            cls.player_arrangement = Randomizer.arrange_players_initially(
-                cls.player_arrangement
-            )
+            if seed is None:
+                Randomizer.arrange_players_initially(cls.player_arrangement)
+            else:
+                Randomizer.arrange_players_initially(cls.player_arrangement, seed)
             return True
         except Exception as e:
             print(Fore.RED + f"Error arranging players: {e}")
             return False
 
+    def bind(self, state: GameState, seat: int) -> None:
+        """
+        Makes the player a view over `seat` of `state`, see `GameState.from_players`.
+        Args:
+            state (GameState): The shared game state.
+            seat (int): The index of the player within the state.
+        """
+        self._state = state
+        self._seat = seat
+
+    @property
+    def state(self) -> GameState:
+        """getter for the game state the player is a view over"""
+        return self._state
+
+    @property
+    def seat(self) -> int:
+        """getter for the seat of the player within its state"""
+        return self._seat
+
+    @property
+    def status(self) -> Status:
+        """getter for status"""
+        return Status.ALIVE if self._state.alive[self._seat] else Status.FALLEN
+
+    @status.setter
+    def status(self, status: Status) -> None:
+        self._state.alive[self._seat] = status == Status.ALIVE
+
+    @property
+    def is_alive(self) -> bool:
+        """True while the player is alive"""
+        return self._state.alive[self._seat]
+
+    @property
+    def last_targetedby(self) -> str | None:
+        """getter for the name of the player that last affected this player in the round"""
+        return self._state.targeted_by[self._seat]
+
+    @last_targetedby.setter
+    def last_targetedby(self, name: str | None) -> None:
+        self._state.targeted_by[self._seat] = name
+
+    @property
+    def last_targetedto(self) -> str | None:
+        """getter for the name of the player this player last affected in the round"""
+        return self._state.targeted_to[self._seat]
+
+    @last_targetedto.setter
+    def last_targetedto(self, name: str | None) -> None:
+        self._state.targeted_to[self._seat] = name
+
     def roll_dice(self) -> Union[ActiveFace, FallenFace]:
         """
         Method for player to roll a dice.
@@ -106,9 +196,11 @@ class Player:
             Union[ActiveFace, FallenFace]: The enum member representing the dice face outcome
                 for an alive (`ActiveFace`) or fallen (`FallenFace`) player.
         """
+        # session players roll their session's dice, so concurrent games never share an engine
+        roll = Randomizer.roll_dice() if self.session is None else self.session.engine.roll()
         if self.status == Status.ALIVE:
-            return active_face_vals[Randomizer.roll_dice()]
-        return fallen_face_vals[Randomizer.roll_dice()]
+            return active_face_vals[roll]
+        return fallen_face_vals[roll]
 
     @property
     def __set_player_to_fallen(self) -> bool :
@@ -116,12 +208,10 @@ class Player:
         Setter  for __set_player_to_fallen
         """
 
-        self.status = Status.FALLEN
+        state, seat = self._state, self._seat
+        state.alive[seat] = False
         # Ensuring that hp never stays negative
-        try:
-            self.__hp = max(0, self.__hp)
-        except AttributeError:
-            pass
+        state.hp[seat] = max(0, state.hp[seat])
         return True
 
     def take_damage(self, damage: int) -> bool | InvalidPlayerActionValidator | GameStateValidator:
@@ -137,48 +227,84 @@ class Player:
         if self.status == Status.FALLEN:
             raise InvalidPlayerActionValidator("Fallen player cannot take further damage")
 
-        self.__hp -= damage
-        if self.__hp <= 0:
-            self.__set_player_to_fallen
+        self.take_damage_unchecked(damage)
         return True
 
-    def heal(self, heal_hp: int) -> bool | InvalidPlayerActionValidator | GameStateValidator:
+    def take_damage_unchecked(self, damage: int) -> MutationStatus:
+        """
+        Trusted variant of `take_damage`, `damage` is assumed positive.
+        Returns:
+            MutationStatus: KNOCKED_OUT when the damage made the player fall, FALLEN when the player was already fallen.
+        """
+        state, seat = self._state, self._seat
+        if not state.alive[seat]:
+            return _FALLEN
+        hp = state.hp[seat] - damage
+        if hp > 0:
+            state.hp[seat] = hp
+            return _OK
+        state.hp[seat] = 0
+        state.alive[seat] = False
+        return _KNOCKED_OUT
+
+    def heal(self, heal_hp: int, limit: int = 20) -> bool | InvalidPlayerActionValidator | GameStateValidator:
         """
         Method for player to heal and update health points (hp).
         Args:
             heal_hp (int): The amount of healing to be applied.
+            limit (int): Largest accepted amount, defaults to 20. `Action_service` passes the one of its rules.
         Returns:
             bool: True if healing is applied successfully, False otherwise.
         """
-        if not (0 < heal_hp <= 20):
-            raise GameStateValidator("Provided heal value should be within 1-20")
+        if not (0 < heal_hp <= limit):
+            raise GameStateValidator(f"Provided heal value should be within 1-{limit}")
         if self.status == Status.FALLEN:
             raise InvalidPlayerActionValidator("Fallen player cannot be healed")
 
-        self.__hp += heal_hp
-        self.__hp = min(self.__hp, 20)  # Cap hp at 20
+        self.heal_unchecked(heal_hp)
         return True
 
-    def gain_vp(self, vp_increment: int) -> bool | GameStateValidator:
+    def heal_unchecked(self, heal_hp: int) -> MutationStatus:
+        """
+        Trusted variant of `heal`, `heal_hp` is assumed within 1-20.
+        Returns:
+            MutationStatus: FALLEN when the player is fallen and cannot be healed.
+        """
+        state, seat = self._state, self._seat
+        if not state.alive[seat]:
+            return _FALLEN
+        hp = state.hp[seat] + heal_hp
+        state.hp[seat] = hp if hp < 20 else 20  # Cap hp at 20
+        return _OK
+
+    def gain_vp(self, vp_increment: int, limit: int = 3) -> bool | GameStateValidator:
         """
         Method for player to gain victory points (vp).
         Args:
             vp_increment (int): The amount of victory points to be gained.
+            limit (int): Largest accepted amount, defaults to 3. `Action_service` passes the one of its rules.
         Returns:
             bool: True if victory points are gained successfully, False otherwise.
         """
-        if not (0 < vp_increment <= 3):
-            raise GameStateValidator("Game VP transactions must be between 1 and 3")
+        if not (0 < vp_increment <= limit):
+            raise GameStateValidator(f"Game VP transactions must be between 1 and {limit}")
 
-        self.__vp += vp_increment
+        self._state.vp[self._seat] += vp_increment
         return True
 
-    def steal_vp(self, target_player: Player, vp_to_steal: int) -> bool | InvalidPlayerActionValidator | GameStateValidator | Exception:
+    def gain_vp_unchecked(self, vp_increment: int) -> MutationStatus:
+        """Trusted variant of `gain_vp`, `vp_increment` is assumed within 1-3."""
+        self._state.vp[self._seat] += vp_increment
+        return _OK
+
+    def steal_vp(self, target_player: Player, vp_to_steal: int, limit: int = 3) -> bool | InvalidPlayerActionValidator | GameStateValidator | Exception:
         """
         Method for player to steal victory points (vp) from another player.
+        Everything is validated before either player changes, a rejected steal leaves both untouched.
         Args:
             target_player (Player): The player from whom victory points are to be stolen.
             vp_to_steal (int): The amount of victory points to be stolen.
+            limit (int): Largest accepted amount, defaults to 3. `Action_service` passes the one of its rules.
         Returns:
             bool: True if victory points are stolen successfully, False otherwise.
         """
@@ -186,15 +312,29 @@ class Player:
             raise Exception("Target player must be an instance of Player class")
         if vp_to_steal <= 0:
             raise GameStateValidator("vp_to_steal must be a positive integer")
-
         # Ensure target has enough vp
-        if target_player.__vp < vp_to_steal:
+        if target_player.vp < vp_to_steal:
             raise InvalidPlayerActionValidator("Target player has insufficient VP")
+        if vp_to_steal > limit:
+            raise GameStateValidator(f"Game VP transactions must be between 1 and {limit}")
 
-        target_player.__vp -= vp_to_steal
-        self.gain_vp(vp_increment=vp_to_steal)
+        target_player._state.vp[target_player._seat] -= vp_to_steal
+        self._state.vp[self._seat] += vp_to_steal
         return True
 
+    def steal_vp_unchecked(self, target_player: Player, vp_to_steal: int) -> MutationStatus:
+        """
+        Trusted variant of `steal_vp`, `target_player` is assumed a Player and `vp_to_steal` within 1-3.
+        Returns:
+            MutationStatus: INSUFFICIENT_VP when the target has less VP than `vp_to_steal`, nothing is stolen then.
+        """
+        target_vp, target_seat = target_player._state.vp, target_player._seat
+        if target_vp[target_seat] < vp_to_steal:
+            return _INSUFFICIENT_VP
+        target_vp[target_seat] -= vp_to_steal
+        self._state.vp[self._seat] += vp_to_steal
+        return _OK
+
     @property
     def hp(self) -> int:
         """
@@ -203,25 +343,38 @@ class Player:
         :param self: instance of class Player
         :return: int
         """
-        return self.__hp
+        return self._state.hp[self._seat]
 
-    def reduce_vp(self, vp_decrement: int) -> bool | GameStateValidator:
+    def reduce_vp(self, vp_decrement: int, limit: int = 3) -> bool | GameStateValidator:
         """
         Method for self player to reduce victory points (vp).
         Args:
-            vp_decrement (int): The amount of victory points to be reduced."""
+            vp_decrement (int): The amount of victory points to be reduced.
+            limit (int): Largest accepted amount, defaults to 3. `Action_service` passes the one of its rules."""
         
-        if not (0 < vp_decrement <= 3):
-            raise GameStateValidator("Game VP transactions must be between 1 and 3")
-        if self.__vp - vp_decrement < 0:
+        if not (0 < vp_decrement <= limit):
+            raise GameStateValidator(f"Game VP transactions must be between 1 and {limit}")
+        if self.vp - vp_decrement < 0:
             raise GameStateValidator("VP cannot be negative")
 
-        self.__vp -= vp_decrement
+        self._state.vp[self._seat] -= vp_decrement
         return True
+
+    def reduce_vp_unchecked(self, vp_decrement: int) -> MutationStatus:
+        """
+        Trusted variant of `reduce_vp`, `vp_decrement` is assumed within 1-3.
+        Returns:
+            MutationStatus: INSUFFICIENT_VP when the VP would become negative, nothing is reduced then.
+        """
+        vp, seat = self._state.vp, self._seat
+        if vp[seat] < vp_decrement:
+            return _INSUFFICIENT_VP
+        vp[seat] -= vp_decrement
+        return _OK
     @property
     def vp(self) -> int:
         """getter for vp"""
-        return self.__vp
+        return self._state.vp[self._seat]
 
     def __repr__(self) -> str:
         return f"{Fore.GREEN} Player(name={self.name}, hp={self.hp}, vp={self.vp}, status={self.status.value})"
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, SupportsIndex
+
+if TYPE_CHECKING:
+    from .Player import Player
+
+
+class PlayerRoster(list):
+    """
+    List of players, in seat order, with constant time lookup by player id and by name.
+
+    Joining the roster (`append`, `insert`, `extend`) gives a player without an id the next free integer id,
+    ids are never reused within a roster so they stay stable for the whole game. Reordering the roster
+    (e.g. shuffling the seats) keeps every id, and any other change only marks the index stale: it is rebuilt
+    on the next lookup, so mutations stay as cheap as on a plain list.
+
+    When two players share a name, `by_name` returns the first one in seat order, like a linear scan would.
+    """
+
+    def __init__(self, players: Iterable[Player] = ()) -> None:
+        super().__init__()
+        self._next_id = 1
+        self._by_id: dict[int, Player] = {}
+        self._by_name: dict[str, Player] = {}
+        self._stale = False
+        self.extend(players)
+
+    def __assign_id(self, player: Player) -> None:
+        if player.player_id is None:
+            player.player_id = self._next_id
+        self._next_id = max(self._next_id, player.player_id + 1)
+
+    def __reindex(self) -> None:
+        self._by_id = {player.player_id: player for player in self}
+        self._by_name = {}
+        for player in self:
+            self._by_name.setdefault(player.name, player)
+        self._stale = False
+
+    def append(self, player: Player) -> None:
+        self.__assign_id(player)
+        super().append(player)
+        if not self._stale:
+            self._by_id[player.player_id] = player
+            self._by_name.setdefault(player.name, player)
+
+    def insert(self, index: SupportsIndex, player: Player) -> None:
+        self.__assign_id(player)
+        super().insert(index, player)
+        self._stale = True
+
+    def extend(self, players: Iterable[Player]) -> None:
+        for player in players:
+            self.append(player)
+
+    def __iadd__(self, players: Iterable[Player]) -> PlayerRoster:
+        self.extend(players)
+        return self
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            for player in value:
+                self.__assign_id(player)
+        else:
+            self.__assign_id(value)
+        super().__setitem__(index, value)
+        self._stale = True
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._stale = True
+
+    def remove(self, player: Player) -> None:
+        super().remove(player)
+        self._stale = True
+
+    def pop(self, index: SupportsIndex = -1) -> Player:
+        player = super().pop(index)
+        self._stale = True
+        return player
+
+    def clear(self) -> None:
+        super().clear()
+        self._by_id.clear()
+        self._by_name.clear()
+        self._stale = False
+
+    def by_id(self, player_id: int) -> Player | None:
+        """The player with `player_id`, None when no such player is in the roster."""
+        if self._stale:
+            self.__reindex()
+        return self._by_id.get(player_id)
+
+    def by_name(self, name: str) -> Player | None:
+        """The first player named `name` in seat order, None when no such player is in the roster."""
+        if self._stale:
+            self.__reindex()
+        return self._by_name.get(name)
+
+    def __reduce_ex__(self, protocol):
+        # players may refer back to the roster (through their session), so they are restored untouched
+        # and the index is only rebuilt on the first lookup, once they are complete
+        return PlayerRoster, (), {"next_id": self._next_id, "players": list(self)}
+
+    def __setstate__(self, state: dict) -> None:
+        list.extend(self, state["players"])
+        self._next_id = state["next_id"]
+        self._stale = True
@@ -0,0 +1,27 @@
+from __future__ import annotations
+from typing import Sequence
+
+
+def standing_key(vp: int, hp: int, name: str) -> tuple[int, int, str]:
+    """
+    Sort key of a player's standing, the one ranking rule of the game: vp desc, then hp desc, then name asc.
+    Shared by `services.Rank.IngameRankService`, `GameState.ranks` and the batch simulator, so every engine
+    breaks a tie the way the UI and the sessions show it.
+    """
+    return (-vp, -hp, name)
+
+
+def seat_ranks(vp: Sequence[int], hp: Sequence[int], names: Sequence[str]) -> list[int]:
+    """
+    Rank (1-based) of every seat, ordered by `standing_key`.
+
+    :param vp: VP per seat.
+    :param hp: HP per seat.
+    :param names: Player name per seat.
+    :return: The rank of every seat, in seat order.
+    """
+    order = sorted(range(len(names)), key=lambda seat: standing_key(vp[seat], hp[seat], names[seat]))
+    ranks = [0] * len(order)
+    for rank, seat in enumerate(order, start=1):
+        ranks[seat] = rank
+    return ranks
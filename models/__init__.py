@@ -1,4 +1,7 @@
-from .Player import Player, ActiveFace, FallenFace
+from .Player import Player, MutationStatus, ActiveFace, FallenFace
+from .GameState import GameState
+from .Roster import PlayerRoster
+from .Standings import standing_key, seat_ranks
 from .Dice import ActiveFace, FallenFace, Status, active_face_vals, fallen_face_vals
 
-__all__ = ['Player', 'active_face_vals', 'fallen_face_vals', 'Status', 'ActiveFace', 'FallenFace']
\ No newline at end of file
+__all__ = ['Player', 'MutationStatus', 'GameState', 'PlayerRoster', 'standing_key', 'seat_ranks', 'active_face_vals', 'fallen_face_vals', 'Status', 'ActiveFace', 'FallenFace']
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+Running totals of the game history, see `EventAggregates`.
+"""
+from __future__ import annotations
+from collections import defaultdict
+
+from models import Player, ActiveFace, FallenFace
+from .types import EventRecord, EventTotals
+
+
+class EventAggregates:
+    """
+    Docstring for EventAggregates
+    `EventTotals` per player and per face, updated by `HistoryService` as events are recorded (and taken back
+    when an event is removed or overwritten through it), so reading them costs O(1) whatever the game length.
+
+    A player's totals count the damage they dealt to others, the vp they stole, and the damage, healing and vp
+    they received. The totals of a face are the sums of the player totals over the events of that face.
+
+    Attributes:
+        players (dict[Player, EventTotals]): Totals per player, created on first use.
+        faces (dict[ActiveFace | FallenFace, EventTotals]): Totals per face, created on first use.
+    """
+
+    __slots__ = ("players", "faces")
+
+    def __init__(self) -> None:
+        self.players: defaultdict[Player, EventTotals] = defaultdict(EventTotals)
+        self.faces: defaultdict[ActiveFace | FallenFace, EventTotals] = defaultdict(EventTotals)
+
+    def add(
+        self,
+        rolled_by: Player,
+        dice_face_value: ActiveFace | FallenFace,
+        consumer: Player | None = None,
+        damage_dealt: int | None = None,
+        healing_done: int | None = None,
+        vp_gained: int | None = None,
+        vp_stolen: int | None = None,
+    ) -> None:
+        """Counts one event straight from the `HistoryService.record_event` arguments."""
+        if damage_dealt is None and healing_done is None and vp_gained is None and vp_stolen is None:
+            return
+        target = consumer or rolled_by
+        received, face = self.players[target], self.faces[dice_face_value]
+        if damage_dealt is not None:
+            received.damage_taken += damage_dealt
+            face.damage_taken += damage_dealt
+            if target is not rolled_by:
+                self.players[rolled_by].damage_dealt += damage_dealt
+                face.damage_dealt += damage_dealt
+        if healing_done is not None:
+            received.healing += healing_done
+            face.healing += healing_done
+        if vp_gained is not None:
+            received.vp_gained += vp_gained
+            face.vp_gained += vp_gained
+        if vp_stolen is not None:
+            self.players[rolled_by].vp_stolen += vp_stolen
+            face.vp_stolen += vp_stolen
+
+    def add_record(self, event_record: EventRecord, sign: int = 1) -> None:
+        """
+        Counts one stored event, every target of its effect lists.
+
+        :param event_record: The event.
+        :param sign: 1 to count the event, -1 to take it back.
+        """
+        rolled_by, players = event_record.rolled_by, self.players
+        face = self.faces[event_record.dice_face_value]
+        for target, amount in event_record.damage_dealt or ():
+            players[target].damage_taken += sign * amount
+            face.damage_taken += sign * amount
+            if target is not rolled_by:
+                players[rolled_by].damage_dealt += sign * amount
+                face.damage_dealt += sign * amount
+        for target, amount in event_record.healing_done or ():
+            players[target].healing += sign * amount
+            face.healing += sign * amount
+        for target, amount in event_record.vp_gained or ():
+            players[target].vp_gained += sign * amount
+            face.vp_gained += sign * amount
+        for target, amount in event_record.vp_stolen or ():
+            players[rolled_by].vp_stolen += sign * amount
+            face.vp_stolen += sign * amount
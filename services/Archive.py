@@ -0,0 +1,220 @@
+"""
+Fixed-width binary archive of game events for offline analysis, see `BinaryArchiveWriter` and `BinaryArchiveReader`.
+
+An archive is a 16 byte header followed by 12 byte little-endian records, one per event:
+
+    game_id u32 | round u16 | roller u8 | target u8 | face u8 | kind u8 | amount i16
+
+`roller` and `target` are seats (NO_SEAT when the roller acted alone or on itself), `face` a code of `services.EventLog.FACES` and `kind`
+the effect kind of `services.EventLog.RECORDED_FIELDS` (NO_AMOUNT for none). The reader maps the file and
+exposes the records without building Python objects per event: the raw `memoryview`, or a NumPy structured
+array over the same memory whose fields are strided views.
+
+NumPy is only needed for `BinaryArchiveReader.array`, install it with `pip install do-or-dice[sim]`.
+"""
+from __future__ import annotations
+import mmap
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Optional
+
+from .EventLog import FACE_CODES, RECORDED_FIELDS, NO_AMOUNT, ColumnarEventLog
+from .types import EventRecord
+
+if TYPE_CHECKING:
+    from .History import HistoryService
+
+MAGIC = b"DODEVTS\x00"
+VERSION = 1
+# magic, version, record size, padding to 16 bytes so the records are aligned
+HEADER = struct.Struct("<8sHH4x")
+RECORD = struct.Struct("<IHBBBBh")
+FIELDS = ("game_id", "round", "roller", "target", "face", "kind", "amount")
+# NumPy dtype of one record, same layout as RECORD
+DTYPE = [("game_id", "<u4"), ("round", "<u2"), ("roller", "u1"), ("target", "u1"), ("face", "u1"), ("kind", "u1"), ("amount", "<i2")]
+
+# target of an event without one
+NO_SEAT = 0xFF
+
+DEFAULT_BUFFER_BYTES = 1 << 20
+
+
+def _header() -> bytes:
+    return HEADER.pack(MAGIC, VERSION, RECORD.size)
+
+
+def _check_header(data: bytes, path: Path) -> None:
+    magic, version, record_size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise ValueError(f"{path} is not a version {VERSION} event archive")
+
+
+class BinaryArchiveWriter:
+    """
+    Docstring for BinaryArchiveWriter
+    Appends fixed-width event records to an archive, buffering `buffer_bytes` of records between writes.
+    An existing archive is continued, a trailing partial record (an interrupted write) is dropped first.
+
+    __init__ method parameters:
+    - path (str | Path): The archive file, created with its header when missing.
+    - buffer_bytes (int): Size of the write buffer, defaults to 1 MiB.
+    """
+
+    def __init__(self, path: str | Path, buffer_bytes: int = DEFAULT_BUFFER_BYTES) -> None:
+        self.path = Path(path)
+        self.buffer_bytes = buffer_bytes
+        self._buffer = bytearray()
+        self._pack = RECORD.pack
+        self._followed: dict[int, tuple[HistoryService, object]] = {}
+
+        self._file: Optional[BinaryIO] = open(self.path, "ab+")
+        size = self._file.seek(0, 2)
+        if size == 0:
+            self._file.write(_header())
+        else:
+            self._file.seek(0)
+            _check_header(self._file.read(HEADER.size), self.path)
+            partial = (size - HEADER.size) % RECORD.size
+            if partial:
+                self._file.truncate(size - partial)
+
+    def write(self, game_id: int, round: int, roller: int, target: int, face: int, kind: int, amount: int) -> None:
+        """Buffers one record, see the module docstring for the fields."""
+        self._buffer += self._pack(game_id, round, roller, target, face, kind, amount)
+        if len(self._buffer) >= self.buffer_bytes:
+            self.flush()
+
+    def write_event(self, game_id: int, event_record: EventRecord, round: int | None = None) -> None:
+        """
+        Buffers the record of one event, its first recorded amount only.
+
+        :param game_id: Id of the game the event belongs to.
+        :param event_record: The event, its players must still be seated (`Player.seat`).
+        :param round: Round of the event, defaults to the current round of the roller's state.
+        """
+        rolled_by = event_record.rolled_by
+        consumer = event_record.participants[1] if len(event_record.participants) > 1 else rolled_by
+        kind, amount = NO_AMOUNT, 0
+        for field_kind, field in enumerate(RECORDED_FIELDS, start=1):
+            effect = getattr(event_record, field)
+            if effect:
+                kind, amount = field_kind, effect[0][1]
+                break
+        self.write(
+            game_id,
+            rolled_by.state.round if round is None else round,
+            rolled_by.seat,
+            NO_SEAT if consumer is rolled_by else consumer.seat,
+            FACE_CODES[event_record.dice_face_value],
+            kind,
+            amount,
+        )
+
+    def write_log(self, game_id: int, log: ColumnarEventLog) -> int:
+        """
+        Buffers every event of a columnar log straight from its columns, no `EventRecord` is built.
+
+        :return: The number of records written.
+        """
+        seats = [NO_SEAT if player is None else player.seat for player in log.players]
+        pack, buffer = self._pack, self._buffer
+        for round, roller, target, face, kind, amount in zip(log.rounds, log.rollers, log.targets, log.faces, log.kinds, log.amounts):
+            buffer += pack(game_id, round, seats[roller], NO_SEAT if target == roller else seats[target], face, kind, amount)
+            if len(buffer) >= self.buffer_bytes:
+                self.flush()
+        return len(log)
+
+    def follow(self, history: HistoryService, game_id: int) -> None:
+        """
+        Writes every event `history` records from now on, under `game_id`, with the round it was recorded in:
+        the `GameState.round` of the roller, which `GameSession` and `TurnResolverService` advance every round.
+        """
+        listener = lambda event_id, event_record: self.write_event(game_id, event_record)
+        self._followed[game_id] = (history, listener)
+        history.subscribe(listener)
+
+    def unfollow(self, game_id: int) -> None:
+        """Stops writing the events of the history followed under `game_id`."""
+        history, listener = self._followed.pop(game_id)
+        history.unsubscribe(listener)
+
+    def flush(self) -> None:
+        """Writes the buffered records."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Stops following every history, writes the buffered records and closes the file."""
+        if self._file is None:
+            return
+        for game_id in list(self._followed):
+            self.unfollow(game_id)
+        self.flush()
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> BinaryArchiveWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class BinaryArchiveReader:
+    """
+    Docstring for BinaryArchiveReader
+    Read-only memory mapped view of an archive, scanning it never builds Python objects per event:
+    `records` is a `memoryview` of the record bytes and `array()` a NumPy structured array over the same pages.
+    A trailing partial record is ignored. The views must be dropped before `close`, the mapping cannot be
+    closed while they exist.
+
+    __init__ method parameters:
+    - path (str | Path): The archive file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        _check_header(self._mmap[:HEADER.size], self.path)
+        self.count = (len(self._mmap) - HEADER.size) // RECORD.size
+        self.records = memoryview(self._mmap)[HEADER.size:HEADER.size + self.count * RECORD.size]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> tuple[int, ...]:
+        """The fields of one record, see FIELDS."""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return RECORD.unpack_from(self.records, index * RECORD.size)
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        """Yields the fields of every record, one tuple each: for small archives, `array` scans large ones."""
+        return RECORD.iter_unpack(self.records)
+
+    def array(self):
+        """
+        The records as a NumPy structured array of DTYPE sharing the mapped memory (nothing is copied),
+        `array()["amount"]` and the other fields are strided views of it.
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:  # pragma: no cover - depends on the environment
+            raise ImportError("Array views of archives need NumPy, install it with `pip install do-or-dice[sim]`.") from exc
+        return np.frombuffer(self.records, dtype=np.dtype(DTYPE), count=self.count)
+
+    def close(self) -> None:
+        """Unmaps the archive, every view of it must have been dropped."""
+        self.records.release()
+        self._mmap.close()
+
+    def __enter__(self) -> BinaryArchiveReader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,85 @@
+"""
+Secondary indexes of the game history, see `EventIndex`.
+"""
+from __future__ import annotations
+from array import array
+from collections import defaultdict
+from functools import partial
+from typing import Optional, Sequence
+
+from models import Player, ActiveFace, FallenFace
+
+
+class EventIndex:
+    """
+    Docstring for EventIndex
+    Event ids by roller, by target, by face, by roller and face, and the id range of every round, filled by `HistoryService` as it
+    records events so a query only walks the ids of one key instead of the whole history.
+
+    The ids are kept in `array` columns, 8 bytes per entry, so indexing a columnar history keeps it compact.
+    Entries are only ever appended: an event removed from the history (an undone action) or recorded again under
+    its id keeps its old entries, `HistoryService.find_events` checks every candidate against the stored record.
+
+    Attributes:
+        by_roller (dict[Player, array[q]]): Ids of the events rolled by a player, in recording order.
+        by_target (dict[Player, array[q]]): Ids of the events affecting a player: the consumer, or the roller when
+            it acted alone.
+        by_face (dict[ActiveFace | FallenFace, array[q]]): Ids of the events of a rolled face.
+        by_roller_face (dict[tuple[Player, ActiveFace | FallenFace], array[q]]): Ids of the events of a face rolled
+            by a player, e.g. every PICKPOCKET of one opponent.
+        rounds (dict[int, list[int]]): [first id, last id] of the events recorded during a round
+            (`GameState.round` of the roller, advanced by `GameSession` and `TurnResolverService`).
+    """
+
+    __slots__ = ("by_roller", "by_target", "by_face", "by_roller_face", "rounds")
+
+    def __init__(self) -> None:
+        ids = partial(array, "q")
+        self.by_roller: defaultdict[Player, array] = defaultdict(ids)
+        self.by_target: defaultdict[Player, array] = defaultdict(ids)
+        self.by_face: defaultdict[ActiveFace | FallenFace, array] = defaultdict(ids)
+        self.by_roller_face: defaultdict[tuple[Player, ActiveFace | FallenFace], array] = defaultdict(ids)
+        self.rounds: dict[int, list[int]] = {}
+
+    def add(self, event_id: int, rolled_by: Player, dice_face_value: ActiveFace | FallenFace, target: Player) -> None:
+        """Indexes one event, `target` is the consumer or the roller itself."""
+        self.by_roller[rolled_by].append(event_id)
+        self.by_target[target].append(event_id)
+        self.by_face[dice_face_value].append(event_id)
+        self.by_roller_face[rolled_by, dice_face_value].append(event_id)
+        round = rolled_by.state.round
+        span = self.rounds.get(round)
+        if span is None:
+            self.rounds[round] = [event_id, event_id]
+        elif event_id > span[1]:
+            span[1] = event_id
+        elif event_id < span[0]:
+            span[0] = event_id
+
+    def round_ids(self, round: int) -> range:
+        """The ids from the first to the last event recorded during `round`, empty for a round without events."""
+        span = self.rounds.get(round)
+        return range(span[0], span[1] + 1) if span else range(0)
+
+    def candidates(
+        self,
+        rolled_by: Optional[Player] = None,
+        target: Optional[Player] = None,
+        dice_face_value: Optional[ActiveFace | FallenFace] = None,
+        round: Optional[int] = None,
+    ) -> Optional[Sequence[int]]:
+        """
+        The shortest id sequence of the given keys, a superset of the matching events. None without any key.
+        """
+        sequences: list[Sequence[int]] = []
+        if rolled_by is not None and dice_face_value is not None:
+            sequences.append(self.by_roller_face.get((rolled_by, dice_face_value), ()))
+        elif rolled_by is not None:
+            sequences.append(self.by_roller.get(rolled_by, ()))
+        elif dice_face_value is not None:
+            sequences.append(self.by_face.get(dice_face_value, ()))
+        if target is not None:
+            sequences.append(self.by_target.get(target, ()))
+        if round is not None:
+            sequences.append(self.round_ids(round))
+        return min(sequences, key=len) if sequences else None
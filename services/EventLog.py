@@ -0,0 +1,324 @@
+"""
+Storage of the game history: `EventDict`, a dict of `EventRecord` keeping its ids in order, and the columnar
+`ColumnarEventLog`. Both address their events by position as well as by id, see `iter_slice`.
+"""
+from __future__ import annotations
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, MutableMapping
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from models import Player, ActiveFace, FallenFace
+from .types import EventRecord
+
+# face code -> face, every face once (the FallenFace aliases share the code of their canonical member)
+FACES: tuple[ActiveFace | FallenFace, ...] = (*ActiveFace, *FallenFace)
+FACE_CODES: dict[ActiveFace | FallenFace, int] = {face: code for code, face in enumerate(FACES)}
+
+# effect kind of a row -> EventRecord field holding its amount, kind 0 (NO_AMOUNT) records no amount
+RECORDED_FIELDS = ("damage_dealt", "healing_done", "vp_gained", "vp_stolen")
+NO_AMOUNT = 0
+
+# player code of an event without consumer
+NO_PLAYER = 0
+
+
+def _positions(start: int | None, end: int | None, length: int) -> range:
+    """The positions of `sequence[start:end]` for a sequence of `length` items, without copying anything."""
+    return range(*slice(start, end).indices(length))
+
+
+class EventDict(dict):
+    """
+    Docstring for EventDict
+    The dict of event id -> `EventRecord` of `HistoryService.history`, which also keeps its ids in insertion order
+    in `ids`, so `iter_slice` reads the events at any positions in O(events read) instead of listing the dict.
+    Appending and removing the last event keep `ids` up to date in O(1), any other removal marks it stale and it
+    is rebuilt on the next positional read.
+    """
+
+    __slots__ = ("_ids", "_stale")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._ids: list[int] = list(dict.keys(self))
+        self._stale = False
+
+    @property
+    def ids(self) -> list[int]:
+        """Every event id, in insertion order."""
+        if self._stale:
+            self._ids = list(dict.keys(self))
+            self._stale = False
+        return self._ids
+
+    def iter_slice(self, start: int | None = None, end: int | None = None) -> Iterator[tuple[int, EventRecord]]:
+        """Yields the (event id, record) pairs of `list(self.items())[start:end]`, in O(pairs yielded)."""
+        ids = self.ids
+        for position in _positions(start, end, len(ids)):
+            event_id = ids[position]
+            yield event_id, dict.__getitem__(self, event_id)
+
+    def __forget(self, event_id: int) -> None:
+        ids = self._ids
+        if not self._stale and ids and ids[-1] == event_id:
+            ids.pop()
+        else:
+            self._stale = True
+
+    def __setitem__(self, event_id: int, event_record: EventRecord) -> None:
+        if event_id not in self:
+            self._ids.append(event_id)
+        dict.__setitem__(self, event_id, event_record)
+
+    def __delitem__(self, event_id: int) -> None:
+        dict.__delitem__(self, event_id)
+        self.__forget(event_id)
+
+    _MISSING = object()
+
+    def pop(self, event_id: int, default: Any = _MISSING) -> Any:
+        if event_id in self:
+            event_record = dict.pop(self, event_id)
+            self.__forget(event_id)
+            return event_record
+        if default is self._MISSING:
+            raise KeyError(event_id)
+        return default
+
+    def popitem(self) -> tuple[int, EventRecord]:
+        item = dict.popitem(self)
+        self.__forget(item[0])
+        return item
+
+    def setdefault(self, event_id: int, default: EventRecord | None = None) -> EventRecord | None:
+        if event_id not in self:
+            self[event_id] = default
+        return dict.__getitem__(self, event_id)
+
+    def update(self, other: Mapping | Iterable = (), **kwargs: Any) -> None:
+        if not isinstance(other, Mapping):
+            other = dict(other)
+        if kwargs:
+            other = {**other, **kwargs}
+        new_ids = [event_id for event_id in other if event_id not in self]
+        dict.update(self, other)
+        self._ids.extend(new_ids)
+
+    def __ior__(self, other: Mapping | Iterable) -> EventDict:
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._ids = []
+        self._stale = False
+
+    def __reduce__(self) -> tuple:
+        # rebuilt through __init__, pickle's default refills a dict subclass before its slots exist
+        return type(self), (dict(self),)
+
+
+class ColumnarEventLog(MutableMapping):
+    """
+    Docstring for ColumnarEventLog
+    Event id -> `EventRecord` mapping storing every event as one row of typed `array` columns instead of
+    one `EventRecord` per event: about 34 bytes per event instead of several hundred.
+    `EventRecord` objects are materialized on read and never kept, so reads cost an allocation each.
+
+    Columns, one entry per row:
+        ids (array[q]): Event id.
+        rounds (array[i]): `GameState.round` of the roller when the event was recorded.
+        rollers (array[i]): Player code of the roller, see `players`.
+        targets (array[i]): Player code of the consumer, NO_PLAYER when the roller acted alone.
+        faces (array[B]): Face code, index of the face in FACES.
+        kinds (array[B]): Effect kind, 1 + index in RECORDED_FIELDS of the recorded amount, NO_AMOUNT for none.
+        amounts (array[i]): The recorded amount, 0 with NO_AMOUNT.
+        times (array[q]): `time.monotonic_ns()` of the event, materialized as a `datetime` on read.
+
+    Player codes are local to the log (roster ids restart with every roster): `players[code]` is the player,
+    code 0 is NO_PLAYER. Rows keep dict semantics: a new id is appended, a recorded id is overwritten in place.
+    Lookups bisect `ids` while the ids were recorded in increasing order (the monotonic counter of
+    `HistoryService`), and go through an id -> row index built on demand otherwise.
+    `on_rewrite`, when set, is called with the id of every event overwritten or deleted.
+    """
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.rounds = array("i")
+        self.rollers = array("i")
+        self.targets = array("i")
+        self.faces = array("B")
+        self.kinds = array("B")
+        self.amounts = array("i")
+        self.times = array("q")
+        self.players: list[Optional[Player]] = [None]
+        self._codes: dict[int, int] = {}
+        # event id -> ((kind, amount), ...) beyond the first, for the rare events recording several amounts
+        self._extra_amounts: dict[int, tuple[tuple[int, int], ...]] = {}
+        # id -> row, only built once ids stopped increasing
+        self._rows: Optional[dict[int, int]] = None
+        self._ordered = True
+        self.on_rewrite: Optional[Callable[[int], Any]] = None
+        # wall clock of monotonic time 0 of this log, to materialize the time stamps
+        self._epoch = datetime.now() - timedelta(microseconds=time.monotonic_ns() // 1000)
+
+    @property
+    def columns(self) -> tuple[array, ...]:
+        """Every column, in row order: ids, rounds, rollers, targets, faces, kinds, amounts, times."""
+        return self.ids, self.rounds, self.rollers, self.targets, self.faces, self.kinds, self.amounts, self.times
+
+    def player_code(self, player: Player) -> int:
+        """The code of `player` in this log, assigned on first use."""
+        code = self._codes.get(id(player))
+        if code is None:
+            code = self._codes[id(player)] = len(self.players)
+            self.players.append(player)
+        return code
+
+    def to_datetime(self, time_ns: int) -> datetime:
+        """The wall clock time of a `times` entry."""
+        return self._epoch + timedelta(microseconds=time_ns // 1000)
+
+    def to_time_ns(self, time_stamp: datetime) -> int:
+        """The `times` entry of a wall clock time, the inverse of `to_datetime` to the microsecond."""
+        return (time_stamp - self._epoch) // timedelta(microseconds=1) * 1000
+
+    def append(
+        self,
+        event_id: int,
+        time_ns: int,
+        rolled_by: Player,
+        dice_face_value: ActiveFace | FallenFace,
+        consumer: Player | None = None,
+        damage_dealt: int | None = None,
+        healing_done: int | None = None,
+        vp_gained: int | None = None,
+        vp_stolen: int | None = None,
+    ) -> None:
+        """
+        Records an event straight from the `HistoryService.record_event` arguments, no `EventRecord` is built.
+        An id already recorded is overwritten in place.
+
+        :param event_id: Unique identifier for the event.
+        :param time_ns: `time.monotonic_ns()` of the event.
+        The other parameters are the ones of `HistoryService.record_event`.
+        """
+        amounts = [(kind, amount) for kind, amount in enumerate((damage_dealt, healing_done, vp_gained, vp_stolen), start=1)
+                   if amount is not None]
+        kind, amount = amounts[0] if amounts else (NO_AMOUNT, 0)
+        values = (
+            event_id,
+            rolled_by.state.round,
+            self.player_code(rolled_by),
+            self.player_code(consumer) if consumer else NO_PLAYER,
+            FACE_CODES[dice_face_value],
+            kind,
+            amount,
+            time_ns,
+        )
+        if len(amounts) > 1:
+            self._extra_amounts[event_id] = tuple(amounts[1:])
+        elif self._extra_amounts:
+            self._extra_amounts.pop(event_id, None)
+
+        ids = self.ids
+        if not ids or event_id > ids[-1]:
+            for column, value in zip(self.columns, values):
+                column.append(value)
+            if self._rows is not None:
+                self._rows[event_id] = len(ids) - 1
+            return
+
+        row = self._row(event_id)
+        if row is not None:
+            for column, value in zip(self.columns, values):
+                column[row] = value
+            if self.on_rewrite is not None:
+                self.on_rewrite(event_id)
+            return
+        # a new id below the last one: the ids are no longer ordered, lookups switch to the index
+        for column, value in zip(self.columns, values):
+            column.append(value)
+        self._ordered = False
+        self._rows = None
+
+    def _row(self, event_id: int) -> int | None:
+        ids = self.ids
+        if self._ordered:
+            row = bisect_left(ids, event_id)
+            return row if row < len(ids) and ids[row] == event_id else None
+        if self._rows is None:
+            self._rows = {event_id: row for row, event_id in enumerate(ids)}
+        return self._rows.get(event_id)
+
+    def record_at(self, row: int) -> EventRecord:
+        """Materializes the event stored in `row`."""
+        rolled_by = self.players[self.rollers[row]]
+        target_code = self.targets[row]
+        consumer = self.players[target_code] if target_code != NO_PLAYER else None
+        effects: dict[str, list[tuple[Player, int]]] = {}
+        kind = self.kinds[row]
+        if kind != NO_AMOUNT:
+            extra = self._extra_amounts.get(self.ids[row], ()) if self._extra_amounts else ()
+            for kind, amount in ((kind, self.amounts[row]), *extra):
+                effects[RECORDED_FIELDS[kind - 1]] = [(consumer or rolled_by, amount)]
+        return EventRecord(
+            time_stamp=self.to_datetime(self.times[row]),
+            participants=[rolled_by, consumer or rolled_by],
+            rolled_by=rolled_by,
+            dice_face_value=FACES[self.faces[row]],
+            **effects,
+        )
+
+    def iter_slice(self, start: int | None = None, end: int | None = None) -> Iterator[tuple[int, EventRecord]]:
+        """Yields the (event id, record) pairs of the rows `start:end`, in O(pairs yielded)."""
+        ids, record_at = self.ids, self.record_at
+        for row in _positions(start, end, len(ids)):
+            yield ids[row], record_at(row)
+
+    def __getitem__(self, event_id: int) -> EventRecord:
+        row = self._row(event_id)
+        if row is None:
+            raise KeyError(event_id)
+        return self.record_at(row)
+
+    def __setitem__(self, event_id: int, event_record: EventRecord) -> None:
+        rolled_by = event_record.rolled_by
+        consumer = event_record.participants[1] if len(event_record.participants) > 1 else None
+        amounts = []
+        for field in RECORDED_FIELDS:
+            effect = getattr(event_record, field)
+            amounts.append(effect[0][1] if effect else None)
+        self.append(event_id, self.to_time_ns(event_record.time_stamp), rolled_by, event_record.dice_face_value,
+                    None if consumer is rolled_by else consumer, *amounts)
+
+    def __delitem__(self, event_id: int) -> None:
+        row = self._row(event_id)
+        if row is None:
+            raise KeyError(event_id)
+        for column in self.columns:
+            del column[row]
+        if self.on_rewrite is not None:
+            self.on_rewrite(event_id)
+        if self._extra_amounts:
+            self._extra_amounts.pop(event_id, None)
+        if self._rows is not None:
+            if row == len(self.ids):
+                del self._rows[event_id]
+            else:
+                self._rows = None
+
+    def __contains__(self, event_id: object) -> bool:
+        return isinstance(event_id, int) and self._row(event_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __repr__(self) -> str:
+        return f"ColumnarEventLog(events={len(self.ids)}, players={len(self.players) - 1})"
@@ -0,0 +1,246 @@
+"""
+Streaming export of the game history as NDJSON, see `NdjsonHistoryWriter`.
+"""
+from __future__ import annotations
+import json
+import os
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Optional
+
+from .types import EventRecord
+
+if TYPE_CHECKING:
+    from .History import HistoryService, EventListener
+
+# (field, key) of the effect lists of an EventRecord, written as [[target name, amount], ...]
+_EFFECTS = (("damage_dealt", "dmg"), ("healing_done", "heal"), ("vp_gained", "vp"), ("vp_stolen", "steal"))
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_FLUSH_EVERY = 1024
+
+
+def event_to_json(event_id: int, event_record: EventRecord, game: int = 0) -> dict:
+    """
+    The compact JSON object of one event: game, id, time stamp, roller, face, target when the roller
+    affected someone else, and the non-empty effects as [[target, amount], ...], players by name.
+    Event ids restart with every game, (game, id) identifies an event of a multi-game export.
+    """
+    rolled_by = event_record.rolled_by
+    line = {
+        "game": game,
+        "id": event_id,
+        "ts": event_record.time_stamp.isoformat(),
+        "by": rolled_by.name,
+        "face": event_record.dice_face_value.name,
+    }
+    participants = event_record.participants
+    if len(participants) > 1 and participants[1] is not rolled_by:
+        line["to"] = participants[1].name
+    for field, key in _EFFECTS:
+        effect = getattr(event_record, field)
+        if effect:
+            line[key] = [[target.name, amount] for target, amount in effect]
+    return line
+
+
+class NdjsonHistoryWriter:
+    """
+    Docstring for NdjsonHistoryWriter
+    Streams recorded events to NDJSON files, one compact JSON object per line (see `event_to_json`), as a
+    `HistoryService` listener. Lines are buffered and written `flush_every` at a time, so memory stays bounded by
+    one batch however many events a simulation records, and nothing is fsynced per event. Files are rotated
+    once they would grow past `max_bytes`: `<prefix>-000000.ndjson`, `<prefix>-000001.ndjson`, ...
+
+    Every line carries the number of its game, event ids restart with every `HistoryService`: the first history
+    attached is game `game`, every later `attach` starts the next game unless given its number. `write`, the
+    listener to subscribe by hand, writes under `game`.
+
+    With `resume`, the writer continues the newest file of `directory` instead of starting a new series: a line
+    cut off by a crash is dropped, `game` is the game of the last complete line (of an older file when the newest
+    has none) and `last_event_id` its id, events of that game up to it are skipped when written again (the first
+    `attach` continues that game). Ids must therefore grow within a game, like the ones of
+    `HistoryService.next_event_id`.
+
+    __init__ method parameters:
+    - directory (str | Path): Where the files go, created when missing.
+    - prefix (str): File name prefix, defaults to "history".
+    - max_bytes (int): Size a file is rotated at, defaults to 64 MiB. A single line longer than that gets a file of its own.
+    - flush_every (int): Number of buffered lines written at once, defaults to 1024.
+    - resume (bool): Continue the newest existing file and skip the events it already holds, defaults to True.
+      False starts a new file after the existing ones.
+    - fsync (bool): fsync the file after every batch (never per event) and on rotation, for durable exports.
+      Defaults to False, the operating system decides when the data reaches the disk.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        prefix: str = "history",
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        resume: bool = True,
+        fsync: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.flush_every = flush_every
+        self.fsync = fsync
+        self.game = 0
+        # game -> id of its last exported event, the resume watermark
+        self.last_event_ids: dict[int, int] = {}
+        self.events_written = 0
+        self._attached: dict[int, tuple[HistoryService, EventListener]] = {}
+        self._attaches = 0
+        self._buffer: list[bytes] = []
+        self._encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        existing = self.files()
+        self._index = 0
+        if existing and resume:
+            self._index = self._file_index(existing[-1])
+            # the newest file holds no complete line when the crash followed a rotation, the previous one does
+            for path in reversed(existing):
+                recovered = self._recover(path)
+                if recovered is not None:
+                    self.game, self.last_event_ids[self.game] = recovered
+                    break
+        elif existing:
+            self._index = self._file_index(existing[-1]) + 1
+        self._file: Optional[BinaryIO] = None
+        self._size = 0
+        self._open()
+
+    def files(self) -> list[Path]:
+        """Every file of the series, oldest first."""
+        return sorted(self.directory.glob(f"{self.prefix}-[0-9][0-9][0-9][0-9][0-9][0-9].ndjson"))
+
+    @property
+    def path(self) -> Path:
+        """The file being written."""
+        return self.directory / f"{self.prefix}-{self._index:06d}.ndjson"
+
+    @staticmethod
+    def _file_index(path: Path) -> int:
+        return int(path.stem.rsplit("-", 1)[1])
+
+    @property
+    def last_event_id(self) -> int:
+        """The id of the last event exported for `game`, 0 before its first one."""
+        return self.last_event_ids.get(self.game, 0)
+
+    @staticmethod
+    def _recover(path: Path) -> tuple[int, int] | None:
+        """Drops a trailing partial line of `path` and returns the (game, id) of its last complete line, None when it has none."""
+        with open(path, "rb+") as file:
+            end = file.seek(0, os.SEEK_END)
+            chunk = b""
+            position = end
+            # read backwards until the chunk holds the last newline and the one before it, or the file start
+            while position > 0 and chunk.count(b"\n") < 2:
+                step = min(position, 64 * 1024)
+                position -= step
+                file.seek(position)
+                chunk = file.read(step) + chunk
+            complete = chunk.rfind(b"\n") + 1
+            if position + complete != end:
+                file.truncate(position + complete)
+            lines = chunk[:complete].splitlines()
+        if not lines:
+            return None
+        last = json.loads(lines[-1])
+        return last.get("game", 0), last["id"]
+
+    def _open(self) -> None:
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+
+    def _rotate(self) -> None:
+        self._close_file()
+        self._index += 1
+        self._open()
+
+    def _close_file(self) -> None:
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._file.close()
+
+    def write(self, event_id: int, event_record: EventRecord) -> None:
+        """Buffers one event of `game`, the `HistoryService` listener. Events already exported (resume) are skipped."""
+        self.write_game(self.game, event_id, event_record)
+
+    def write_game(self, game: int, event_id: int, event_record: EventRecord) -> None:
+        """Buffers one event of `game`, skipped when the game already exported it (resume)."""
+        if event_id <= self.last_event_ids.get(game, 0):
+            return
+        self._buffer.append(self._encode(event_to_json(event_id, event_record, game)).encode() + b"\n")
+        self.last_event_ids[game] = event_id
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered lines, rotating the file where it would grow past `max_bytes`."""
+        if not self._buffer:
+            return
+        batch: list[bytes] = []
+        size = self._size
+        for line in self._buffer:
+            if size + len(line) > self.max_bytes and size > 0:
+                self._file.write(b"".join(batch))
+                self._rotate()
+                batch, size = [], 0
+            batch.append(line)
+            size += len(line)
+        self._file.write(b"".join(batch))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._size = size
+        self.events_written += len(self._buffer)
+        self._buffer.clear()
+
+    def attach(self, history: HistoryService, game: int | None = None) -> int:
+        """
+        Exports the events of `history` not exported yet, then follows it as a listener.
+
+        :param history: The history of one game.
+        :param game: Number of the game, defaults to `game` for the first history attached (the resumed game)
+            and to one more than the last game for the next ones.
+        :return: The number of the game, it becomes `game`.
+        """
+        if game is None:
+            game = self.game if self._attaches == 0 else max(self.last_event_ids, default=self.game) + 1
+        self._attaches += 1
+        self.game = game
+        listener = partial(self.write_game, game)
+        for event_id, event_record in history.iter_events():
+            listener(event_id, event_record)
+        history.subscribe(listener)
+        self._attached[id(history)] = (history, listener)
+        return game
+
+    def detach(self, history: HistoryService) -> None:
+        """Stops following `history` and writes what is buffered."""
+        _, listener = self._attached.pop(id(history))
+        history.unsubscribe(listener)
+        self.flush()
+
+    def close(self) -> None:
+        """Writes what is buffered and closes the file."""
+        if self._file is None:
+            return
+        for history, listener in self._attached.values():
+            history.unsubscribe(listener)
+        self._attached.clear()
+        self.flush()
+        self._close_file()
+        self._file = None
+
+    def __enter__(self) -> NdjsonHistoryWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
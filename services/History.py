@@ -1,12 +1,24 @@
 from __future__ import annotations
 from models import Player, ActiveFace, FallenFace
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Iterable, Iterator, Optional
 from datetime import datetime
+import time
 from dataclasses import dataclass
-from utils import InputDataValidator
+from utils import InputDataValidator, GameStateValidator
 from utils.valdidators import EventRecordValidator  # to aviod circular import
 from collections import defaultdict
 from .types import EventRecord
+from .EventLog import EventDict, ColumnarEventLog
+from .EventIndex import EventIndex
+from .Aggregates import EventAggregates
+from .types import EventTotals
+
+# the arguments of HistoryService.record_event after event_id:
+# (rolled_by, dice_face_value, consumer, damage_dealt, healing_done, vp_gained, vp_stolen)
+EventArgs = tuple[Player, ActiveFace | FallenFace, Optional[Player], Optional[int], Optional[int], Optional[int], Optional[int]]
+
+# called with (event_id, record) after every recorded event, see HistoryService.subscribe
+EventListener = Callable[[int, EventRecord], Any]
 
 
 class HistoryService:
@@ -22,15 +34,67 @@ class HistoryService:
             "healing_done": None,
             "vp_gained": None,
             "vp_stolen": None
+    __init__ method parameters:
+    - validate (bool): Validate every recorded event with `EventRecordValidator`, defaults to True.
+      Trusted engine driven simulations turn it off, their events are well formed by construction.
+    - columnar (bool): Store the events in a `ColumnarEventLog` (typed array columns, records materialized on read)
+      instead of a dict of `EventRecord`, for long games and simulated batches. Defaults to False.
+    - indexed (bool): Add every recorded event to `index` (roller, target, face and round -> event ids, see
+      `find_events`) and count it in `aggregates` (running totals per player and per face, see `player_totals`).
+      Events removed or overwritten through the service are taken back out of the totals, see `remove_event`.
+      Defaults to True, simulations that never query their history turn it off.
     """
 
-    def __init__(self):
-        self.history: Dict[int, EventRecord] = {}
+    def __init__(self, validate: bool = True, columnar: bool = False, indexed: bool = True):
+        self.history: EventDict | ColumnarEventLog = ColumnarEventLog() if columnar else EventDict()
+        self.validate = validate
+        self.columnar = columnar
+        # ids are handed out by a monotonic counter, never derived from len(history)
+        self._next_event_id = 1
+        # event id -> (record, its refine_event lines), the record is None for a columnar history: its records are
+        # materialized per read, so the lines stay valid until the log reports the event rewritten
+        self._rendered: Dict[int, tuple[EventRecord | None, list[str]]] = {}
+        if columnar:
+            self.history.on_rewrite = self.__forget_rendered
+        self.listeners: list[EventListener] = []
+        self.indexed = indexed
+        self.index: EventIndex | None = EventIndex() if indexed else None
+        self.aggregates: EventAggregates | None = EventAggregates() if indexed else None
         ...
 
-    def record_event(
-        self,
-        event_id: int,
+    def subscribe(self, listener: EventListener) -> None:
+        """
+        Calls `listener(event_id, record)` after every event recorded from now on, in recording order.
+        A columnar history only builds the records handed to listeners while it has some.
+        """
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener: EventListener) -> None:
+        """Stops calling `listener`."""
+        self.listeners.remove(listener)
+
+    def __notify(self, event_id: int, event_record: EventRecord) -> None:
+        for listener in self.listeners:
+            listener(event_id, event_record)
+
+    def next_event_id(self) -> int:
+        """
+        Allocates the id of the next event: one more than any id handed out or recorded so far.
+
+        :return: The new event id.
+        """
+        event_id = self._next_event_id
+        self._next_event_id = event_id + 1
+        return event_id
+
+    @property
+    def last_event_id(self) -> int:
+        """The id handed out or recorded last, 0 before the first event."""
+        return self._next_event_id - 1
+
+    @staticmethod
+    def __build_record(
+        time_stamp: datetime,
         rolled_by: Player,
         dice_face_value: ActiveFace | FallenFace,
         consumer: Player | None = None,
@@ -38,22 +102,7 @@ class HistoryService:
         healing_done: int | None = None,
         vp_gained: int | None = None,
         vp_stolen: int | None = None,
-    ) -> bool | InputDataValidator:
-        """
-
-        Records an event in the game history.
-
-        :param event_id: Unique identifier for the event.
-        :param rolled_by: Player who rolled the dice.
-        :param dice_face_value: The face value of the dice rolled.
-        :param consumer: Player who is the target/consumer of the dice effect, Default is None.
-        :param damage_dealt: Amount of damage dealt, Default is None.
-        :param healing_done: Amount of healing done, Default is None.
-        :param vp_gained: Victory points gained, Default is None.
-        :param vp_stolen: Victory points stolen, Default is None.
-        :return: True if the event was recorded successfully, False otherwise.
-
-        """
+    ) -> EventRecord:
         participants = [rolled_by]
 
         if consumer:
@@ -73,25 +122,77 @@ class HistoryService:
             )  # assuming that sometimes consumer/target can be none when backfire happens so here in such scenario roller is the target iteself
             return [(t, amount)]
 
-        damage_list = _to_effect_list(damage_dealt, consumer)
-        healing_list = _to_effect_list(healing_done, consumer)
-        vp_gained_list = _to_effect_list(vp_gained, consumer)
-        vp_stolen_list = _to_effect_list(vp_stolen, consumer)
-
-        event_record = EventRecord(
-            time_stamp=datetime.now(),
+        return EventRecord(
+            time_stamp=time_stamp,
             participants=participants,
             rolled_by=rolled_by,
             dice_face_value=dice_face_value,
-            damage_dealt=damage_list,
-            healing_done=healing_list,
-            vp_gained=vp_gained_list,
-            vp_stolen=vp_stolen_list,
+            damage_dealt=_to_effect_list(damage_dealt, consumer),
+            healing_done=_to_effect_list(healing_done, consumer),
+            vp_gained=_to_effect_list(vp_gained, consumer),
+            vp_stolen=_to_effect_list(vp_stolen, consumer),
         )
 
+    def record_event(
+        self,
+        event_id: int,
+        rolled_by: Player,
+        dice_face_value: ActiveFace | FallenFace,
+        consumer: Player | None = None,
+        damage_dealt: int | None = None,
+        healing_done: int | None = None,
+        vp_gained: int | None = None,
+        vp_stolen: int | None = None,
+    ) -> bool | InputDataValidator:
+        """
+
+        Records an event in the game history.
+
+        :param event_id: Unique identifier for the event.
+        :param rolled_by: Player who rolled the dice.
+        :param dice_face_value: The face value of the dice rolled.
+        :param consumer: Player who is the target/consumer of the dice effect, Default is None.
+        :param damage_dealt: Amount of damage dealt, Default is None.
+        :param healing_done: Amount of healing done, Default is None.
+        :param vp_gained: Victory points gained, Default is None.
+        :param vp_stolen: Victory points stolen, Default is None.
+        :return: True if the event was recorded successfully, False otherwise.
+
+        """
+        if event_id >= self._next_event_id:
+            self._next_event_id = event_id + 1
+        # the record this event overwrites, taken out of the totals once the event is stored
+        previous = self.__stored(event_id) if self.indexed else None
+        if self.columnar and not self.validate:
+            # straight into the columns, no EventRecord is built
+            self.history.append(
+                event_id, time.monotonic_ns(), rolled_by, dice_face_value, consumer, damage_dealt, healing_done, vp_gained, vp_stolen
+            )
+            if self.indexed:
+                self.__track(event_id, previous, rolled_by, dice_face_value, consumer, damage_dealt, healing_done, vp_gained, vp_stolen)
+            if self.listeners:
+                self.__notify(event_id, self.history[event_id])
+            return True
+
+        event_record = self.__build_record(
+            datetime.now(), rolled_by, dice_face_value, consumer, damage_dealt, healing_done, vp_gained, vp_stolen
+        )
+
+        if not self.validate:
+            self.history[event_id] = event_record
+            if self.indexed:
+                self.__track(event_id, previous, rolled_by, dice_face_value, consumer, damage_dealt, healing_done, vp_gained, vp_stolen)
+            if self.listeners:
+                self.__notify(event_id, event_record)
+            return True
+
         try:
             if EventRecordValidator.validate(event_record):
                 self.history[event_id] = event_record
+                if self.indexed:
+                    self.__track(event_id, previous, rolled_by, dice_face_value, consumer, damage_dealt, healing_done, vp_gained, vp_stolen)
+                if self.listeners:
+                    self.__notify(event_id, event_record)
                 return True
         except InputDataValidator as e:
             print(f"Failed to record event {event_id}: {e}")
@@ -99,21 +200,191 @@ class HistoryService:
 
         return False
 
+    def record_events(self, events: Iterable[EventArgs]) -> list[int]:
+        """
+        Records a batch of events in order, with ids from the monotonic counter.
+        The batch shares one time stamp and reaches `history` in a single update, events failing validation
+        are reported and skipped like in `record_event`.
+
+        :param events: The `record_event` arguments after `event_id` of every event:
+            (rolled_by, dice_face_value, consumer, damage_dealt, healing_done, vp_gained, vp_stolen).
+        :return: The ids of the recorded events.
+        """
+        event_id = self._next_event_id
+        # batch ids come from the counter, so they never overwrite a recorded event
+        indexed = self.indexed
+        if indexed:
+            index, count = self.index.add, self.aggregates.add
+        if self.columnar and not self.validate:
+            time_ns, append, first = time.monotonic_ns(), self.history.append, event_id
+            for event in events:
+                append(event_id, time_ns, *event)
+                if indexed:
+                    index(event_id, event[0], event[1], event[2] or event[0])
+                    count(*event)
+                event_id += 1
+            self._next_event_id = event_id
+            if self.listeners and event_id > first:
+                for recorded_id, event_record in self.history.iter_slice(first - event_id):
+                    self.__notify(recorded_id, event_record)
+            return list(range(first, event_id))
+
+        time_stamp = datetime.now()
+        build, validate = self.__build_record, self.validate
+        batch: Dict[int, EventRecord] = {}
+        for event in events:
+            event_record = build(time_stamp, *event)
+            if validate:
+                try:
+                    EventRecordValidator.validate(event_record)
+                except InputDataValidator as e:
+                    print(f"Failed to record event {event_id}: {e}")
+                    event_id += 1
+                    continue
+            batch[event_id] = event_record
+            if indexed:
+                index(event_id, event[0], event[1], event[2] or event[0])
+                count(*event)
+            event_id += 1
+        self._next_event_id = event_id
+        self.history.update(batch)
+        if self.listeners:
+            for recorded_id, event_record in batch.items():
+                self.__notify(recorded_id, event_record)
+        return list(batch)
+
+    def __stored(self, event_id: int) -> EventRecord | None:
+        """The record stored under `event_id`, None for an id not recorded yet."""
+        history = self.history
+        if self.columnar:
+            # the log appends any id above its last one, like ColumnarEventLog.append
+            ids = history.ids
+            if not ids or event_id > ids[-1]:
+                return None
+        return history.get(event_id)
+
+    def __track(self, event_id: int, previous: EventRecord | None, *event: Any) -> None:
+        """Indexes and counts a stored event given by its `record_event` arguments, `previous` is the record it overwrote."""
+        if previous is not None:
+            self.aggregates.add_record(previous, -1)
+        rolled_by, dice_face_value, consumer = event[:3]
+        self.index.add(event_id, rolled_by, dice_face_value, consumer or rolled_by)
+        self.aggregates.add(*event)
+
+    def __require_index(self) -> None:
+        if not self.indexed:
+            raise GameStateValidator("The history keeps no index or totals, create it with indexed=True")
+
+    def remove_event(self, event_id: int) -> EventRecord | None:
+        """
+        Removes an event from the history and takes it out of the totals, e.g. to undo its action.
+
+        :param event_id: Id of the event.
+        :return: The removed record, None when no event has this id.
+        """
+        event_record = self.history.pop(event_id, None)
+        if event_record is not None and self.indexed:
+            self.aggregates.add_record(event_record, -1)
+        return event_record
+
+    def restore_event(self, event_id: int, event_record: EventRecord) -> None:
+        """Puts an event taken out by `remove_event` back under its id, and back into the totals."""
+        previous = self.__stored(event_id) if self.indexed else None
+        self.history[event_id] = event_record
+        if self.indexed:
+            if previous is not None:
+                self.aggregates.add_record(previous, -1)
+            self.aggregates.add_record(event_record)
+
+    def player_totals(self, player: Player) -> EventTotals:
+        """
+        The running totals of `player` (damage dealt and taken, healing, vp gained and stolen), in O(1).
+        The object stays up to date as events are recorded, read it without modifying it.
+        """
+        self.__require_index()
+        return self.aggregates.players[player]
+
+    def face_totals(self, dice_face_value: ActiveFace | FallenFace) -> EventTotals:
+        """The running totals of the events of a face, in O(1), see `player_totals`."""
+        self.__require_index()
+        return self.aggregates.faces[dice_face_value]
+
     def get_events(self, start: int | None = None, end: int | None = None) -> Dict[int, EventRecord]:
         """
         Retrieves the entire game history of events with provided index range.
+        Costs O(events returned): the events are addressed by position, the history is never listed.
+
+        :return: Dictionary of event_id to EventRecord.
+        """
+        return dict(self.history.iter_slice(start, end))
+
+    def tail(self, count: int = 1) -> Dict[int, EventRecord]:
+        """
+        The last `count` events, in O(count).
 
+        :param count: Number of events, fewer are returned when fewer were recorded.
         :return: Dictionary of event_id to EventRecord.
         """
-        event_records = list(self.history.items())[start:end]
-        
-        return dict(event_records)
+        if count <= 0:
+            return {}
+        return dict(self.history.iter_slice(-count))
+
+    def iter_events(self, start: int | None = None, end: int | None = None) -> Iterator[tuple[int, EventRecord]]:
+        """
+        Iterates over the (event_id, EventRecord) pairs of the index range `start:end` without copying the
+        history, each step costs O(1).
+        """
+        return self.history.iter_slice(start, end)
+
+    def find_events(
+        self,
+        rolled_by: Player | None = None,
+        target: Player | None = None,
+        dice_face_value: ActiveFace | FallenFace | None = None,
+        round: int | None = None,
+    ) -> Dict[int, EventRecord]:
+        """
+        The events matching every given filter, in recording order, looked up through `index`: costs
+        O(events of the most selective filter) instead of a walk over the whole history.
+        e.g. `find_events(target=ben)` for everything done to Ben, `find_events(ana, dice_face_value=ActiveFace.PICKPOCKET)`.
+
+        :param rolled_by: Player who rolled the dice.
+        :param target: Player affected by the event: its consumer, or the roller when it acted alone.
+        :param dice_face_value: The face rolled.
+        :param round: Round the events were recorded in, its events are the ids of `index.round_ids(round)`.
+        :return: Dictionary of event_id to EventRecord, the whole history without any filter.
+        """
+        self.__require_index()
+        candidates = self.index.candidates(rolled_by, target, dice_face_value, round)
+        if candidates is None:
+            return self.get_events()
+        round_ids = self.index.round_ids(round) if round is not None else None
+        found: Dict[int, EventRecord] = {}
+        get = self.history.get
+        for event_id in candidates:
+            # index entries outlive removed or rewritten events, the stored record decides
+            event_record = get(event_id)
+            if (
+                event_record is None
+                or (rolled_by is not None and event_record.rolled_by is not rolled_by)
+                or (target is not None and event_record.participants[1] is not target)
+                or (dice_face_value is not None and event_record.dice_face_value is not dice_face_value)
+                or (round_ids is not None and event_id not in round_ids)
+            ):
+                continue
+            found[event_id] = event_record
+        return found
 
     def refine_event(self, history: Dict[int, EventRecord], **kwargs) -> list[str]:
         """
         Docstring for refine_event
         This method processes the raw event history and generates human-readable descriptions of each event to display in the pygames ui.
 
+        The lines of every event are cached by event id with the record they were rendered from, so only
+        events not rendered yet, or rewritten since (another record stored under their id), are rendered.
+        Records are never modified in place, a rewrite always stores a new one. A columnar history reports
+        its rewrites itself, its events are expected to be read from it.
+
         :param self: Description
         :param history: Description
         :type history: Dict[int, EventRecord]
@@ -121,47 +392,60 @@ class HistoryService:
         :return: Description
         :rtype: list[str]
         """
-        refined_events = []
+        refined_events: list[str] = []
+        rendered, render, columnar = self._rendered, self.__render, self.columnar
         for k, v in history.items():
-            if v.damage_dealt:
-                for target, amount in v.damage_dealt:
-                    refined_events.append(
-                        f" {v.rolled_by.name} got {v.dice_face_value.name} and dealt -{amount} damage to {target.name}."
-                    )
+            kept = None if columnar else v
+            cached = rendered.get(k)
+            if cached is None or cached[0] is not kept:
+                cached = rendered[k] = (kept, render(v))
+            refined_events.extend(cached[1])
+        return refined_events
 
-            if v.healing_done:
-                for target, amount in v.healing_done:
-                    refined_events.append(
-                        f" {v.rolled_by.name} got {v.dice_face_value.name} and healed +{amount} health to {target.name}."
-                    )
+    def __forget_rendered(self, event_id: int) -> None:
+        self._rendered.pop(event_id, None)
 
-            if v.vp_gained:
-                for target, amount in v.vp_gained:
-                    if target is v.rolled_by:
-                        refined_events.append(
-                            f" {v.rolled_by.name} got {v.dice_face_value.name} and gained +{amount} VP."
-                        )
-                    else:
-                        refined_events.append(
-                            f" {v.rolled_by.name} got {v.dice_face_value.name} and gave +{amount} VP to {target.name}."
-                        )
-            if v.vp_stolen:
-                for target, amount in v.vp_stolen:
-                    refined_events.append(
-                        f" {v.rolled_by.name} got {v.dice_face_value.name} and stole -{amount} VP from {target.name}."
-                    )
+    @staticmethod
+    def __render(v: EventRecord) -> list[str]:
+        lines = []
+        if v.damage_dealt:
+            for target, amount in v.damage_dealt:
+                lines.append(
+                    f" {v.rolled_by.name} got {v.dice_face_value.name} and dealt -{amount} damage to {target.name}."
+                )
+
+        if v.healing_done:
+            for target, amount in v.healing_done:
+                lines.append(
+                    f" {v.rolled_by.name} got {v.dice_face_value.name} and healed +{amount} health to {target.name}."
+                )
 
-            if not (v.damage_dealt or v.healing_done or v.vp_gained or v.vp_stolen):
-                # infer a consumer/target where possible (second participant) else rolled_by
-                target = v.participants[1] if len(v.participants) > 1 else v.rolled_by
+        if v.vp_gained:
+            for target, amount in v.vp_gained:
                 if target is v.rolled_by:
-                    refined_events.append(
-                        f" {v.rolled_by.name} got {v.dice_face_value.name} and it had no effect."
+                    lines.append(
+                        f" {v.rolled_by.name} got {v.dice_face_value.name} and gained +{amount} VP."
                     )
                 else:
-                    refined_events.append(
-                        f" {v.rolled_by.name} got {v.dice_face_value.name} but it had no effect on {target.name}."
+                    lines.append(
+                        f" {v.rolled_by.name} got {v.dice_face_value.name} and gave +{amount} VP to {target.name}."
                     )
+        if v.vp_stolen:
+            for target, amount in v.vp_stolen:
+                lines.append(
+                    f" {v.rolled_by.name} got {v.dice_face_value.name} and stole -{amount} VP from {target.name}."
+                )
 
+        if not (v.damage_dealt or v.healing_done or v.vp_gained or v.vp_stolen):
+            # infer a consumer/target where possible (second participant) else rolled_by
+            target = v.participants[1] if len(v.participants) > 1 else v.rolled_by
+            if target is v.rolled_by:
+                lines.append(
+                    f" {v.rolled_by.name} got {v.dice_face_value.name} and it had no effect."
+                )
+            else:
+                lines.append(
+                    f" {v.rolled_by.name} got {v.dice_face_value.name} but it had no effect on {target.name}."
+                )
 
-        return refined_events
\ No newline at end of file
+        return lines
\ No newline at end of file
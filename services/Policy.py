@@ -0,0 +1,91 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Sequence
+import random
+from models import Player, ActiveFace, FallenFace
+from helpers import derive_seed
+
+
+POWER_MOVE_CHOICES = ("damage_hp", "gain_vp")
+BLESS_CHOICES = ("heal_hp", "gain_vp")
+CURSE_CHOICES = ("damage_hp", "steal_vp")
+
+
+class DecisionPolicy(ABC):
+    """
+    Docstring for services.policy:
+    Base class for everything that takes the in-game decisions of a player instead of a human,
+    so a game can be driven without `input()` or the pygame ui.
+    Sub classes implement the three abstract choose methods, an incomplete one cannot be instantiated.
+    `reset` is called once at the start of every game.
+    """
+
+    def reset(self, seed: int) -> None:
+        """
+        Prepares the policy for a new game.
+
+        :param seed: The seed of the game about to be played.
+        """
+        ...
+
+    @abstractmethod
+    def choose_target(self, player: Player, face: ActiveFace | FallenFace, candidates: Sequence[Player]) -> Player:
+        """
+        Picks the target of a targeted face.
+
+        :param player: The player whose turn it is.
+        :param face: The rolled face.
+        :param candidates: Valid targets, never empty.
+        :return: One of `candidates`.
+        """
+        ...
+
+    @abstractmethod
+    def choose_power_move(self, player: Player, candidates: Sequence[Player]) -> str:
+        """
+        Picks the POWER_MOVE option.
+
+        :param player: The player whose turn it is.
+        :param candidates: Valid targets for the damage option, never empty.
+        :return: 'damage_hp' or 'gain_vp'.
+        """
+        ...
+
+    @abstractmethod
+    def choose_fallen_option(self, player: Player, face: FallenFace, target: Player) -> str:
+        """
+        Picks the option of a fallen buff or curse face for an already chosen target.
+
+        :param player: The fallen player whose turn it is.
+        :param face: The rolled fallen face.
+        :param target: The chosen alive target.
+        :return: 'heal_hp' or 'gain_vp' for a buff, 'damage_hp' or 'steal_vp' for a curse.
+        """
+        ...
+
+
+class RandomPolicy(DecisionPolicy):
+    """
+    Policy that picks every target and option uniformly at random.
+    Its choices come from their own "policy" stream, so they never shift the dice rolls of the game.
+
+    __init__ method parameters:
+    - seed (int | None): Seed of the choice stream until the next `reset`.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        self._rng = random.Random(None if seed is None else derive_seed(seed, "policy"))
+
+    def reset(self, seed: int) -> None:
+        self._rng.seed(derive_seed(seed, "policy"))
+
+    def choose_target(self, player: Player, face: ActiveFace | FallenFace, candidates: Sequence[Player]) -> Player:
+        return self._rng.choice(candidates)
+
+    def choose_power_move(self, player: Player, candidates: Sequence[Player]) -> str:
+        return self._rng.choice(POWER_MOVE_CHOICES)
+
+    def choose_fallen_option(self, player: Player, face: FallenFace, target: Player) -> str:
+        if face in (FallenFace.PLUS2HP_OR_PLUS1VP, FallenFace.PLUS2HP_OR_PLUS1VP_2):
+            return self._rng.choice(BLESS_CHOICES)
+        return self._rng.choice(CURSE_CHOICES)
@@ -1,9 +1,13 @@
 from typing import Dict, TypedDict, List
 from models.Player import Player
+from models.Roster import PlayerRoster
+from models.Standings import standing_key
 from utils.exceptions import InputDataValidator
+from utils.descriptors import hybridmethod
 
 
 class RankRecord(TypedDict):
+    player_id: int
     player_name: str
     vp_count: int
     rank: int
@@ -11,38 +15,50 @@ class RankRecord(TypedDict):
 
 
 class IngameRankService:
-    """Ranking service that derives ordered rank records from Player.player_arrangement."""
+    """Ranking service that derives ordered rank records from a list of players.
 
+    A service created with `players` (e.g. by a `GameSession`) owns its ranks. Without players, and when the
+    methods are called on the class, the shared default ranks of `Player.player_arrangement` are used.
+    `ranks` is always updated in place, so every holder of it sees the current ranking.
+    Records are also indexed by player id, and players are looked up in their `PlayerRoster` by id,
+    so refreshing the data and `player_rank` never scan the players.
+    """
+
+    players: PlayerRoster = Player.player_arrangement
     ranks: Dict[int, RankRecord] = {}
+    records: Dict[int, RankRecord] = {}
 
-    def __init__(self):
-        ...
+    def __init__(self, players: List[Player] | None = None):
+        if players is not None:
+            self.players = players if isinstance(players, PlayerRoster) else PlayerRoster(players)
+            self.ranks = {}
+            self.records = {}
 
-    @classmethod
-    def initiate_ranks(cls) -> None:
-        """Populate `ranks` from current Player.player_arrangement.
+    @hybridmethod
+    def initiate_ranks(self) -> None:
+        """Populate `ranks` from the current players.
 
         The resulting dict maps ordinal rank (1-based) -> RankRecord but is not
         guaranteed to be sorted by VP; use `update_ranks` to sort by VP/hp.
         """
-        cls.ranks.clear()
-        for rank, player in enumerate(Player.player_arrangement, start=1):
-            cls.ranks[rank] = {
+        self.ranks.clear()
+        for rank, player in enumerate(self.players, start=1):
+            self.ranks[rank] = {
+                "player_id": player.player_id,
                 "player_name": player.name,
                 "vp_count": player.vp,
                 "rank": rank,
                 "hp": player.hp,
             }
+        self.__index_records()
 
-    @staticmethod
-    def __update_ranks() -> bool:
+    @hybridmethod
+    def __update_ranks(self) -> bool:
         """Rebuild `ranks` sorted by vp_count desc, then hp desc."""
         # sorting by vp in desc order then hp desc and if hp ties then player_name asc for  tiebreaking
         sorted_rankings = sorted(
-            IngameRankService.ranks.items(),
-            key=lambda item: (
-                -item[1]["vp_count"], -item[1]["hp"], item[1]["player_name"]
-            ),
+            self.ranks.items(),
+            key=lambda item: standing_key(item[1]["vp_count"], item[1]["hp"], item[1]["player_name"]),
         )
 
         new_ranks: Dict[int, RankRecord] = {}
@@ -50,52 +66,66 @@ class IngameRankService:
             new_ranks[rank] = value.copy()
             new_ranks[rank]["rank"] = rank
 
-        IngameRankService.ranks = new_ranks
+        self.ranks.clear()
+        self.ranks.update(new_ranks)
+        self.__index_records()
         return True
 
-    @classmethod # this is just used for wrting test case please donot use this in other places while orchestrating actual update method is __Update private method used by check rank method
-    def update_ranks(cls) -> bool:
+    @hybridmethod
+    def __index_records(self) -> None:
+        # player id -> the record currently stored in `ranks`, updated in place like `ranks`
+        self.records.clear()
+        self.records.update((record["player_id"], record) for record in self.ranks.values())
+
+    @hybridmethod # this is just used for wrting test case please donot use this in other places while orchestrating actual update method is __Update private method used by check rank method
+    def update_ranks(self) -> bool:
         """Public API to recompute and store ranks based on current `ranks` data.
 
         Returns True when the update completes.
         """
-        return cls.__update_ranks()
+        return self.__update_ranks()
 
-    @staticmethod
-    def check_rank() -> bool:
+    @hybridmethod
+    def check_rank(self) -> bool:
         """Return True and update ranks if ordering has changed."""
 
         # always refresh the data before checking
-        IngameRankService.__update_data()
+        self.__update_data()
         sorted_rankings = sorted(
-            IngameRankService.ranks.items(),
-            key=lambda item: (
-                -item[1]["vp_count"], -item[1]["hp"], item[1]["player_name"]
-            ),
+            self.ranks.items(),
+            key=lambda item: standing_key(item[1]["vp_count"], item[1]["hp"], item[1]["player_name"]),
         )
 
         for rank, (key, _) in enumerate(sorted_rankings, start=1):
-            if IngameRankService.ranks[key]["rank"] != rank:
-                IngameRankService.__update_ranks()
+            if self.ranks[key]["rank"] != rank:
+                self.__update_ranks()
                 return True
         return False
 
     def player_rank(self, player_name: str) -> RankRecord:
-        for rank_record in IngameRankService.ranks.values():
-            if rank_record["player_name"] == player_name:
-                return rank_record
-        raise InputDataValidator(f"Player with name {player_name} not found in ranks")
+        player = self.players.by_name(player_name)
+        rank_record = self.records.get(player.player_id) if player is not None else None
+        if rank_record is None:
+            raise InputDataValidator(f"Player with name {player_name} not found in ranks")
+        return rank_record
+
+    def rank_of(self, player_id: int) -> RankRecord:
+        """Rank record of the player with `player_id`."""
+        rank_record = self.records.get(player_id)
+        if rank_record is None:
+            raise InputDataValidator(f"Player with id {player_id} not found in ranks")
+        return rank_record
 
     
-    @classmethod
-    def __update_data(cls) -> None:
-        for key, value in list(cls.ranks.items()):
-            player = next((p for p in Player.player_arrangement if p.name == value["player_name"]), None)
+    @hybridmethod
+    def __update_data(self) -> None:
+        by_id = self.players.by_id
+        for value in self.ranks.values():
+            player = by_id(value["player_id"])
             if player:
                 value["vp_count"] = player.vp
                 value["hp"] = player.hp
-                cls.ranks[key] = value
 
     @property
     def get_ranks_list(self) -> List[RankRecord]:
-        return sorted(IngameRankService.ranks.values(), key=lambda r: r["rank"]) 
\ No newline at end of file
+        return sorted(self.ranks.values(), key=lambda r: r["rank"]) 
\ No newline at end of file
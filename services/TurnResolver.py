@@ -1,11 +1,12 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
-from models import Player, ActiveFace, FallenFace, active_face_vals, fallen_face_vals, Status
-from utils import GameStateValidator
+from typing import TYPE_CHECKING, Sequence
+from models import Player, GameState, PlayerRoster, ActiveFace, FallenFace, active_face_vals, fallen_face_vals, Status
+from utils import GameStateValidator, hybridmethod
 from configs.constants import MAX_ROUNDS as CONFIG_MAX_ROUNDS
 
 if TYPE_CHECKING:
     from controllers.api import Action_service
+    from .Policy import DecisionPolicy
 
 class TurnResolverService():
     """
@@ -16,22 +17,27 @@ class TurnResolverService():
     """
     MAX_ROUNDS :int = CONFIG_MAX_ROUNDS
     CURRENT_ROUND :int = 0
-    participants : list[Player] =[]
+    participants : PlayerRoster = PlayerRoster()
+    state : GameState | None = None
 
     def __init__(self, action_service: Action_service) -> None:
         self.ingame_action_service : Action_service = action_service
 
-    @classmethod 
-    def set_participants(cls, players: list[Player]) -> None:
+    @hybridmethod
+    def set_participants(self, players: list[Player]) -> None:
         """
-        Class method to set the participants for the turn resolver.
+        Method to set the participants for the turn resolver, called on an instance they are only that instance's
+        participants (e.g. of a `GameSession`), called on the class they are the default participants.
+        The participants are bound to one shared `GameState`, in seat order, so the state can be cloned for look-ahead.
+        A plain list is copied into a `PlayerRoster`, so participants can always be looked up by id or name.
 
         :param players: List of Player instances participating in the game.
         :type players: list[Player]
         :return: None
         :rtype: None
         """
-        cls.participants = players
+        self.participants = players if isinstance(players, PlayerRoster) else PlayerRoster(players)
+        self.state = GameState.from_players(players)
 
     def target_lookup(self,player: Player , action: ActiveFace | FallenFace ) -> bool:
         """
@@ -49,24 +55,30 @@ class TurnResolverService():
     @property
     def reward_vp_for_survivors(self) -> None:
         """
-        Method to reward victory points (VP) to players who survived the round.
+        Method to reward victory points (VP) to players who survived the round, the `survivor_vp` of the
+        rules of the action service.
 
         :return: None
         """
+        rules = self.ingame_action_service.rules
+        if not rules.survivor_vp:
+            return
         for player in self.participants:
             if player.status == Status.ALIVE:
-                player.gain_vp(1)
+                player.gain_vp(rules.survivor_vp, limit=rules.max_vp_amount)
 
 
     @property
     def get_history(self, last_n_events: int = 1) -> list[str]:
-        events = self.ingame_action_service.in_game_history_service.get_events()
+        # every event refines to one line at least, so the last lines all come from the last events
+        events = self.ingame_action_service.in_game_history_service.tail(last_n_events)
         refined = self.ingame_action_service.in_game_history_service.refine_event(history=events)
         return refined[-last_n_events:]
 
     def resolve_turns(self) -> None:
         """
-        Method to resolve turns for each participant using the ingame action service.
+        Method to resolve turns for each participant using the ingame action service, then reward the survivors
+        and start the next round.
 
         :return: None
         """
@@ -78,7 +90,7 @@ class TurnResolverService():
                 choice = input(f"{player.name} rolled POWER_MOVE. Choose 'damage_hp' or 'gain_vp': ").strip()
                 if choice == "damage_hp":
                     target_player = input(f"Select target player for {player.name} action {face_value.value}: ").strip()
-                    target = next((p for p in self.participants if p.name == target_player), None)
+                    target = self.participants.by_name(target_player)
                     if target is None:
                         try:
                             idx = int(target_player)
@@ -103,7 +115,7 @@ class TurnResolverService():
 
                 # validator if the given target player is valid -beta taking input for now
                 target_player = target_player.strip()
-                target = next((p for p in self.participants if p.name == target_player), None)
+                target = self.participants.by_name(target_player)
                 if target is None:
                     try:
                         idx = int(target_player)
@@ -130,5 +142,61 @@ class TurnResolverService():
 
             print(self.get_history)
 
+        self.__end_round()
+
+    def play_turn(self, player: Player, policy: DecisionPolicy) -> bool:
+        """
+        Method to resolve one turn of `player` headlessly, every decision is taken by `policy`.
+        Only alive players other than the roller are offered as targets of active faces, fallen players
+        may not pick the target they affected last, so the policy can never pick an invalid target.
+
+        :param player: The player whose turn it is.
+        :param policy: The policy taking the target and option decisions for `player`.
+        :return: The result of the executed action, False when a targeted face had no valid target.
+        :rtype: bool
+        """
+        face_value = player.roll_dice()
+        action_service = self.ingame_action_service
+
+        if isinstance(face_value, ActiveFace):
+            candidates = [p for p in self.participants if p is not player and p.status == Status.ALIVE]
+            if face_value == ActiveFace.POWER_MOVE:
+                if candidates and policy.choose_power_move(player, candidates) == "damage_hp":
+                    target = policy.choose_target(player, face_value, candidates)
+                    return action_service.execute_action(player=player, action=face_value, target=target, choice_action="damage_hp")
+                return action_service.execute_action(player=player, action=face_value, choice_action="gain_vp")
+            if not self.target_lookup(player, face_value):
+                return action_service.execute_action(player=player, action=face_value)
+            if not candidates:
+                return False
+            target = policy.choose_target(player, face_value, candidates)
+            return action_service.execute_action(player=player, action=face_value, target=target)
+
+        candidates = [
+            p for p in self.participants
+            if p.status == Status.ALIVE and p.name != player.last_targetedto
+        ]
+        if not self.target_lookup(player, face_value) or not candidates:
+            return action_service.execute_action(player=player, action=face_value)
+        target = policy.choose_target(player, face_value, candidates)
+        choice = policy.choose_fallen_option(player, face_value, target)
+        return action_service.execute_action(player=player, action=face_value, target=target, choice_action=choice)
+
+    def play_round(self, policies: Sequence[DecisionPolicy]) -> None:
+        """
+        Method to resolve one full round headlessly, reward the survivors and start the next round, never reading stdin.
+
+        :param policies: One policy per participant, in the order of `participants`.
+        :return: None
+        """
+        for player, policy in zip(self.participants, policies):
+            self.play_turn(player, policy)
+
+        self.__end_round()
+
+    def __end_round(self) -> None:
+        """Rewards the survivors and moves the shared `GameState` to the next round, the round the events are recorded with."""
         #  reward VP to survivors
-        self.reward_vp_for_survivors
\ No newline at end of file
+        self.reward_vp_for_survivors
+        if self.state is not None:
+            self.state.round += 1
@@ -0,0 +1,117 @@
+from __future__ import annotations
+from collections import deque
+from functools import partial
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from models import Player, GameState
+from models.GameState import Checkpoint
+from .types import EventRecord
+
+if TYPE_CHECKING:
+    from .History import HistoryService
+
+# (state, checkpoint) per state an action touched: one, or two for players not sharing a state (lobby players)
+Checkpoints = tuple[tuple[GameState, Checkpoint], ...]
+
+
+class Delta(NamedTuple):
+    """
+    What one applied action changed, see `Action_service.execute_action`.
+    :param player: The player who rolled.
+    :param before: Inverse delta, the checkpoints of the touched seats before the action.
+    :param after: Forward delta, the same seats after the action.
+    :param event_id: Id of the event the action recorded, None when the history rejected it.
+    """
+    player: Player
+    before: Checkpoints
+    after: Checkpoints
+    event_id: Optional[int]
+
+
+# builds a Delta from one (player, before, after, event_id) tuple, skipping the Python level NamedTuple __new__
+new_delta = partial(tuple.__new__, Delta)
+
+
+def checkpoints(player: Player, target: Player | None = None) -> Checkpoints:
+    """Checkpoints the seats of `player` and `target`, all an action can touch."""
+    state, seat = player.state, player.seat
+    if target is None:
+        return ((state, state.checkpoint(seat)),)
+    if target.state is state:
+        return ((state, state.checkpoint(seat, target.seat)),)
+    return ((state, state.checkpoint(seat)), (target.state, target.state.checkpoint(target.seat)))
+
+
+class UndoStack:
+    """
+    Docstring for UndoStack
+    Undo and redo of applied actions through the deltas `Action_service` pushes, each undo or redo costs O(1)
+    whatever the number of players or recorded events: only the touched seats are restored and only the
+    action's event is taken out of (or put back into) the history.
+
+    __init__ method parameters:
+    - history (HistoryService | None): History the actions were recorded in, their events are removed on undo and
+      put back on redo. None leaves the history alone.
+    - limit (int | None): Number of actions kept for undo, the oldest are forgotten first. None keeps them all.
+    """
+
+    def __init__(self, history: HistoryService | None = None, limit: int | None = None) -> None:
+        self.history = history
+        self._done: deque[Delta] = deque(maxlen=limit)
+        # undone deltas with the event record they took out of the history
+        self._undone: list[tuple[Delta, Optional[EventRecord]]] = []
+
+    def push(self, delta: Delta) -> None:
+        """Records a newly applied action, which drops everything that could be redone."""
+        self._done.append(delta)
+        if self._undone:
+            self._undone.clear()
+
+    def undo(self) -> Delta | None:
+        """
+        Reverts the last applied action: restores the seats it touched and removes its event from the history.
+
+        :return: The reverted delta, None when there is nothing to undo.
+        """
+        if not self._done:
+            return None
+        delta = self._done.pop()
+        for state, checkpoint in delta.before:
+            state.rollback(checkpoint)
+        record = None
+        if self.history is not None and delta.event_id is not None:
+            record = self.history.remove_event(delta.event_id)
+        self._undone.append((delta, record))
+        return delta
+
+    def redo(self) -> Delta | None:
+        """
+        Re-applies the last undone action with its event, under its original event id.
+
+        :return: The re-applied delta, None when there is nothing to redo.
+        """
+        if not self._undone:
+            return None
+        delta, record = self._undone.pop()
+        for state, checkpoint in delta.after:
+            state.rollback(checkpoint)
+        if record is not None:
+            self.history.restore_event(delta.event_id, record)
+        self._done.append(delta)
+        return delta
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._done)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._undone)
+
+    def clear(self) -> None:
+        """Forgets every action, e.g. once a round ended and its actions can no longer be taken back."""
+        self._done.clear()
+        self._undone.clear()
+
+    def __len__(self) -> int:
+        return len(self._done)
@@ -1,5 +1,10 @@
 from .History import HistoryService
+from .EventLog import ColumnarEventLog
 from .TurnResolver import TurnResolverService
 from .Rank import IngameRankService
+from .Policy import DecisionPolicy, RandomPolicy
+from .Undo import UndoStack
+from .Export import NdjsonHistoryWriter
+from .Archive import BinaryArchiveWriter, BinaryArchiveReader
 
-__all__ = ["HistoryService", "TurnResolverService", "IngameRankService"]
\ No newline at end of file
+__all__ = ["HistoryService", "ColumnarEventLog", "TurnResolverService", "IngameRankService", "DecisionPolicy", "RandomPolicy", "UndoStack", "NdjsonHistoryWriter", "BinaryArchiveWriter", "BinaryArchiveReader"]
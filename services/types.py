@@ -1,7 +1,7 @@
 
 from dataclasses import dataclass
 
-from typing import List, Optional
+from typing import List, Optional, NamedTuple
 from datetime import datetime
 from models import Player, ActiveFace, FallenFace
 
@@ -28,3 +28,50 @@ class EventRecord:
     healing_done: Optional[List[tuple[Player, int]]] = None
     vp_gained: Optional[List[tuple[Player, int]]] = None
     vp_stolen: Optional[List[tuple[Player, int]]] = None
+
+
+class SeatSummary(NamedTuple):
+    """Final standing of one seat of a finished game.
+    :param name: Name of the player sitting on the seat.
+    :param vp: Final victory points.
+    :param hp: Final health points.
+    :param rank: Final rank, 1 is the winner.
+    :param alive: Whether the player was still alive at the end.
+    """
+    name: str
+    vp: int
+    hp: int
+    rank: int
+    alive: bool
+
+
+@dataclass(frozen=True)
+class GameSummary:
+    """Compact result of one headless game.
+    :param seed: The seed the game was played with.
+    :param rounds_played: Number of rounds resolved before the game ended.
+    :param seats: Final standing of every seat, in seat order.
+    """
+    seed: int
+    rounds_played: int
+    seats: tuple[SeatSummary, ...]
+
+    @property
+    def winner(self) -> SeatSummary:
+        return min(self.seats, key=lambda seat: seat.rank)
+
+
+@dataclass(slots=True)
+class EventTotals:
+    """Running totals of the recorded events of one player or one face, see `HistoryService.player_totals`.
+    :param damage_dealt: Damage dealt to other players, self-inflicted damage (BACKFIRE) only counts as taken.
+    :param damage_taken: Damage taken.
+    :param healing: Health restored.
+    :param vp_gained: Victory points gained.
+    :param vp_stolen: Victory points stolen from other players.
+    """
+    damage_dealt: int = 0
+    damage_taken: int = 0
+    healing: int = 0
+    vp_gained: int = 0
+    vp_stolen: int = 0
@@ -0,0 +1,109 @@
+import pytest
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace, FallenFace, Player, Status
+from services import HistoryService
+from utils import InvalidPlayerActionValidator
+
+
+@pytest.fixture(autouse=True)
+def clear_players():
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+def players(seed=1):
+    session = GameSession(("Ana", "Ben", "Cy"), seed=seed)
+    return session, [session.players.by_name(n) for n in ("Ana", "Ben", "Cy")]
+
+
+def round_of(ana, ben, cy):
+    return [
+        (ana, ActiveFace.JAB, ben, None),
+        (ben, ActiveFace.POWER_MOVE, None, "damage_hp"),  # invalid: needs a target
+        (ben, ActiveFace.POWER_MOVE, cy, "damage_hp"),
+        (cy, ActiveFace.RECOVER, None, None),
+        (ana, ActiveFace.PICKPOCKET, cy, None),  # no vp to steal
+    ]
+
+
+def test_batch_matches_one_by_one_and_reports_failures():
+    _, (ana, ben, cy) = players()
+    batch = Action_service(HistoryService())
+    results = batch.execute_actions(round_of(ana, ben, cy))
+    batch_state = ana.state.snapshot()
+
+    _, (ana2, ben2, cy2) = players()
+    single = Action_service(HistoryService())
+    expected = []
+    for player, face, target, choice in round_of(ana2, ben2, cy2):
+        try:
+            expected.append(single.execute_action(player, face, target, choice_action=choice))
+        except InvalidPlayerActionValidator as error:
+            expected.append(error)
+
+    assert results[0] is True and results[2] is True and results[3] is True and results[4] is False
+    assert isinstance(results[1], InvalidPlayerActionValidator) and isinstance(expected[1], InvalidPlayerActionValidator)
+    assert results[:1] + results[2:] == expected[:1] + expected[2:]
+    assert batch_state == ana2.state.snapshot()
+    assert list(batch.in_game_history_service.history) == [1, 2, 3, 4]
+
+
+def test_history_is_written_once_per_batch():
+    _, (ana, ben, cy) = players()
+    history = HistoryService()
+    service = Action_service(history)
+    seen = []
+
+    def actions():
+        for action in round_of(ana, ben, cy):
+            seen.append(len(history.history))
+            yield action
+
+    service.execute_actions(actions())
+    assert seen == [0] * 5
+    assert len(history.history) == 4
+
+
+def test_event_ids_are_monotonic():
+    _, (ana, ben, cy) = players()
+    history = HistoryService()
+    service = Action_service(history)
+    service.execute_action(ana, ActiveFace.RECOVER)
+    # an event recorded with an explicit id moves the counter past it
+    history.record_event(10, ben, ActiveFace.RECOVER, healing_done=3)
+    service.execute_actions([(cy, ActiveFace.RECOVER, None, None)])
+    assert list(history.history) == [1, 10, 11]
+    # ids of dropped events are never reused
+    del history.history[11]
+    assert history.next_event_id() == 12
+
+
+def test_fallen_rules_failures_do_not_stop_the_batch():
+    _, (ana, ben, cy) = players()
+    ana.status = Status.FALLEN
+    cy.status = Status.FALLEN
+    results = Action_service(HistoryService()).execute_actions([
+        (ana, FallenFace.REMOVE2HP_OR_MINUS1VP, cy, "damage_hp"),  # cy is not alive
+        (ana, FallenFace.REMOVE2HP_OR_MINUS1VP, ben, "damage_hp"),
+        (ana, FallenFace.PLUS2HP_OR_PLUS1VP, ben, "heal_hp"),  # same target twice
+    ])
+    assert isinstance(results[0], InvalidPlayerActionValidator)
+    assert results[1] is True and ben.hp == 18
+    assert isinstance(results[2], InvalidPlayerActionValidator)
+
+
+def test_record_events_skips_invalid_events_in_one_write():
+    _, (ana, ben, _) = players()
+    history = HistoryService()
+    ids = history.record_events([
+        (ana, ActiveFace.JAB, ben, 2, None, None, None),
+        ("not a player", ActiveFace.JAB, ben, 2, None, None, None),
+        (ben, ActiveFace.RECOVER, None, None, 3, None, None),
+    ])
+    assert ids == [1, 3]
+    assert list(history.history) == [1, 3]
+    assert history.history[1].time_stamp == history.history[3].time_stamp
+    assert history.next_event_id() == 4
@@ -0,0 +1,121 @@
+import pytest
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace, Player
+from services import HistoryService, BinaryArchiveWriter, BinaryArchiveReader
+from services.Archive import NO_SEAT, RECORD, HEADER
+from services.EventLog import FACE_CODES, NO_AMOUNT
+
+
+@pytest.fixture(autouse=True)
+def clear_players():
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+def game(columnar=False):
+    session = GameSession(("Ana", "Ben"), seed=1)
+    ana, ben = session.players.by_name("Ana"), session.players.by_name("Ben")
+    history = HistoryService(validate=not columnar, columnar=columnar)
+    return history, Action_service(history, trusted=columnar), ana, ben
+
+
+def play(service, ana, ben):
+    service.execute_action(ana, ActiveFace.JAB, ben)
+    service.execute_actions([(ben, ActiveFace.RECOVER, None, None), (ana, ActiveFace.POWER_MOVE, None, "gain_vp")])
+
+
+def test_followed_events_round_trip(tmp_path):
+    history, service, ana, ben = game()
+    path = tmp_path / "events.bin"
+    with BinaryArchiveWriter(path) as writer:
+        writer.follow(history, game_id=7)
+        play(service, ana, ben)
+    assert path.stat().st_size == HEADER.size + 3 * RECORD.size
+
+    with BinaryArchiveReader(path) as reader:
+        assert len(reader) == 3
+        records = list(reader)
+        assert records[0] == (7, ana.state.round, ana.seat, ben.seat, FACE_CODES[ActiveFace.JAB], 1, 2)
+        assert records[1][2:4] == (ben.seat, NO_SEAT) and records[1][5:] == (2, 3)
+        assert reader[-1] == records[2]
+        assert reader.records.nbytes == 3 * RECORD.size
+        with pytest.raises(IndexError):
+            reader[3]
+
+
+def test_columnar_log_converts_like_the_followed_history(tmp_path):
+    followed, service, ana, ben = game()
+    with BinaryArchiveWriter(tmp_path / "followed.bin") as writer:
+        writer.follow(followed, game_id=1)
+        play(service, ana, ben)
+
+    Player.player_arrangement.clear()
+    columnar, service, ana, ben = game(columnar=True)
+    play(service, ana, ben)
+    with BinaryArchiveWriter(tmp_path / "converted.bin") as writer:
+        assert writer.write_log(1, columnar.history) == 3
+
+    with BinaryArchiveReader(tmp_path / "followed.bin") as a, BinaryArchiveReader(tmp_path / "converted.bin") as b:
+        assert list(a) == list(b)
+
+
+def test_archives_are_appended_and_a_cut_record_is_dropped(tmp_path):
+    path = tmp_path / "events.bin"
+    with BinaryArchiveWriter(path) as writer:
+        writer.write(1, 1, 0, NO_SEAT, 0, NO_AMOUNT, 0)
+    with open(path, "ab") as file:
+        file.write(RECORD.pack(1, 1, 1, 0, 0, 1, 5)[:7])
+    with BinaryArchiveReader(path) as reader:
+        assert len(reader) == 1
+    with BinaryArchiveWriter(path) as writer:
+        writer.write(2, 1, 1, 0, 0, 1, -5)
+    with BinaryArchiveReader(path) as reader:
+        assert [record[0] for record in reader] == [1, 2] and reader[1][-1] == -5
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "events.ndjson"
+    path.write_bytes(b'{"id":1,"ts":"2024-01-01"}\n')
+    with pytest.raises(ValueError):
+        BinaryArchiveReader(path)
+    with pytest.raises(ValueError):
+        BinaryArchiveWriter(path)
+
+
+def test_array_is_a_view_of_the_mapped_file(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "events.bin"
+    with BinaryArchiveWriter(path) as writer:
+        for amount in range(10):
+            writer.write(amount % 2, 1, 0, 1, 3, 1, amount)
+    reader = BinaryArchiveReader(path)
+    events = reader.array()
+    assert not events.flags.owndata and events.itemsize == RECORD.size
+    assert events["amount"].sum() == 45
+    assert np.bincount(events["game_id"], weights=events["amount"]).tolist() == [20, 25]
+    with pytest.raises(BufferError):
+        reader.close()
+    del events
+    reader.close()
+
+
+def test_followed_turn_resolver_game_keeps_its_rounds(tmp_path):
+    from services import TurnResolverService, RandomPolicy
+
+    players = [Player(name) for name in ("Ana", "Ben", "Cy")]
+    history = HistoryService()
+    resolver = TurnResolverService(Action_service(history))
+    resolver.set_participants(players)
+    path = tmp_path / "events.bin"
+    with BinaryArchiveWriter(path) as writer:
+        writer.follow(history, game_id=1)
+        for _ in range(3):
+            resolver.play_round([RandomPolicy(seed) for seed in range(3)])
+
+    with BinaryArchiveReader(path) as reader:
+        rounds = [record[1] for record in reader]
+    assert len(rounds) == len(history.history)
+    assert rounds == sorted(rounds) and set(rounds) == {0, 1, 2}
@@ -0,0 +1,147 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from controllers.api import Action_service
+from controllers.batch_simulator import BatchSimulator, VectorPolicy, OPTION_HP, pick_targets
+from helpers import Randomizer
+from models.Player import Player
+from models.Dice import Status
+from services import HistoryService, TurnResolverService, DecisionPolicy
+from configs import DEFAULT_RULESET
+
+GAMES = 60
+PLAYERS = 5
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    engine = Randomizer.engine
+    Player.player_arrangement.clear()
+    yield
+    Randomizer.use_engine(engine)
+    Player.player_arrangement.clear()
+
+
+class ScriptedEngine:
+    """Dice engine replaying one prescribed roll at a time."""
+    seed = 0
+
+    def __init__(self):
+        self.next_roll = 1
+
+    def roll(self):
+        return self.next_roll
+
+    def spawn(self, stream):
+        return self
+
+    def shuffle(self, items):
+        return items
+
+
+class ScoredPolicy(DecisionPolicy):
+    """Scalar twin of `pick_targets`: best scored candidate, prescribed option."""
+
+    def __init__(self, seats):
+        self.seats = seats
+        self.scores = None
+        self.option = OPTION_HP
+
+    def choose_target(self, player, face, candidates):
+        return max(candidates, key=lambda p: self.scores[self.seats[p]])
+
+    def choose_power_move(self, player, candidates):
+        return "damage_hp" if self.option == OPTION_HP else "gain_vp"
+
+    def choose_fallen_option(self, player, face, target):
+        if face.name.startswith("PLUS2HP"):
+            return "heal_hp" if self.option == OPTION_HP else "gain_vp"
+        return "damage_hp" if self.option == OPTION_HP else "steal_vp"
+
+
+def test_batch_engine_matches_execute_action_turn_by_turn():
+    rng = np.random.default_rng(2029)
+    rounds = DEFAULT_RULESET.max_rounds
+    rolls = rng.integers(1, 7, size=(rounds, PLAYERS, GAMES))
+    scores = rng.random((rounds, PLAYERS, GAMES, PLAYERS))
+    options = rng.integers(0, 2, size=(rounds, PLAYERS, GAMES))
+
+    batch = BatchSimulator(GAMES, PLAYERS)
+    for r in range(rounds):
+        for seat in range(PLAYERS):
+            targets = pick_targets(scores[r, seat], batch.candidates(seat))
+            batch.step(seat, rolls[r, seat], targets=targets, options=options[r, seat])
+        batch.end_round()
+
+    engine = ScriptedEngine()
+    Randomizer.use_engine(engine)
+    for g in range(GAMES):
+        Player.player_arrangement.clear()
+        players = [Player(f"P{i}") for i in range(PLAYERS)]
+        seats = {p: i for i, p in enumerate(players)}
+        policy = ScoredPolicy(seats)
+        resolver = TurnResolverService(Action_service(HistoryService()))
+        resolver.set_participants(players)
+
+        rounds_played = 0
+        while rounds_played < rounds:
+            for seat, player in enumerate(players):
+                engine.next_roll = int(rolls[rounds_played, seat, g])
+                policy.scores = scores[rounds_played, seat, g]
+                policy.option = options[rounds_played, seat, g]
+                resolver.play_turn(player, policy)
+            resolver.reward_vp_for_survivors
+            rounds_played += 1
+            for player in players:
+                player.last_targetedby = None
+                player.last_targetedto = None
+            if sum(p.status == Status.ALIVE for p in players) <= 1:
+                break
+
+        assert [p.hp for p in players] == batch.state.hp[g].tolist()
+        assert [p.vp for p in players] == batch.state.vp[g].tolist()
+        assert [p.status == Status.ALIVE for p in players] == batch.state.alive[g].tolist()
+        assert rounds_played == batch.state.rounds_played[g]
+
+
+def test_batch_play_is_reproducible_and_ranks_are_permutations():
+    first = BatchSimulator(500).play(seed=7)
+    second = BatchSimulator(500).play(seed=7)
+    assert np.array_equal(first.vp, second.vp) and np.array_equal(first.rank, second.rank)
+    assert (np.sort(first.rank, axis=1) == np.arange(1, PLAYERS + 1)).all()
+    assert abs(first.win_rates.sum() - 1.0) < 1e-9
+    assert ((first.rounds_played == DEFAULT_RULESET.max_rounds) | (first.alive.sum(axis=1) <= 1)).all()
+    assert (first.hp >= 0).all() and (first.vp >= 0).all()
+
+
+def test_tied_standings_rank_like_the_rank_service_and_share_the_win():
+    from services import IngameRankService
+
+    names = ("Zed", "Amy", "Max", "Bo")
+    batch = BatchSimulator(3, players=4, names=names)
+    batch.state.vp[:] = [[2, 2, 2, 1], [3, 3, 0, 0], [1, 1, 1, 1]]
+    batch.state.hp[:] = [[10, 10, 12, 10], [5, 5, 20, 20], [7, 7, 7, 7]]
+    result = batch.result()
+
+    for game in range(3):
+        Player.player_arrangement.clear()
+        players = [Player(name, hp=int(hp), vp=int(vp)) for name, hp, vp in zip(names, result.hp[game], result.vp[game])]
+        service = IngameRankService(players)
+        service.initiate_ranks()
+        service.check_rank()
+        assert result.rank[game].tolist() == [service.rank_of(p.player_id)["rank"] for p in players]
+
+    assert result.win_shares.tolist() == [[0, 0, 1, 0], [0.5, 0.5, 0, 0], [0.25] * 4]
+    assert result.win_rates.tolist() == pytest.approx([0.25, 0.25, 5 / 12, 1 / 12])
+    with pytest.raises(ValueError):
+        BatchSimulator(3, players=4, names=names[:2])
+
+
+def test_incomplete_vector_policies_cannot_be_instantiated():
+    class TargetsOnly(VectorPolicy):
+        def choose_targets(self, state, seat, rolls, candidates):
+            return pick_targets(np.zeros(candidates.shape), candidates)
+
+    with pytest.raises(TypeError, match="choose_options"):
+        TargetsOnly()
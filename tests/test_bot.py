@@ -0,0 +1,144 @@
+import random
+
+import pytest
+
+from controllers.api import Action_service
+from controllers.bot import search, rollout, BotWorker, MCTSPolicy
+from controllers.simulator import HeadlessGameController
+from models import Player, GameState, active_face_vals, fallen_face_vals
+from models.GameState import OPTION_HP, NO_MOVE
+from services import HistoryService, RandomPolicy
+from helpers import Randomizer
+
+SEATS = 5
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    engine = Randomizer.engine
+    Player.player_arrangement.clear()
+    yield
+    Randomizer.use_engine(engine)
+    Player.player_arrangement.clear()
+
+
+def execute_move(service, players, seat, roll, move):
+    """Plays `move` through Action_service, the way TurnResolverService.play_turn would."""
+    player = players[seat]
+    target, option = move
+    if player.is_alive:
+        face = active_face_vals[roll]
+        if face.name == "POWER_MOVE":
+            if target < 0 or option != OPTION_HP:
+                return service.execute_action(player=player, action=face, choice_action="gain_vp")
+            return service.execute_action(player=player, action=face, target=players[target], choice_action="damage_hp")
+        if target < 0:
+            if face.name in ("BACKFIRE", "RECOVER"):
+                service.execute_action(player=player, action=face)
+            return
+        return service.execute_action(player=player, action=face, target=players[target])
+    face = fallen_face_vals[roll]
+    if target < 0:
+        return service.execute_action(player=player, action=face)
+    if face.name.startswith("PLUS2HP"):
+        choice = "heal_hp" if option == OPTION_HP else "gain_vp"
+    else:
+        choice = "damage_hp" if option == OPTION_HP else "steal_vp"
+    return service.execute_action(player=player, action=face, target=players[target], choice_action=choice)
+
+
+def test_forward_model_matches_action_service():
+    rng = random.Random(3)
+    players = [Player(f"P{i}") for i in range(SEATS)]
+    state = GameState.from_players(players)
+    service = Action_service(HistoryService())
+
+    for _ in range(150):
+        state.hp[:] = [rng.choice((0, 1, 2, 5, 12, 19, 20)) for _ in range(SEATS)]
+        state.alive[:] = [hp > 0 for hp in state.hp]
+        state.vp[:] = [rng.randint(0, 3) for _ in range(SEATS)]
+        state.targeted_to[:] = [rng.choice((None, "P0", "P3")) for _ in range(SEATS)]
+        start = state.snapshot()
+        for seat in range(SEATS):
+            for roll in range(1, 7):
+                for move in state.moves(seat, roll):
+                    expected = state.clone()
+                    expected.apply(seat, roll, move)
+                    execute_move(service, players, seat, roll, move)
+                    assert state == expected, (seat, roll, move)
+                    state.restore(start)
+
+
+def test_moves_and_rounds():
+    state = GameState(("A", "B", "C"), hp=(20, 0, 20), alive=(True, False, True), targeted_to=(None, "C", None))
+    assert state.moves(0, 2) == [(-1, 1), (2, OPTION_HP)]  # POWER_MOVE
+    assert state.moves(0, 1) == [NO_MOVE]  # BACKFIRE
+    assert state.moves(1, 2) == [(0, 0), (0, 1)]  # fallen bless, C was its last target
+    assert state.moves(1, 1) == [NO_MOVE]
+
+    for _ in range(3):
+        state.advance()
+    assert (state.round, state.turn) == (1, 0)
+    assert state.vp == [1, 0, 1]
+    assert state.ranks() == [1, 3, 2]
+
+
+def test_rollout_ends_the_game():
+    state = GameState(tuple("ABCDE"))
+    ranks = rollout(state, random.Random(1))
+    assert sorted(ranks) == [1, 2, 3, 4, 5]
+    assert state.is_over()
+
+
+def test_search_is_reproducible_and_legal():
+    state = GameState(tuple("ABCDE"), hp=(10, 4, 20, 3, 12), vp=(3, 6, 4, 0, 2))
+    first = search(state.snapshot(), 0, 5, budget=60, seed=11, max_rollouts=200)
+    again = search(state.snapshot(), 0, 5, budget=60, seed=11, max_rollouts=200)
+    assert first.move == again.move and first.stats == again.stats
+    assert first.move in state.moves(0, 5)
+    assert first.rollouts == 200 == sum(v for _, v, _ in first.stats)
+    assert first.rollouts_per_second > 0
+    # a forced move needs no rollout
+    assert search(state.snapshot(), 0, 1).rollouts == 0
+
+
+def test_bot_worker_polls_result():
+    worker = BotWorker(budget=0.01, use_processes=False)
+    state = GameState(tuple("ABCDE"))
+    worker.submit(state, 0, 2, seed=1)
+    assert worker.busy
+    with pytest.raises(RuntimeError):
+        worker.submit(state, 0, 2)
+    while (result := worker.poll()) is None:
+        pass
+    assert not worker.busy
+    assert result.move in state.moves(0, 2)
+    assert worker.rollouts_per_second == result.rollouts_per_second
+    worker.shutdown()
+
+
+def test_mcts_policy_plays_headless_game():
+    controller = HeadlessGameController([MCTSPolicy(max_rollouts=8)] + [RandomPolicy()] * (SEATS - 1), max_rounds=4)
+    first = controller.play(5)
+    assert first == controller.play(5)
+    assert first.rounds_played <= 4
+
+
+def test_mcts_policy_searches_again_on_a_later_turn():
+    from controllers.session import GameSession
+    from models import ActiveFace, Status
+
+    session = GameSession(("A", "B", "C"), seed=3)
+    a, b, c = session.players
+    policy = MCTSPolicy(max_rollouts=8)
+    policy.reset(3)
+    first = policy.choose_target(a, ActiveFace.PICKPOCKET, [b, c])
+    # the decisions of one turn share their search
+    assert policy.choose_target(a, ActiveFace.PICKPOCKET, [b, c]) is first and policy._searches == 1
+
+    # a later round with the same face: the previous target is gone, a new search picks among the candidates left
+    first.status = Status.FALLEN
+    left = c if first is b else b
+    a.state.round += 1
+    assert policy.choose_target(a, ActiveFace.PICKPOCKET, [left]) is left
+    assert policy._searches == 2 and policy._decided[1][0] == left.seat
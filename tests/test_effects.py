@@ -0,0 +1,115 @@
+import pytest
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace, FallenFace, Player
+from models.Effects import effect_table, CHOICES, OTHER_CHOICE, DAMAGE, STEAL_VP, NO_EFFECT
+from services import HistoryService, TurnResolverService
+from configs import Ruleset, DEFAULT_RULESET
+from utils import InvalidPlayerActionValidator, GameStateValidator
+
+
+@pytest.fixture(autouse=True)
+def clear_players():
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+def test_table_covers_every_face_choice_and_target():
+    table = effect_table()
+    for face in (*ActiveFace, *FallenFace):
+        for choice in (None, OTHER_CHOICE, *CHOICES):
+            assert (face, choice, True) in table and (face, choice, False) in table
+    # the aliased fallen faces share their entries
+    assert table[FallenFace.PLUS2HP_OR_PLUS1VP_2, "heal_hp", True] is table[FallenFace.PLUS2HP_OR_PLUS1VP, "heal_hp", True]
+
+
+def test_amounts_follow_the_ruleset():
+    rules = DEFAULT_RULESET._replace(jab_dmg=3, pick_pocket_vp=2, power_move_hp=5)
+    table = effect_table(rules)
+    assert table[ActiveFace.JAB, None, True][:6] == (DAMAGE, 3, True, "damage_dealt", False, None)
+    assert table[ActiveFace.PICKPOCKET, OTHER_CHOICE, True].kind == STEAL_VP
+    assert table[ActiveFace.PICKPOCKET, None, True].amount == 2
+    assert table[ActiveFace.POWER_MOVE, "damage_hp", True].amount == 5
+    assert table[FallenFace.NOTHING_1, "heal_hp", False].kind == NO_EFFECT
+    # tables are compiled once per ruleset
+    assert effect_table(Ruleset(**rules._asdict())) is table
+
+
+def test_action_service_plays_its_rules():
+    session = GameSession(("Ana", "Ben"), seed=1)
+    ana, ben = session.players.by_name("Ana"), session.players.by_name("Ben")
+    service = Action_service(HistoryService(), rules=DEFAULT_RULESET._replace(strike_hp=7, pick_pocket_vp=2))
+
+    service.execute_action(ana, ActiveFace.STRIKE, ben)
+    assert ben.hp == 13
+    assert ana.last_targetedto == "Ben" and ben.last_targetedby == "Ana"
+    event = service.in_game_history_service.history[1]
+    assert event.damage_dealt == [(ben, 7)]
+
+    ben.gain_vp(1)
+    assert service.execute_action(ana, ActiveFace.PICKPOCKET, ben) is False
+    ben.gain_vp(1)
+    assert service.execute_action(ana, ActiveFace.PICKPOCKET, ben) is True
+    assert (ana.vp, ben.vp) == (2, 0)
+
+
+def test_invalid_combinations_raise_their_message():
+    session = GameSession(("Ana", "Ben"), seed=1)
+    ana = session.players.by_name("Ana")
+    service = Action_service(HistoryService())
+    with pytest.raises(InvalidPlayerActionValidator, match="requires a target"):
+        service.execute_action(ana, ActiveFace.POWER_MOVE, choice_action="damage_hp")
+    with pytest.raises(InvalidPlayerActionValidator, match="Invalid choice_action provided for POWER_MOVE"):
+        service.execute_action(ana, ActiveFace.POWER_MOVE, choice_action="nonsense")
+    with pytest.raises(InvalidPlayerActionValidator, match="Unhandled"):
+        service.execute_action(ana, "not a face")
+
+
+def test_trusted_refused_mutations_record_no_effect():
+    session = GameSession(("Ana", "Ben"), seed=1)
+    ana, ben = session.players.by_name("Ana"), session.players.by_name("Ben")
+    history = HistoryService()
+    service = Action_service(history, trusted=True)
+    ben.take_damage(20)
+    hp = ben.hp
+
+    # the target already fell: the unchecked primitive refuses, nothing is applied nor credited
+    assert service.execute_action(ana, ActiveFace.STRIKE, ben) is False
+    assert ben.hp == hp and ana.last_targetedto is None and ben.last_targetedby is None
+    event = history.history[1]
+    assert event.participants == [ana, ben] and not event.damage_dealt
+    assert history.player_totals(ana).damage_dealt == 0
+    # a fallen player cannot heal itself either
+    assert service.execute_action(ben, ActiveFace.RECOVER) is False and ben.hp == hp
+
+
+def test_validated_path_accepts_the_amounts_of_its_rules():
+    session = GameSession(("Ana", "Ben"), seed=1)
+    ana, ben = session.players.by_name("Ana"), session.players.by_name("Ben")
+    rules = DEFAULT_RULESET._replace(power_move_vp=5, pick_pocket_vp=4, recover_hp=25, survivor_vp=6)
+    service = Action_service(HistoryService(), rules=rules)
+
+    assert service.execute_action(ana, ActiveFace.POWER_MOVE, choice_action="gain_vp") is True
+    assert service.execute_action(ben, ActiveFace.PICKPOCKET, ana) is True
+    ben.take_damage(10)
+    assert service.execute_action(ben, ActiveFace.RECOVER) is True
+    assert (ana.vp, ben.vp, ben.hp) == (1, 4, 20)
+
+    # the survivors get the reward of the same rules
+    resolver = TurnResolverService(service)
+    resolver.set_participants([ana, ben])
+    resolver.reward_vp_for_survivors
+    assert (ana.vp, ben.vp) == (7, 10)
+
+
+def test_rejected_steal_changes_no_player():
+    session = GameSession(("Ana", "Ben"), seed=1)
+    ana, ben = session.players.by_name("Ana"), session.players.by_name("Ben")
+    ben.gain_vp(3)
+    ben.gain_vp(2)
+    with pytest.raises(GameStateValidator):
+        ana.steal_vp(ben, 4)
+    assert (ana.vp, ben.vp) == (0, 5)
+    assert ana.steal_vp(ben, 4, limit=4) is True and (ana.vp, ben.vp) == (4, 1)
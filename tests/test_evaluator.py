@@ -0,0 +1,85 @@
+import math
+
+import pytest
+
+from controllers.evaluator import evaluate, PairedStats, A_BETTER, B_BETTER, EQUIVALENT, INCONCLUSIVE
+from models.Player import Player
+from services import RandomPolicy
+from helpers import Randomizer
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    engine = Randomizer.engine
+    Player.player_arrangement.clear()
+    yield
+    Randomizer.use_engine(engine)
+    Player.player_arrangement.clear()
+
+
+class Greedy(RandomPolicy):
+    """Always banks the POWER_MOVE VP."""
+
+    def choose_power_move(self, player, candidates):
+        return "gain_vp"
+
+
+class Brawler(RandomPolicy):
+    """Always spends POWER_MOVE on damage."""
+
+    def choose_power_move(self, player, candidates):
+        return "damage_hp"
+
+
+class Mirrored(RandomPolicy):
+    """As random as RandomPolicy, but picks other targets from the same stream."""
+
+    def choose_target(self, player, face, candidates):
+        return super().choose_target(player, face, candidates[::-1])
+
+
+def test_paired_stats_online_moments():
+    stats = PairedStats()
+    pairs = [(1, 0), (0, 0), (1, 1), (0, 1), (1, 0)]
+    for won_a, won_b in pairs:
+        stats.add(won_a, won_b)
+    diffs = [a - b for a, b in pairs]
+    mean = sum(diffs) / len(diffs)
+    assert stats.mean == pytest.approx(mean)
+    assert stats.variance == pytest.approx(sum((d - mean) ** 2 for d in diffs) / (len(diffs) - 1))
+    assert (stats.wins_a, stats.wins_b) == (3, 2)
+    low, high = stats.interval(1.96)
+    assert low < mean < high
+
+
+def test_clear_difference_stops_early():
+    better = evaluate(Greedy(), RandomPolicy(), master_seed=1, batch_pairs=100)
+    assert better.verdict == A_BETTER
+    assert better.games < 2_000
+    assert better.win_rate_a > better.win_rate_b
+    assert better.ci[0] > 0 and better.ci_width > 0 and better.wall_time > 0
+
+    worse = evaluate(Brawler(), RandomPolicy(), master_seed=1, batch_pairs=100)
+    assert worse.verdict == B_BETTER and worse.ci[1] < 0
+
+
+def test_same_policy_is_equivalent_at_first_look():
+    policy = RandomPolicy()
+    result = evaluate(policy, policy, batch_pairs=50)
+    # both games of a pair are the same game
+    assert result.verdict == EQUIVALENT
+    assert (result.looks, result.games, result.difference, result.ci_width) == (1, 100, 0.0, 0.0)
+
+
+def test_equal_policies_see_the_same_opponents_in_both_games_of_a_pair():
+    # distinct instances of the same policy: every seat draws the same stream in both games, so they are one game
+    result = evaluate(RandomPolicy(), RandomPolicy(), master_seed=3, batch_pairs=50)
+    assert result.verdict == EQUIVALENT
+    assert (result.looks, result.difference, result.ci_width) == (1, 0.0, 0.0)
+
+
+def test_budget_exhausted_is_inconclusive():
+    result = evaluate(Mirrored(), RandomPolicy(), batch_pairs=20, max_pairs=40)
+    assert result.verdict == INCONCLUSIVE
+    assert result.games == 80 and result.looks == 2
+    assert math.isfinite(result.ci_width)
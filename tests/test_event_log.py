@@ -0,0 +1,119 @@
+from datetime import datetime
+
+import pytest
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace, FallenFace, Player, Status
+from services import ColumnarEventLog, HistoryService
+from services.EventLog import FACES, FACE_CODES, NO_PLAYER
+
+
+@pytest.fixture(autouse=True)
+def clear_players():
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+def play(history: HistoryService) -> list:
+    session = GameSession(("Ana", "Ben", "Cy"), seed=1)
+    ana, ben, cy = (session.players.by_name(n) for n in ("Ana", "Ben", "Cy"))
+    cy.status = Status.FALLEN
+    Action_service(history).execute_actions([
+        (ana, ActiveFace.JAB, ben, None),
+        (ben, ActiveFace.RECOVER, None, None),
+        (ana, ActiveFace.POWER_MOVE, None, "gain_vp"),
+        (ben, ActiveFace.PICKPOCKET, ana, None),
+        (cy, FallenFace.REMOVE2HP_OR_MINUS1VP_2, ben, "damage_hp"),
+        (cy, FallenFace.NOTHING_2, None, None),
+        (ana, ActiveFace.PICKPOCKET, cy, None),  # no vp to steal
+    ])
+    return [ana, ben, cy]
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_columnar_records_read_like_the_dict_ones(validate):
+    expected = HistoryService(validate=validate)
+    play(expected)
+    columnar = HistoryService(validate=validate, columnar=True)
+    players = play(columnar)
+
+    assert isinstance(columnar.history, ColumnarEventLog)
+    assert list(columnar.history) == list(expected.history) == list(range(1, 8))
+    by_name = {p.name: p for p in players}
+    for event_id, record in expected.history.items():
+        got = columnar.history[event_id]
+        assert isinstance(got.time_stamp, datetime)
+        # same record, with the players of the other game
+        for field in ("damage_dealt", "healing_done", "vp_gained", "vp_stolen"):
+            want = getattr(record, field)
+            assert getattr(got, field) == (None if want is None else [(by_name[p.name], n) for p, n in want])
+        assert got.dice_face_value is record.dice_face_value
+        assert [p.name for p in got.participants] == [p.name for p in record.participants]
+
+
+def test_columns_hold_one_row_per_event():
+    history = HistoryService(validate=False, columnar=True)
+    ana, ben, cy = play(history)
+    log = history.history
+    assert len(log.ids) == len(log.times) == 7
+    assert log.players[log.rollers[0]] is ana and log.players[log.targets[0]] is ben
+    assert log.targets[1] == NO_PLAYER and (log.kinds[1], log.amounts[1]) == (2, 3)
+    assert FACES[log.faces[4]] is FallenFace.REMOVE2HP_OR_MINUS1VP
+    assert FACE_CODES[FallenFace.NOTHING_2] == FACE_CODES[FallenFace.NOTHING_1]
+    # a batch shares one time stamp
+    assert len(set(log.times)) == 1
+
+
+def test_overwrite_delete_and_out_of_order_ids():
+    session = GameSession(("Ana", "Ben"), seed=1)
+    ana, ben = session.players.by_name("Ana"), session.players.by_name("Ben")
+    history = HistoryService(columnar=True)
+    history.record_event(5, ana, ActiveFace.JAB, ben, damage_dealt=2)
+    history.record_event(9, ben, ActiveFace.RECOVER, healing_done=3)
+    history.record_event(5, ana, ActiveFace.STRIKE, ben, damage_dealt=4)
+    assert list(history.history) == [5, 9]
+    assert history.history[5].damage_dealt == [(ben, 4)]
+
+    history.record_event(2, ben, ActiveFace.BACKFIRE, damage_dealt=3)
+    assert list(history.history) == [5, 9, 2]
+    assert history.history[2].damage_dealt == [(ben, 3)] and 9 in history.history
+
+    del history.history[9]
+    assert list(history.history) == [5, 2] and 9 not in history.history
+    with pytest.raises(KeyError):
+        history.history[9]
+    assert history.next_event_id() == 10
+
+
+def test_events_with_several_amounts_and_copied_records():
+    session = GameSession(("Ana", "Ben"), seed=1)
+    ana, ben = session.players.by_name("Ana"), session.players.by_name("Ben")
+    # only an unvalidated history accepts several amounts per event
+    history = HistoryService(validate=False, columnar=True)
+    history.record_event(1, ana, ActiveFace.POWER_MOVE, ben, damage_dealt=6, vp_gained=3)
+    record = history.history[1]
+    assert record.damage_dealt == [(ben, 6)] and record.vp_gained == [(ben, 3)]
+
+    # assigning a record stores it to the microsecond
+    copy = ColumnarEventLog()
+    copy[1] = record
+    assert copy[1] == record
+
+
+def test_rounds_of_a_turn_resolver_game():
+    from services import TurnResolverService, RandomPolicy
+
+    players = [Player(name) for name in ("Ana", "Ben", "Cy")]
+    history = HistoryService(validate=False, columnar=True)
+    resolver = TurnResolverService(Action_service(history, trusted=True))
+    resolver.set_participants(players)
+    policies = [RandomPolicy(seed) for seed in range(3)]
+    for _ in range(3):
+        resolver.play_round(policies)
+
+    # every round records its events under its own round, not all of them under round 0
+    rounds = list(history.history.rounds)
+    assert rounds == sorted(rounds) and set(rounds) == {0, 1, 2}
+    assert resolver.state.round == 3
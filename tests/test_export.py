@@ -0,0 +1,127 @@
+import json
+
+import pytest
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace, Player
+from services import HistoryService, NdjsonHistoryWriter
+
+
+@pytest.fixture(autouse=True)
+def clear_players():
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+def game(columnar=False):
+    session = GameSession(("Ana", "Ben"), seed=1)
+    ana, ben = session.players.by_name("Ana"), session.players.by_name("Ben")
+    history = HistoryService(validate=not columnar, columnar=columnar)
+    return history, Action_service(history, trusted=columnar), ana, ben
+
+
+def lines(writer):
+    return [json.loads(line) for path in writer.files() for line in path.read_text().splitlines()]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_recorded_events_are_streamed_as_compact_lines(tmp_path, columnar):
+    history, service, ana, ben = game(columnar)
+    with NdjsonHistoryWriter(tmp_path) as writer:
+        history.subscribe(writer.write)
+        service.execute_action(ana, ActiveFace.JAB, ben)
+        service.execute_actions([(ben, ActiveFace.RECOVER, None, None), (ana, ActiveFace.POWER_MOVE, None, "gain_vp")])
+    exported = lines(writer)
+    assert [e["id"] for e in exported] == [1, 2, 3]
+    assert {k: v for k, v in exported[0].items() if k != "ts"} == {"game": 0, "id": 1, "by": "Ana", "face": "JAB", "to": "Ben", "dmg": [["Ben", 2]]}
+    assert "to" not in exported[1] and exported[1]["heal"] == [["Ben", 3]]
+    assert writer.path.read_text().count(" ") == 0
+
+
+def test_lines_are_written_in_batches(tmp_path):
+    history, service, ana, ben = game()
+    writer = NdjsonHistoryWriter(tmp_path, flush_every=3)
+    history.subscribe(writer.write)
+    for _ in range(2):
+        service.execute_action(ana, ActiveFace.RECOVER)
+    assert writer.path.read_bytes() == b""
+    service.execute_action(ana, ActiveFace.RECOVER)
+    assert len(lines(writer)) == 3
+    history.unsubscribe(writer.write)
+    service.execute_action(ana, ActiveFace.RECOVER)
+    writer.close()
+    assert len(lines(writer)) == 3 and writer.events_written == 3
+
+
+def test_files_rotate_by_size(tmp_path):
+    history, service, ana, ben = game()
+    with NdjsonHistoryWriter(tmp_path, max_bytes=300, flush_every=4) as writer:
+        writer.attach(history)
+        for _ in range(20):
+            service.execute_action(ana, ActiveFace.RECOVER)
+    files = writer.files()
+    assert len(files) > 2
+    assert all(path.stat().st_size <= 300 for path in files)
+    assert [e["id"] for e in lines(writer)] == list(range(1, 21))
+
+
+def test_resume_drops_a_cut_line_and_skips_exported_events(tmp_path):
+    history, service, ana, ben = game()
+    for _ in range(5):
+        service.execute_action(ana, ActiveFace.RECOVER)
+    with NdjsonHistoryWriter(tmp_path) as writer:
+        writer.attach(history)
+    # a crash in the middle of the sixth line
+    with open(writer.path, "ab") as file:
+        file.write(b'{"id":6,"ts":"20')
+
+    for _ in range(3):
+        service.execute_action(ana, ActiveFace.RECOVER)
+    with NdjsonHistoryWriter(tmp_path) as resumed:
+        assert resumed.last_event_id == 5 and resumed.path == writer.path
+        resumed.attach(history)
+    assert [e["id"] for e in lines(resumed)] == list(range(1, 9))
+
+    with NdjsonHistoryWriter(tmp_path, resume=False) as fresh:
+        assert fresh.path != writer.path and fresh.last_event_id == 0
+
+
+def test_histories_attached_in_sequence_are_exported_as_separate_games(tmp_path):
+    with NdjsonHistoryWriter(tmp_path) as writer:
+        for game_number in range(2):
+            Player.player_arrangement.clear()
+            history, service, ana, ben = game()
+            assert writer.attach(history) == game_number
+            for _ in range(3):
+                service.execute_action(ana, ActiveFace.RECOVER)
+            writer.detach(history)
+    assert [(e["game"], e["id"]) for e in lines(writer)] == [(0, 1), (0, 2), (0, 3), (1, 1), (1, 2), (1, 3)]
+
+    # resuming continues the last game, the next history attached is a new one
+    history, service, ana, ben = game()
+    service.execute_action(ana, ActiveFace.RECOVER)
+    with NdjsonHistoryWriter(tmp_path) as resumed:
+        assert (resumed.game, resumed.last_event_id) == (1, 3)
+        assert resumed.attach(history) == 1
+        assert resumed.attach(HistoryService()) == 2
+    assert len(lines(resumed)) == 6
+
+
+def test_resume_reads_the_previous_file_when_the_newest_has_no_complete_line(tmp_path):
+    history, service, ana, ben = game()
+    for _ in range(12):
+        service.execute_action(ana, ActiveFace.RECOVER)
+    with NdjsonHistoryWriter(tmp_path, max_bytes=300, flush_every=4) as writer:
+        writer.attach(history)
+    # a crash right after a rotation, in the middle of the first line of the new file
+    rotated = tmp_path / f"history-{len(writer.files()):06d}.ndjson"
+    rotated.write_bytes(b'{"game":0,"id":13,"ts"')
+
+    for _ in range(2):
+        service.execute_action(ana, ActiveFace.RECOVER)
+    with NdjsonHistoryWriter(tmp_path, max_bytes=300) as resumed:
+        assert resumed.last_event_id == 12 and resumed.path == rotated
+        resumed.attach(history)
+    assert [e["id"] for e in lines(resumed)] == list(range(1, 15))
@@ -0,0 +1,101 @@
+import pytest
+
+from models import Player, GameState, Status
+from services import TurnResolverService
+
+
+@pytest.fixture(autouse=True)
+def reset_players():
+    # Ensure global state does not leak between tests
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+def test_player_starts_with_own_state():
+    a = Player("A", hp=15, vp=2)
+    b = Player("B")
+    assert a.state is not b.state
+    assert a.state.hp == [15] and a.state.vp == [2] and a.state.alive == [True]
+
+
+def test_from_players_binds_players_as_views():
+    a, b = Player("A", hp=12), Player("B", vp=3)
+    a.last_targetedto = "B"
+    state = GameState.from_players([a, b])
+
+    assert state.names == ("A", "B")
+    assert state.hp == [12, 20] and state.vp == [0, 3]
+    assert state.targeted_to == ["B", None]
+    assert (a.state, a.seat, b.state, b.seat) == (state, 0, state, 1)
+
+    a.take_damage(12)
+    b.gain_vp(1)
+    assert state.hp[0] == 0 and state.alive == [False, True]
+    assert a.status == Status.FALLEN
+    assert state.vp == [0, 4]
+
+    state.hp[1] = 7
+    assert b.hp == 7
+
+
+def test_clone_is_independent():
+    a, b = Player("A"), Player("B")
+    state = GameState.from_players([a, b])
+    clone = state.clone()
+    assert clone == state and clone is not state
+    assert clone.names is state.names
+
+    clone.hp[0] -= 5
+    clone.alive[1] = False
+    clone.targeted_by[0] = "B"
+    clone.round = 3
+    assert a.hp == 20 and b.status == Status.ALIVE and a.last_targetedby is None
+    assert state.round == 0
+    assert clone != state
+
+
+def test_snapshot_restore_roundtrip():
+    a, b = Player("A"), Player("B")
+    state = GameState.from_players([a, b])
+    snap = state.snapshot()
+    hash(snap)
+
+    a.take_damage(5)
+    b.gain_vp(2)
+    a.last_targetedby = "B"
+    state.round = 4
+    state.restore(snap)
+    assert (a.hp, b.vp, a.last_targetedby, state.round) == (20, 0, None, 0)
+    assert GameState.from_snapshot(snap) == state
+
+    other = GameState(("X", "Y"))
+    with pytest.raises(ValueError):
+        other.restore(snap)
+
+
+def test_clear_targets_and_alive_count():
+    state = GameState(("A", "B", "C"), alive=(True, False, True), targeted_to=("B", None, "A"))
+    assert state.alive_count == 2
+    state.clear_targets()
+    assert state.targeted_to == [None, None, None] and state.targeted_by == [None, None, None]
+
+
+def test_set_participants_shares_one_state():
+    players = [Player(f"P{i}") for i in range(3)]
+    TurnResolverService.set_participants(players)
+    state = TurnResolverService.state
+    assert all(p.state is state for p in players)
+    assert [p.seat for p in players] == [0, 1, 2]
+
+
+def test_ranks_break_ties_like_the_rank_service():
+    from services import IngameRankService
+
+    # seat order is not name order, so a seat order tie-break would disagree
+    players = [Player(name, hp=hp, vp=vp) for name, hp, vp in (("Zed", 10, 2), ("Amy", 10, 2), ("Max", 12, 2), ("Bo", 10, 1))]
+    state = GameState.from_players(players)
+    service = IngameRankService(players)
+    service.initiate_ranks()
+    service.check_rank()
+    assert state.ranks() == [service.rank_of(p.player_id)["rank"] for p in players] == [3, 2, 1, 4]
@@ -0,0 +1,84 @@
+import pytest
+
+from controllers.session import GameSession
+from models import ActiveFace, Player
+from services import HistoryService
+
+
+@pytest.fixture(autouse=True)
+def clear_players():
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+def recorded(columnar=False):
+    session = GameSession(("Ana", "Ben", "Cy"), seed=1)
+    ana, ben, cy = (session.players.by_name(name) for name in ("Ana", "Ben", "Cy"))
+    history = HistoryService(validate=not columnar, columnar=columnar)
+    history.record_event(history.next_event_id(), ana, ActiveFace.JAB, ben, damage_dealt=2)
+    history.record_event(history.next_event_id(), ben, ActiveFace.PICKPOCKET, ana, vp_stolen=1)
+    ana.state.round = 1
+    history.record_events([
+        (cy, ActiveFace.RECOVER, None, None, 3, None, None),
+        (ana, ActiveFace.PICKPOCKET, cy, None, None, None, 1),
+        (ana, ActiveFace.JAB, cy, 2, None, None, None),
+    ])
+    return history, ana, ben, cy
+
+
+def scanned(history, match):
+    return {event_id: record for event_id, record in history.get_events().items() if match(event_id, record)}
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_queries_match_a_scan_of_the_history(columnar):
+    history, ana, ben, cy = recorded(columnar)
+    queries = [
+        (dict(rolled_by=ana), lambda i, r: r.rolled_by is ana),
+        (dict(target=cy), lambda i, r: r.participants[1] is cy),
+        (dict(dice_face_value=ActiveFace.PICKPOCKET), lambda i, r: r.dice_face_value is ActiveFace.PICKPOCKET),
+        (dict(round=1), lambda i, r: i >= 3),
+        (dict(rolled_by=ana, dice_face_value=ActiveFace.PICKPOCKET), lambda i, r: i == 4),
+        (dict(target=cy, round=0), lambda i, r: False),
+        (dict(), lambda i, r: True),
+    ]
+    for filters, match in queries:
+        found = history.find_events(**filters)
+        assert list(found) == list(scanned(history, match)), filters
+    assert list(history.find_events(target=cy)) == [3, 4, 5]
+    assert history.index.round_ids(0) == range(1, 3) and history.index.round_ids(7) == range(0)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_removed_and_rewritten_events_leave_the_results(columnar):
+    history, ana, ben, cy = recorded(columnar)
+    record = history.history.pop(5)
+    assert list(history.find_events(rolled_by=ana)) == [1, 4]
+    history.history[5] = record
+    assert list(history.find_events(rolled_by=ana)) == [1, 4, 5]
+
+    history.record_event(1, cy, ActiveFace.RECOVER, healing_done=3)
+    assert list(history.find_events(rolled_by=ana)) == [4, 5]
+    assert list(history.find_events(rolled_by=cy)) == [3, 1]
+    assert list(history.find_events(dice_face_value=ActiveFace.JAB)) == [5]
+
+
+def test_round_queries_of_a_turn_resolver_game():
+    from controllers.api import Action_service
+    from services import TurnResolverService, RandomPolicy
+
+    players = [Player(name) for name in ("Ana", "Ben", "Cy")]
+    history = HistoryService()
+    resolver = TurnResolverService(Action_service(history))
+    resolver.set_participants(players)
+    recorded_in: dict[int, int] = {}
+    history.subscribe(lambda event_id, record: recorded_in.setdefault(event_id, resolver.state.round))
+    for _ in range(4):
+        resolver.play_round([RandomPolicy(seed) for seed in range(3)])
+
+    assert sorted(history.index.rounds) == [0, 1, 2, 3]
+    for round in range(4):
+        expected = [event_id for event_id, r in recorded_in.items() if r == round]
+        assert expected and list(history.find_events(round=round)) == expected
+        assert list(history.index.round_ids(round)) == expected
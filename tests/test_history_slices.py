@@ -0,0 +1,73 @@
+import pickle
+
+import pytest
+
+from controllers.session import GameSession
+from models import ActiveFace, Player
+from services import HistoryService, TurnResolverService
+from controllers.api import Action_service
+from services.EventLog import EventDict
+
+
+@pytest.fixture(autouse=True)
+def clear_players():
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+def recorded(columnar: bool, events: int = 12) -> HistoryService:
+    session = GameSession(("Ana", "Ben"), seed=1)
+    ana, ben = session.players.by_name("Ana"), session.players.by_name("Ben")
+    history = HistoryService(columnar=columnar)
+    for i in range(events):
+        if i % 2:
+            history.record_event(history.next_event_id(), ana, ActiveFace.JAB, ben, damage_dealt=2)
+        else:
+            history.record_event(history.next_event_id(), ben, ActiveFace.RECOVER, healing_done=3)
+    return history
+
+
+RANGES = [(None, None), (0, 3), (-3, None), (2, -2), (-1, None), (5, 2), (-50, 4), (10, 50), (None, -11)]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_ranges_match_slicing_the_listed_history(columnar):
+    history = recorded(columnar)
+    # middle removals leave gaps in the ids
+    del history.history[4]
+    history.history.pop(7)
+    listed = list(history.history.items())
+    for start, end in RANGES:
+        expected = dict(listed[start:end])
+        assert history.get_events(start, end) == expected
+        assert dict(history.iter_events(start, end)) == expected
+    assert list(history.tail(3)) == [10, 11, 12]
+    assert history.tail(0) == {} and len(history.tail(100)) == 10
+
+
+def test_event_dict_keeps_its_ids_in_order():
+    history = recorded(False, events=4)
+    events = history.history
+    assert isinstance(events, EventDict) and events.ids == [1, 2, 3, 4]
+    record = events.popitem()[1]
+    events.update({9: record, 2: record})
+    events.setdefault(10, record)
+    assert events.ids == [1, 2, 3, 9, 10] == list(events)
+    events |= [(11, record)]
+    del events[2]
+    assert events.ids == [1, 3, 9, 10, 11]
+    restored = pickle.loads(pickle.dumps(events))
+    assert restored.ids == [1, 3, 9, 10, 11] == list(restored)
+    events.clear()
+    assert events.ids == [] and events == {}
+
+
+def test_turn_history_reads_the_last_event_only(monkeypatch):
+    history = recorded(False)
+    resolver = TurnResolverService(Action_service(history))
+    reads = []
+    iter_slice = EventDict.iter_slice
+    monkeypatch.setattr(EventDict, "iter_slice", lambda self, *args: reads.append(args) or iter_slice(self, *args))
+    assert resolver.get_history == [" Ana got JAB and dealt -2 damage to Ben."]
+    assert reads == [(-1,)]
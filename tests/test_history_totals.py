@@ -0,0 +1,84 @@
+import pytest
+
+from controllers.session import GameSession
+from models import ActiveFace, Player
+from services import HistoryService
+from services.types import EventTotals
+from utils import GameStateValidator
+
+
+@pytest.fixture(autouse=True)
+def clear_players():
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+def players():
+    session = GameSession(("Ana", "Ben"), seed=1)
+    return session.players.by_name("Ana"), session.players.by_name("Ben")
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("batched", [False, True])
+def test_totals_follow_the_recorded_events(columnar, batched):
+    ana, ben = players()
+    history = HistoryService(validate=not columnar, columnar=columnar)
+    events = [
+        (ana, ActiveFace.JAB, ben, 2, None, None, None),
+        (ana, ActiveFace.BACKFIRE, None, 3, None, None, None),
+        (ben, ActiveFace.RECOVER, None, None, 3, None, None),
+        (ben, ActiveFace.PICKPOCKET, ana, None, None, None, 1),
+        (ana, ActiveFace.POWER_MOVE, None, None, None, 2, None),
+        (ana, ActiveFace.JAB, ben, 2, None, None, None),
+    ]
+    if batched:
+        history.record_events(events)
+    else:
+        for event in events:
+            history.record_event(history.next_event_id(), *event)
+
+    # self-inflicted damage is taken, never dealt
+    assert history.player_totals(ana) == EventTotals(damage_dealt=4, damage_taken=3, vp_gained=2)
+    assert history.player_totals(ben) == EventTotals(damage_taken=4, healing=3, vp_stolen=1)
+    assert history.face_totals(ActiveFace.JAB) == EventTotals(damage_dealt=4, damage_taken=4)
+    assert history.face_totals(ActiveFace.BACKFIRE) == EventTotals(damage_taken=3)
+    assert history.face_totals(ActiveFace.STRIKE) == EventTotals()
+
+
+def test_overwritten_and_removed_events_leave_the_totals():
+    ana, ben = players()
+    history = HistoryService()
+    history.record_event(1, ana, ActiveFace.JAB, ben, damage_dealt=2)
+    history.record_event(1, ana, ActiveFace.STRIKE, ben, damage_dealt=4)
+    assert history.player_totals(ben).damage_taken == 4
+    assert history.face_totals(ActiveFace.JAB) == EventTotals()
+
+    record = history.remove_event(1)
+    assert history.player_totals(ben).damage_taken == 0 and history.remove_event(1) is None
+    history.restore_event(1, record)
+    assert history.player_totals(ana).damage_dealt == 4
+
+
+def test_undo_and_redo_keep_the_totals_exact():
+    session = GameSession(("Ana", "Ben"), seed=1, undoable=True)
+    ana, ben = session.players.by_name("Ana"), session.players.by_name("Ben")
+    session.action_service.execute_action(ana, ActiveFace.STRIKE, ben)
+    totals = session.history.player_totals(ben)
+    assert totals.damage_taken == 4
+    session.undo_stack.undo()
+    assert totals.damage_taken == 0
+    session.undo_stack.redo()
+    assert totals.damage_taken == 4
+
+
+def test_unindexed_histories_refuse_queries():
+    ana, _ = players()
+    history = HistoryService(validate=False, columnar=True, indexed=False)
+    history.record_event(history.next_event_id(), ana, ActiveFace.RECOVER, healing_done=3)
+    assert history.index is None and history.aggregates is None
+    with pytest.raises(GameStateValidator):
+        history.player_totals(ana)
+    with pytest.raises(GameStateValidator):
+        history.find_events(rolled_by=ana)
+    assert GameSession(("Ana", "Ben"), seed=1, trusted=True).history.indexed is False
@@ -1,6 +1,6 @@
 import pytest
 
-from models.Player import Player
+from models.Player import Player, MutationStatus
 from models.Dice import ActiveFace, FallenFace, Status
 from helpers import Randomizer
 from utils import (
@@ -128,3 +128,28 @@ def test_participlate_in_game_max_players(monkeypatch):
 
     with pytest.raises(SystemExit):  # currently the exit() is commented out for testing and systemexit exception is used instead
         Player("Overflow")
+
+
+def test_unchecked_primitives_return_status_codes():
+    p = Player("Fast")
+    other = Player("Mark")
+    assert p.take_damage_unchecked(5) is MutationStatus.OK and p.hp == 15
+    assert p.heal_unchecked(10) is MutationStatus.OK and p.hp == 20
+    assert p.steal_vp_unchecked(other, 1) is MutationStatus.INSUFFICIENT_VP and p.vp == 0
+    assert other.gain_vp_unchecked(2) is MutationStatus.OK
+    assert p.steal_vp_unchecked(other, 1) is MutationStatus.OK and (p.vp, other.vp) == (1, 1)
+    assert other.reduce_vp_unchecked(2) is MutationStatus.INSUFFICIENT_VP and other.vp == 1
+    assert other.reduce_vp_unchecked(1) is MutationStatus.OK and other.vp == 0
+
+    assert p.take_damage_unchecked(25) is MutationStatus.KNOCKED_OUT
+    assert p.status == Status.FALLEN and p.hp == 0
+    assert p.take_damage_unchecked(1) is MutationStatus.FALLEN and p.hp == 0
+    assert p.heal_unchecked(3) is MutationStatus.FALLEN and p.hp == 0
+
+
+def test_unchecked_primitives_match_the_validated_ones():
+    checked, fast = Player("Checked"), Player("Fast")
+    for name, amount in (("take_damage", 7), ("heal", 3), ("gain_vp", 3), ("reduce_vp", 2), ("take_damage", 30)):
+        getattr(checked, name)(amount)
+        getattr(fast, f"{name}_unchecked")(amount)
+        assert (checked.hp, checked.vp, checked.status) == (fast.hp, fast.vp, fast.status)
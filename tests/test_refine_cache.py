@@ -0,0 +1,68 @@
+import pytest
+
+from controllers.session import GameSession
+from models import ActiveFace, Player
+from services import HistoryService
+
+
+@pytest.fixture(autouse=True)
+def clear_players():
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Counts the events actually rendered."""
+    rendered = []
+    render = HistoryService._HistoryService__render
+    monkeypatch.setattr(HistoryService, "_HistoryService__render", staticmethod(lambda v: rendered.append(v) or render(v)))
+    return rendered
+
+
+def players():
+    session = GameSession(("Ana", "Ben"), seed=1)
+    return session.players.by_name("Ana"), session.players.by_name("Ben")
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_events_are_rendered_once_until_rewritten(renders, columnar):
+    ana, ben = players()
+    history = HistoryService(columnar=columnar)
+    history.record_event(1, ana, ActiveFace.JAB, ben, damage_dealt=2)
+    history.record_event(2, ben, ActiveFace.RECOVER, healing_done=3)
+
+    first = history.refine_event(history.get_events())
+    assert first == [" Ana got JAB and dealt -2 damage to Ben.", " Ben got RECOVER and healed +3 health to Ben."]
+    assert history.refine_event(history.get_events()) == first
+    assert len(renders) == 2
+
+    history.record_event(3, ana, ActiveFace.POWER_MOVE, vp_gained=3)
+    assert history.refine_event(history.get_events())[-1] == " Ana got POWER_MOVE and gained +3 VP."
+    assert len(renders) == 3
+
+    # rewriting an event renders it again, and only it
+    history.record_event(1, ana, ActiveFace.STRIKE, ben, damage_dealt=4)
+    assert history.refine_event(history.get_events())[0] == " Ana got STRIKE and dealt -4 damage to Ben."
+    assert len(renders) == 4
+
+
+def test_undone_and_redone_events_keep_their_lines(renders):
+    ana, ben = players()
+    history = HistoryService()
+    history.record_event(1, ana, ActiveFace.JAB, ben, damage_dealt=2)
+    history.refine_event(history.get_events())
+    record = history.history.pop(1)
+    history.history[1] = record
+    assert history.refine_event(history.tail(1)) == [" Ana got JAB and dealt -2 damage to Ben."]
+    assert len(renders) == 1
+
+
+def test_other_dicts_are_not_served_stale_lines():
+    ana, ben = players()
+    history, other = HistoryService(), HistoryService()
+    history.record_event(1, ana, ActiveFace.JAB, ben, damage_dealt=2)
+    other.record_event(1, ben, ActiveFace.BACKFIRE, damage_dealt=3)
+    history.refine_event(history.get_events())
+    assert history.refine_event(other.get_events()) == [" Ben got BACKFIRE and dealt -3 damage to Ben."]
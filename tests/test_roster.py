@@ -0,0 +1,97 @@
+import pickle
+
+import pytest
+
+from controllers.session import GameSession
+from models import Player, PlayerRoster
+from services import IngameRankService, TurnResolverService
+from utils import InputDataValidator
+
+
+@pytest.fixture(autouse=True)
+def clear_players():
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+def test_joining_assigns_stable_ids():
+    session = GameSession(("Ana", "Ben", "Cy"), seed=1)
+    ids = {p.name: p.player_id for p in session.players}
+    assert sorted(ids.values()) == [1, 2, 3]
+    # the seat shuffle of start() reorders the players but keeps their ids
+    for player in session.players:
+        assert session.players.by_id(player.player_id) is player
+        assert session.players.by_name(player.name) is player
+
+
+def loose(*names):
+    """Players that did not join any roster yet."""
+    players = [Player(name) for name in names]
+    Player.player_arrangement.clear()
+    for player in players:
+        player.player_id = None
+    return players
+
+
+def test_lookups_follow_every_mutation():
+    ana, ben, cy = loose("Ana", "Ben", "Cy")
+    roster = PlayerRoster([ana, ben])
+    roster.insert(0, cy)
+    assert (ana.player_id, ben.player_id, cy.player_id) == (1, 2, 3)
+    assert roster.by_id(cy.player_id) is cy
+
+    roster.remove(ben)
+    assert roster.by_id(ben.player_id) is None and roster.by_name("Ben") is None
+    roster[:] = [ben, ana]
+    assert roster.by_name("Cy") is None and roster.by_name("Ben") is ben
+    roster.clear()
+    assert roster.by_id(ana.player_id) is None
+
+
+def test_ids_are_never_reused_and_duplicate_names_resolve_to_the_first_seat():
+    first, twin_a, twin_b = loose("Ana", "Twin", "Twin")
+    roster = PlayerRoster([first])
+    roster.pop()
+    roster.extend([twin_a, twin_b])
+    assert (twin_a.player_id, twin_b.player_id) == (2, 3)
+    assert roster.by_name("Twin") is twin_a
+
+
+def test_roster_survives_pickling():
+    session = GameSession(("Ana", "Ben"), seed=2)
+    copy = pickle.loads(pickle.dumps(session.players))
+    assert [p.player_id for p in copy] == [p.player_id for p in session.players]
+    assert copy.by_name("Ben").player_id == session.players.by_name("Ben").player_id
+
+
+def test_plain_participant_lists_become_rosters():
+    players = [Player("Ana"), Player("Ben")]
+    resolver = TurnResolverService(action_service=None)
+    resolver.set_participants(players)
+    assert isinstance(resolver.participants, PlayerRoster)
+    assert resolver.participants.by_name("Ben") is players[1]
+
+
+def test_ranks_are_looked_up_by_id():
+    session = GameSession(("Ana", "Ben", "Cy"), seed=3)
+    ben = session.players.by_name("Ben")
+    ben.gain_vp(2)
+    session.ranking.check_rank()
+    assert session.ranking.rank_of(ben.player_id)["rank"] == 1
+    assert session.ranking.player_rank("Ben") is session.ranking.rank_of(ben.player_id)
+    assert all(r["player_id"] == session.players.by_name(r["player_name"]).player_id
+               for r in session.ranking.get_ranks_list)
+    with pytest.raises(InputDataValidator):
+        session.ranking.player_rank("Nobody")
+    with pytest.raises(InputDataValidator):
+        session.ranking.rank_of(99)
+
+
+def test_class_level_ranks_keep_working_with_ids():
+    p1, p2 = Player("p1"), Player("p2")
+    p2.gain_vp(1)
+    IngameRankService.initiate_ranks()
+    IngameRankService.check_rank()
+    assert IngameRankService().player_rank("p2")["rank"] == 1
+    assert IngameRankService().rank_of(p1.player_id)["player_name"] == "p1"
@@ -0,0 +1,111 @@
+import pytest
+
+from controllers.session import GameSession
+from models.Player import Player
+from models.Dice import Status
+from services import RandomPolicy, IngameRankService
+from helpers import Randomizer
+from utils import GameStateValidator, MaxPlayersValidator
+from configs.constants import SURVIVOR_VP
+
+NAMES = ("Ana", "Ben", "Cy", "Dee")
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    engine = Randomizer.engine
+    Player.player_arrangement.clear()
+    yield
+    Randomizer.use_engine(engine)
+    Player.player_arrangement.clear()
+
+
+def play_out(session: GameSession) -> list:
+    policies = [RandomPolicy() for _ in session.players]
+    for i, policy in enumerate(policies):
+        policy.reset(session.seed + i)
+    while not session.is_over:
+        session.play_round(policies)
+    return [(p.name, p.hp, p.vp, p.status) for p in session.players]
+
+
+def test_sessions_never_touch_the_lobby():
+    lobby_ranks = dict(IngameRankService.ranks)
+    session = GameSession(NAMES, seed=3)
+    play_out(session)
+    assert Player.player_arrangement == []
+    assert IngameRankService.ranks == lobby_ranks
+    assert sorted(p.name for p in session.players) == sorted(NAMES)
+
+
+def test_same_seed_replays_the_same_game():
+    assert play_out(GameSession(NAMES, seed=11)) == play_out(GameSession(NAMES, seed=11))
+
+
+def test_interleaved_sessions_do_not_interfere():
+    alone = [play_out(GameSession(NAMES, seed=s)) for s in (1, 2)]
+
+    first, second = GameSession(NAMES, seed=1), GameSession(NAMES, seed=2)
+    policies = {id(s): [RandomPolicy() for _ in NAMES] for s in (first, second)}
+    for session in (first, second):
+        for i, policy in enumerate(policies[id(session)]):
+            policy.reset(session.seed + i)
+    while not (first.is_over and second.is_over):
+        for session in (first, second):
+            if not session.is_over:
+                session.play_round(policies[id(session)])
+
+    assert [[(p.name, p.hp, p.vp, p.status) for p in s.players] for s in (first, second)] == alone
+    assert first.history is not second.history
+    assert not set(first.players) & set(second.players)
+
+
+def test_ranks_are_per_session():
+    first, second = GameSession(NAMES, seed=5), GameSession(NAMES, seed=6)
+    first.players[0].gain_vp(3)
+    first.ranking.check_rank()
+    assert first.ranking.get_ranks_list[0]["player_name"] == first.players[0].name
+    assert all(record["vp_count"] == 0 for record in second.ranking.get_ranks_list)
+
+
+def test_class_level_rank_service_still_uses_the_lobby():
+    GameSession(NAMES, seed=5)
+    lobby = [Player(name) for name in ("Eve", "Fay")]
+    IngameRankService.initiate_ranks()
+    assert sorted(r["player_name"] for r in IngameRankService().get_ranks_list) == ["Eve", "Fay"]
+    IngameRankService.ranks.clear()
+    assert all(p.session is None for p in lobby)
+
+
+def test_end_round_rewards_survivors_and_clears_targets():
+    session = GameSession(NAMES, seed=9)
+    shooter, target = session.players[0], session.players[1]
+    target.status = Status.FALLEN
+    shooter.last_targetedto = target
+    session.end_round()
+    assert session.round == 1 and session.state.round == 1
+    assert shooter.vp == SURVIVOR_VP and target.vp == 0
+    assert shooter.last_targetedto is None
+
+
+def test_lifecycle_is_validated():
+    session = GameSession(seed=1)
+    with pytest.raises(GameStateValidator):
+        session.state
+    session.join("Solo")
+    with pytest.raises(GameStateValidator):
+        session.start()
+    session.join("Duo")
+    session.start()
+    with pytest.raises(GameStateValidator):
+        session.join("Late")
+    with pytest.raises(GameStateValidator):
+        session.start()
+
+
+def test_full_session_raises_instead_of_exiting():
+    session = GameSession(seed=1)
+    for name in NAMES + ("Eli",):
+        session.join(name)
+    with pytest.raises(MaxPlayersValidator):
+        session.join("Extra")
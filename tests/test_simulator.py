@@ -0,0 +1,109 @@
+import pytest
+
+from controllers.simulator import HeadlessGameController
+from models.Player import Player
+from models.Dice import ActiveFace, Status
+from services import RandomPolicy, DecisionPolicy
+from helpers import Randomizer, RandomEngine
+from configs.constants import MAX_ROUNDS
+
+
+@pytest.fixture(autouse=True)
+def reset_state(monkeypatch):
+    engine = Randomizer.engine
+    # a headless game must never block on stdin
+    monkeypatch.setattr("builtins.input", lambda prompt="": pytest.fail("headless engine read stdin"))
+    Player.player_arrangement.clear()
+    yield
+    Randomizer.use_engine(engine)
+    Player.player_arrangement.clear()
+
+
+class AlwaysFirst(DecisionPolicy):
+    """Deterministic policy: first candidate, damage/steal options."""
+
+    def choose_target(self, player, face, candidates):
+        return candidates[0]
+
+    def choose_power_move(self, player, candidates):
+        return "damage_hp"
+
+    def choose_fallen_option(self, player, face, target):
+        return "damage_hp"
+
+
+def test_same_seed_replays_the_same_game():
+    controller = HeadlessGameController(RandomPolicy())
+    assert controller.play(17) == controller.play(17)
+    assert controller.play_many([1, 2, 3]) == [controller.play(s) for s in (1, 2, 3)]
+
+
+def test_game_runs_to_completion_with_valid_ranks():
+    summaries = HeadlessGameController(RandomPolicy()).play_many(range(40))
+    for summary in summaries:
+        assert 1 <= summary.rounds_played <= MAX_ROUNDS
+        alive = sum(seat.alive for seat in summary.seats)
+        assert summary.rounds_played == MAX_ROUNDS or alive <= 1
+        assert sorted(seat.rank for seat in summary.seats) == [1, 2, 3, 4, 5]
+        assert all(seat.hp >= 0 and seat.vp >= 0 for seat in summary.seats)
+        assert summary.winner.rank == 1
+
+
+def test_per_seat_policies_and_player_names():
+    controller = HeadlessGameController([AlwaysFirst(), RandomPolicy(), RandomPolicy()], player_names=["a", "b", "c"], max_rounds=3)
+    summary = controller.play(5)
+    assert sorted(seat.name for seat in summary.seats) == ["a", "b", "c"]
+    assert summary.rounds_played <= 3
+
+
+def test_play_turn_only_offers_alive_opponents(monkeypatch):
+    controller = HeadlessGameController(AlwaysFirst(), player_names=["a", "b", "c"], max_rounds=1)
+    offered = []
+
+    class Spy(AlwaysFirst):
+        def choose_target(self, player, face, candidates):
+            offered.append((player, face, list(candidates)))
+            return candidates[0]
+
+    controller.policies = [Spy()] * 3
+    # every game rolls its own session engine
+    monkeypatch.setattr(RandomEngine, "roll", lambda self: 5)  # STRIKE every turn
+    controller.play(1)
+    for player, face, candidates in offered:
+        assert face == ActiveFace.STRIKE
+        assert player not in candidates
+        assert all(c.status == Status.ALIVE for c in candidates)
+
+
+def test_tournament_results_do_not_depend_on_worker_count():
+    from controllers.tournament import run_tournament
+
+    inline = run_tournament(24, master_seed=9, workers=1, chunk_size=5)
+    pooled = run_tournament(24, master_seed=9, workers=2, chunk_size=5)
+    assert inline == pooled
+    assert inline.games == 24
+    assert sum(inline.wins) == 24
+    assert all(sum(counts) == 24 for counts in inline.rank_counts)
+    assert run_tournament(24, master_seed=10, workers=1, chunk_size=7) != inline
+
+
+def test_trusted_and_validated_paths_play_the_same_games():
+    trusted = HeadlessGameController(RandomPolicy())
+    validated = HeadlessGameController(RandomPolicy(), trusted=False)
+    assert trusted.play_many(range(20)) == validated.play_many(range(20))
+
+
+def test_incomplete_policies_cannot_be_instantiated():
+    class TargetsOnly(DecisionPolicy):
+        def choose_target(self, player, face, candidates):
+            return candidates[0]
+
+    with pytest.raises(TypeError, match="choose_fallen_option"):
+        TargetsOnly()
+    with pytest.raises(TypeError):
+        DecisionPolicy()
+
+
+def test_players_sharing_a_name_keep_their_own_rank():
+    summary = HeadlessGameController(RandomPolicy(), player_names=["Al", "Al", "Bo"]).play(4)
+    assert sorted(seat.rank for seat in summary.seats) == [1, 2, 3]
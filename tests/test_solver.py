@@ -0,0 +1,69 @@
+import pytest
+
+from controllers.solver import ExpectimaxSolver, TranspositionTable
+from models import GameState
+from configs import DEFAULT_RULESET
+
+LAST_ROUND = DEFAULT_RULESET.max_rounds - 1
+
+
+def last_turn_position():
+    # B plays the last turn of the game one VP behind A
+    return GameState(("A", "B"), hp=(20, 20), vp=(5, 4), round=LAST_ROUND, turn=1)
+
+
+def test_last_turn_is_exact():
+    # B only wins with POWER_MOVE (+3 VP) or PICKPOCKET (5 vs 4 after the survivor VP)
+    solver = ExpectimaxSolver()
+    assert solver.value(last_turn_position()) == pytest.approx((4 / 6, 2 / 6))
+    assert solver.win_probability(last_turn_position(), 1) == pytest.approx(2 / 6)
+
+
+def test_best_move_maximizes_own_win_probability():
+    solver = ExpectimaxSolver()
+    move, value = solver.best_move(last_turn_position(), 2)
+    assert move == (-1, 1)  # POWER_MOVE, gain VP
+    assert value == (0.0, 1.0)
+
+
+def test_terminal_value_and_state_untouched():
+    solver = ExpectimaxSolver()
+    over = GameState(("A", "B", "C"), hp=(5, 0, 9), vp=(4, 4, 2), alive=(True, False, True), round=DEFAULT_RULESET.max_rounds)
+    assert solver.value(over) == (1.0, 0.0, 0.0)
+
+    state = GameState(("A", "B", "C"), hp=(5, 0, 9), vp=(4, 6, 2), alive=(True, False, True), round=LAST_ROUND)
+    before = state.snapshot()
+    value = solver.value(state)
+    assert state.snapshot() == before
+    assert sum(value) == pytest.approx(1.0)
+
+
+def test_key_ignores_targets_of_seats_that_played():
+    a = GameState(("A", "B", "C"), targeted_to=("B", None, None), targeted_by=(None, "A", None), turn=1)
+    b = GameState(("A", "B", "C"), turn=1)
+    assert ExpectimaxSolver.key(a) == ExpectimaxSolver.key(b)
+    b.targeted_to[2] = "A"
+    assert ExpectimaxSolver.key(a) != ExpectimaxSolver.key(b)
+
+
+def test_bounded_table_gives_the_same_values():
+    state = GameState(("A", "B", "C"), hp=(6, 3, 9), vp=(4, 5, 2), round=LAST_ROUND)
+    full = ExpectimaxSolver()
+    small = ExpectimaxSolver(max_entries=16)
+    assert small.value(state) == pytest.approx(full.value(state))
+    assert len(small.table) == 16
+    assert small.table.evictions > 0
+    assert full.table.hits > 0 and 0 < full.table.hit_rate < 1
+
+
+def test_transposition_table_lru():
+    table = TranspositionTable(max_entries=2)
+    table.put("a", (1.0,))
+    table.put("b", (2.0,))
+    assert table.get("a") == (1.0,)  # "b" is now the least recently used
+    table.put("c", (3.0,))
+    assert "b" not in table and "a" in table and "c" in table
+    assert table.get("b") is None
+    assert (table.hits, table.misses, table.evictions) == (1, 1, 1)
+    with pytest.raises(ValueError):
+        TranspositionTable(0)
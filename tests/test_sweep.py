@@ -0,0 +1,78 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from controllers.sweep import run_sweep, grid, random_sample, cell_key, ResultCache
+from configs import DEFAULT_RULESET, Ruleset
+
+
+def test_grid_and_random_sample():
+    cells = grid(jab_dmg=(1, 2, 3), strike_hp=(4, 5))
+    assert len(cells) == 6
+    assert {(c.jab_dmg, c.strike_hp) for c in cells} == {(j, s) for j in (1, 2, 3) for s in (4, 5)}
+    assert all(c.recover_hp == DEFAULT_RULESET.recover_hp for c in cells)
+
+    sample = random_sample(20, seed=3, power_move_vp=(1, 5))
+    assert sample == random_sample(20, seed=3, power_move_vp=(1, 5))
+    assert all(1 <= c.power_move_vp <= 5 for c in sample)
+
+
+def test_cell_key_is_content_addressed():
+    key = cell_key(DEFAULT_RULESET, "random", 0, 0, 100, 5)
+    assert key == cell_key(DEFAULT_RULESET, "random", 0, 0, 100, 5)
+    assert key != cell_key(DEFAULT_RULESET._replace(jab_dmg=3), "random", 0, 0, 100, 5)
+    assert key != cell_key(DEFAULT_RULESET, "random", 0, 1, 100, 5)
+    assert key != cell_key(DEFAULT_RULESET, "random", 1, 0, 100, 5)
+
+
+def test_rerun_and_extension_only_play_missing_chunks(tmp_path):
+    cells = grid(jab_dmg=(1, 3))
+    first = run_sweep(cells, 200, cache_dir=tmp_path, workers=1, chunk_size=100)
+    assert [c.cached_chunks for c in first] == [0, 0]
+    assert len(list(tmp_path.glob("*.json"))) == 4
+
+    again = run_sweep(cells, 200, cache_dir=tmp_path, workers=1, chunk_size=100)
+    assert [c.cached_chunks for c in again] == [2, 2]
+    assert [c.wins for c in again] == [c.wins for c in first]
+
+    extended = run_sweep(cells + grid(jab_dmg=(2,)), 300, cache_dir=tmp_path, workers=1, chunk_size=100)
+    assert [c.cached_chunks for c in extended] == [2, 2, 0]
+    assert all(c.games == 300 for c in extended)
+
+
+def test_cell_statistics():
+    cell, = run_sweep([DEFAULT_RULESET], 400, workers=1, chunk_size=200)
+    assert cell.games == 400 and sum(cell.wins) == pytest.approx(400)
+    assert sum(cell.seat_advantage) == pytest.approx(0.0)
+    assert cell.max_seat_advantage == max(abs(a) for a in cell.seat_advantage)
+    assert sum(cell.rounds_hist) == 400
+    assert cell.mean_rounds == pytest.approx(sum(r * n for r, n in enumerate(cell.rounds_hist)) / 400)
+    assert 0 < cell.std_rounds and 0 <= cell.full_length_rate <= 1
+
+
+def test_tied_games_give_no_seat_an_advantage():
+    # nothing changes hp or vp, every game ends in a tie of all seats
+    still = Ruleset(max_rounds=1, **{name: 0 for name in Ruleset._fields if name != "max_rounds"})
+    cell, = run_sweep([still], 100, workers=1, chunk_size=100)
+    assert cell.wins == pytest.approx([20.0] * 5)
+    assert cell.max_seat_advantage == pytest.approx(0.0)
+
+
+def test_parallel_matches_inline(tmp_path):
+    cells = grid(strike_hp=(3, 6))
+    inline = run_sweep(cells, 200, workers=1, chunk_size=100)
+    parallel = run_sweep(cells, 200, workers=2, chunk_size=100)
+    assert [(c.wins, c.rounds, c.rounds_hist) for c in inline] == [(c.wins, c.rounds, c.rounds_hist) for c in parallel]
+
+
+def test_cache_ignores_corrupt_entries(tmp_path):
+    cache = ResultCache(tmp_path)
+    (tmp_path / "abc.json").write_text("{not json")
+    assert cache.get("abc") is None
+    cache.put("abc", {"games": 1})
+    assert cache.get("abc") == {"games": 1} and "abc" in cache
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        run_sweep([DEFAULT_RULESET], 10, policy="nope")
@@ -0,0 +1,145 @@
+import pytest
+
+from controllers.api import Action_service
+from controllers.session import GameSession
+from models import ActiveFace, FallenFace, GameState, Player, Status
+from services import HistoryService, UndoStack
+from utils import InvalidPlayerActionValidator
+
+
+@pytest.fixture(autouse=True)
+def clear_players():
+    Player.player_arrangement.clear()
+    yield
+    Player.player_arrangement.clear()
+
+
+def undoable_session():
+    session = GameSession(("Ana", "Ben", "Cy"), seed=1, undoable=True)
+    return session, [session.players.by_name(n) for n in ("Ana", "Ben", "Cy")]
+
+
+def test_checkpoint_and_rollback_touch_only_the_saved_seats():
+    state = GameState(("A", "B", "C"), hp=[5, 6, 7], round=2, turn=1)
+    saved = state.checkpoint(1, 2)
+    state.hp[1], state.vp[2], state.alive[2], state.targeted_by[2] = 0, 4, False, "B"
+    state.hp[0], state.turn = 1, 2
+    state.rollback(saved)
+    assert state.snapshot() == (("A", "B", "C"), (1, 6, 7), (0, 0, 0), (True, True, True), (None,) * 3, (None,) * 3, 2, 1)
+    # a single seat checkpoint, `other` equal to `seat` saves it once
+    assert state.checkpoint(0, 0) == state.checkpoint(0) == (2, 1, 0, 1, 0, True, None, None)
+
+
+def test_undo_restores_state_and_history_redo_replays_them():
+    session, (ana, ben, cy) = undoable_session()
+    start = session.state.snapshot()
+    service = session.action_service
+
+    service.execute_action(ana, ActiveFace.STRIKE, ben)
+    service.execute_action(cy, ActiveFace.POWER_MOVE, choice_action="gain_vp")
+    after = session.state.snapshot()
+    assert list(session.history.history) == [1, 2]
+
+    assert session.undo_stack.undo().player is cy
+    assert session.undo_stack.undo().player is ana
+    assert session.undo_stack.undo() is None
+    assert session.state.snapshot() == start
+    assert session.history.history == {}
+
+    session.undo_stack.redo()
+    session.undo_stack.redo()
+    assert session.state.snapshot() == after
+    assert list(session.history.history) == [1, 2]
+    assert session.history.history[1].damage_dealt == [(ben, 4)]
+
+
+def test_undo_revives_a_knocked_out_player():
+    session, (ana, ben, _) = undoable_session()
+    ben.take_damage(18)
+    session.action_service.execute_action(ana, ActiveFace.STRIKE, ben)
+    assert ben.status == Status.FALLEN and ana.last_targetedto == "Ben"
+    session.undo_stack.undo()
+    assert (ben.hp, ben.status, ben.last_targetedby, ana.last_targetedto) == (2, Status.ALIVE, None, None)
+
+
+def test_a_new_action_drops_the_redo_and_never_reuses_ids():
+    session, (ana, ben, _) = undoable_session()
+    service, stack = session.action_service, session.undo_stack
+    service.execute_action(ana, ActiveFace.JAB, ben)
+    stack.undo()
+    service.execute_action(ana, ActiveFace.RECOVER)
+    assert not stack.can_redo and stack.redo() is None
+    assert list(session.history.history) == [2]
+
+
+def test_rejected_actions_push_nothing():
+    session, (ana, ben, _) = undoable_session()
+    with pytest.raises(InvalidPlayerActionValidator):
+        session.action_service.execute_action(ana, ActiveFace.JAB)
+    assert len(session.undo_stack) == 0
+    # a recorded action without effect is still a move to take back
+    assert session.action_service.execute_action(ana, ActiveFace.PICKPOCKET, ben) is False
+    assert len(session.undo_stack) == 1
+
+
+def test_batches_push_one_delta_per_applied_action():
+    session, (ana, ben, cy) = undoable_session()
+    start = session.state.snapshot()
+    cy.status = Status.FALLEN
+    results = session.action_service.execute_actions([
+        (ana, ActiveFace.JAB, ben, None),
+        (ben, ActiveFace.POWER_MOVE, None, "damage_hp"),  # invalid: needs a target
+        (cy, FallenFace.PLUS2HP_OR_PLUS1VP, ana, "gain_vp"),
+    ])
+    assert results[0] is True and results[2] is True
+    assert len(session.undo_stack) == 2
+
+    assert session.undo_stack.undo().event_id == 2
+    assert ana.vp == 0 and list(session.history.history) == [1]
+    assert session.undo_stack.undo().event_id == 1
+    cy.status = Status.ALIVE
+    assert session.state.snapshot() == start
+
+
+def test_players_of_different_states_are_both_restored():
+    ana, ben = Player("Ana"), Player("Ben")
+    assert ana.state is not ben.state
+    stack = UndoStack()
+    service = Action_service(HistoryService(), undo_stack=stack)
+    ben.gain_vp(1)
+    service.execute_action(ana, ActiveFace.PICKPOCKET, ben)
+    assert (ana.vp, ben.vp) == (1, 0)
+    stack.undo()
+    assert (ana.vp, ben.vp, ana.last_targetedto, ben.last_targetedby) == (0, 1, None, None)
+
+
+def test_ending_a_round_forgets_its_moves():
+    session, (ana, _, _) = undoable_session()
+    session.action_service.execute_action(ana, ActiveFace.RECOVER)
+    session.end_round()
+    assert not session.undo_stack.can_undo
+    assert GameSession(("Ana", "Ben"), seed=1).undo_stack is None
+
+
+def test_limit_forgets_the_oldest_moves():
+    session, (ana, _, _) = undoable_session()
+    stack = UndoStack(session.history, limit=2)
+    service = Action_service(session.history, undo_stack=stack)
+    for _ in range(3):
+        service.execute_action(ana, ActiveFace.BACKFIRE)
+    assert len(stack) == 2
+    stack.undo(), stack.undo()
+    assert ana.hp == 17 and list(session.history.history) == [1]
+
+
+def test_no_effect_rolls_are_recorded_and_undone_like_actions():
+    session, (ana, ben, cy) = undoable_session()
+    start = session.state.snapshot()
+    assert session.action_service.record_no_effect(ana, ActiveFace.JAB) is False
+    event = session.history.history[1]
+    assert event.rolled_by is ana and event.dice_face_value is ActiveFace.JAB and not event.damage_dealt
+    assert session.state.snapshot() == start
+
+    assert session.undo_stack.undo().player is ana and session.history.history == {}
+    session.undo_stack.redo()
+    assert list(session.history.history) == [1]
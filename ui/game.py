@@ -6,6 +6,7 @@ from __future__ import annotations
 import sys
 import math
 import random
+from typing import Iterable
 import pygame
 import pygame.gfxdraw
 import pygame_gui
@@ -18,22 +19,23 @@ from .theme import (
 from .player_profiles import PLAYER_PROFILES, BGM_FILE
 from .components import LogFeed, PlayerVisual, Dice
 
-from controllers.orchestrator import GameController
-from controllers.api import Action_service
-from services import HistoryService, TurnResolverService, IngameRankService
+from controllers.session import GameSession
+from controllers.bot import BotWorker
 from models import Player, Status, ActiveFace, FallenFace, active_face_vals, fallen_face_vals
-from configs.constants import MAX_ROUNDS, TOTAL_PLAYERS
+from models.GameState import OPTION_HP
+from configs.constants import TOTAL_PLAYERS, AI_SEATS
 
 
 # Configuration
 DEFAULT_W, DEFAULT_H = 1280, 800
 FPS = 60
+AI_ROLL_DELAY = FPS // 2  # frames an AI seat waits before rolling, so its turn can be followed
 
 
 class Game:
     """Main game class that manages the UI and integrates with backend services."""
     
-    def __init__(self):
+    def __init__(self, seed: int | None = None, ai_seats: Iterable[int] = ()):
         pygame.init()
         pygame.mixer.init()
         
@@ -57,29 +59,36 @@ class Game:
             print(f"[BGM] Error: {e}")
         
         # --- BACKEND SERVICES ---
-        self.history_service = HistoryService()
-        self.action_service = Action_service(self.history_service)
-        self.ranking_service = IngameRankService()
-        self.turn_resolver = TurnResolverService(self.action_service)
-        
-        # Clear any existing players from previous runs
-        Player.player_arrangement.clear()
+        # every game (and every restart) is a fresh session owning its players, dice, history and ranks
+        self.session = GameSession(seed=seed, undoable=True)
+        self.dice_engine = self.session.engine
+        self.history_service = self.session.history
+        self.action_service = self.session.action_service
+        self.ranking_service = self.session.ranking
+        self.turn_resolver = self.session.turn_resolver
         
         # Initialize players with names from profiles
         self.backend_players: list[Player] = []
         for i in range(TOTAL_PLAYERS):
             profile = PLAYER_PROFILES.get(i, {})
             name = profile.get("name", f"Player {i+1}").split()[0]  # Use first word as name
-            player = Player(name=name)
+            player = self.session.join(name)
             self.backend_players.append(player)
         
-        # Set up turn resolver with participants
-        self.turn_resolver.set_participants(Player.player_arrangement)
-        self.ranking_service.initiate_ranks()
+        # Shuffle the seats and set up turn resolver and ranks with the participants
+        self.session.start()
         
         self.player_visuals: list[PlayerVisual] = []
-        for i, player in enumerate(Player.player_arrangement):
+        for i, player in enumerate(self.session.players):
             self.player_visuals.append(PlayerVisual(player, i))
+        # player id -> visual, the sidebar looks up every ranked player each frame
+        self.visual_by_id = {pv.player.player_id: pv for pv in self.player_visuals}
+
+        # --- AI SEATS ---
+        # seats played by the MCTS bot, its searches run on a worker so rendering never waits for them
+        self.ai_seats = frozenset(ai_seats)
+        self.bot_worker = BotWorker() if self.ai_seats else None
+        self.ai_idle_frames = 0
         
         self.dice = Dice()
         self.log_feed: LogFeed | None = None
@@ -109,6 +118,7 @@ class Game:
         
         self.layout(DEFAULT_W, DEFAULT_H)
         self.add_log("System Ready. Game Initialized.", C_SUCCESS)
+        self.add_log(f"Game Seed: {self.dice_engine.seed}", C_TEXT_DIM)
         self.play_audio()
 
     def draw_bg(self) -> None:
@@ -212,10 +222,74 @@ class Game:
             if p.sound:
                 self.voice_channel.play(p.sound)
 
+    # --- AI ---
+    @property
+    def is_ai_turn(self) -> bool:
+        return self.turn in self.ai_seats and self.state != "GAME_OVER"
+
+    def update_ai(self) -> None:
+        """Plays the AI seat whose turn it is, one step per frame: roll, start the search, apply its result."""
+        if self.bot_worker is None or not self.is_ai_turn:
+            return
+
+        if self.state == "IDLE":
+            self.ai_idle_frames += 1
+            if self.ai_idle_frames >= AI_ROLL_DELAY:
+                self.ai_idle_frames = 0
+                self.roll_dice()
+            return
+
+        if self.state not in ("TARGET", "CHOICE", "TARGET_FALLEN"):
+            return
+        if not self.bot_worker.busy:
+            state = self.session.state
+            state.turn = self.turn
+            self.bot_worker.submit(state, self.turn, self.payload['roll'])
+            self.sub_prompt = "AI is thinking..."
+            return
+
+        result = self.bot_worker.poll()
+        if result is None:
+            return
+        self.add_log(f"AI searched {result.rollouts} games ({result.rollouts_per_second:,.0f}/s)", C_TEXT_DIM)
+        self.apply_ai_move(result.move)
+
+    def apply_ai_move(self, move: tuple[int, int]) -> None:
+        """Replays the bot's (target seat, option) decision through the same handlers as the mouse and buttons."""
+        target, option = move
+        act = self.payload['type']
+
+        if act == "choice":
+            if target < 0 or option != OPTION_HP:
+                self.handle_choice("vp_3")
+                return
+            self.handle_choice("dmg_6")
+
+        if target < 0:
+            # no valid target: the roll is recorded without effect, like a fallen seat's no-target roll
+            player_visual = self.player_visuals[self.turn]
+            face_value = self.payload['face_value']
+            if isinstance(face_value, FallenFace):
+                self.action_service.execute_action(player=player_visual.player, action=face_value)
+            else:
+                self.action_service.record_no_effect(player_visual.player, face_value)
+            self.add_log(f"{player_visual.display_name} had no target, no effect", C_TEXT_DIM)
+            self.next_turn()
+            return
+
+        self.handle_target(self.player_visuals[target])
+        if act == "buff":
+            self.handle_choice("buff_hp" if option == OPTION_HP else "buff_vp")
+        elif act == "curse":
+            self.handle_choice("curse_hp" if option == OPTION_HP else "curse_vp")
+
     # --- GAME LOGIC ---
     def roll_dice(self) -> None:
         """Handle dice roll initiation."""
         self.state = "ROLLING"
+        for b in self.buttons:
+            b.kill()
+        self.buttons = []
         player_visual = self.player_visuals[self.turn]
         backend_player = player_visual.player
         
@@ -449,30 +523,24 @@ class Game:
         """Advance to the next turn."""
         self.turn += 1
         if self.turn >= TOTAL_PLAYERS:
-            self.round += 1
+            # Award VP to survivors and reset targeting restrictions for new round
+            self.session.end_round()
+            self.round = self.session.round + 1
             self.turn = 0
             self.add_log(f"--- ROUND {self.round} START ---", C_TEXT_DIM)
             
-            # Award VP to survivors (from turn resolver logic)
-            alive_count = 0
-            for pv in self.player_visuals:
-                if pv.alive:
-                    pv.player.gain_vp(1)
-                    alive_count += 1
-            
-            # Reset targeting restrictions for new round
-            for p in Player.player_arrangement:
-                p.last_targetedby = None
-                p.last_targetedto = None
-            
             # Check game over conditions
-            if alive_count <= 1 or self.round > MAX_ROUNDS:
+            if self.session.is_over:
                 self.game_over()
                 return
             
             # Update rankings
             self.ranking_service.check_rank()
 
+        self.start_turn()
+
+    def start_turn(self) -> None:
+        """Wait for the player whose turn it is to roll, offering to take back the last move of the round."""
         self.state = "IDLE"
         active = self.player_visuals[self.turn]
         
@@ -482,9 +550,23 @@ class Game:
         
         if not active.alive:
             self.sub_prompt = "Ghost Turn - Click Dice"
+
+        if self.session.undo_stack.can_undo and not self.is_ai_turn:
+            self.create_buttons(["TAKE BACK"], ["take_back"])
+        else:
+            self.create_buttons([], [])
         
         self.play_audio()
 
+    def take_back(self) -> None:
+        """Undo the last move of the round through the session's undo stack and hand the turn back to its player."""
+        delta = self.session.undo_stack.undo()
+        if delta is None:
+            return
+        self.turn = delta.player.seat
+        self.add_log(f"{self.player_visuals[self.turn].display_name} took back their move", C_TEXT_DIM)
+        self.start_turn()
+
     def game_over(self) -> None:
         """Handle game over state."""
         self.state = "GAME_OVER"
@@ -498,10 +580,23 @@ class Game:
         
         self.add_log("--- FINAL STANDINGS ---", C_GOLD)
         for i, rank_record in enumerate(ranked):
-            player = next((p for p in Player.player_arrangement if p.name == rank_record['player_name']), None)
+            player = self.session.players.by_id(rank_record['player_id'])
             if player:
                 status = "ALIVE" if player.status == Status.ALIVE else "DEAD"
-                self.add_log(f"#{i+1} {rank_record['player_name']}: {rank_record['vp_count']}VP ({status})", C_TEXT_MAIN)
+                # the feed keeps 10 short lines, the cards of the sidebar show the other totals
+                totals = self.history_service.player_totals(player)
+                self.add_log(
+                    f"#{i+1} {rank_record['player_name']}: {rank_record['vp_count']}VP ({status}) "
+                    f"{totals.damage_dealt}/{totals.damage_taken} dmg +{totals.healing} hp",
+                    C_TEXT_MAIN,
+                )
+
+        # the face that hurt the most this game
+        faces = self.history_service.aggregates.faces
+        if faces:
+            face, totals = max(faces.items(), key=lambda item: item[1].damage_taken)
+            if totals.damage_taken:
+                self.add_log(f"Deadliest face: {face.name} ({totals.damage_taken} dmg)", C_GOLD)
 
     def add_particle(self, pos: tuple, text: str, col: tuple) -> None:
         """Add a floating particle effect."""
@@ -531,17 +626,19 @@ class Game:
             b.kill()
         self.buttons = []
         
-        # Clear players
-        Player.player_arrangement.clear()
-        
-        # Reinitialize
-        self.__init__()
+        # Stop the bot of the finished game
+        if self.bot_worker is not None:
+            self.bot_worker.shutdown()
+
+        # Reinitialize, the new session starts from scratch so nothing global needs clearing
+        self.__init__(ai_seats=self.ai_seats)
 
     def run(self) -> None:
         """Main game loop."""
         font_big = pygame.font.SysFont("Consolas", 32, bold=True)
         font_small = pygame.font.SysFont("Consolas", 14)
         font_particle = pygame.font.SysFont("Arial", 20, bold=True)
+        font_stats = pygame.font.SysFont("Consolas", 10)
 
         while True:
             dt = self.clock.tick(FPS) / 1000.0
@@ -558,10 +655,13 @@ class Game:
                 if event.type == pygame_gui.UI_BUTTON_PRESSED:
                     if event.ui_element.action == "restart":
                         self.restart_game()
-                    else:
+                    elif event.ui_element.action == "take_back":
+                        if not self.is_ai_turn and self.state == "IDLE":
+                            self.take_back()
+                    elif not self.is_ai_turn:
                         self.handle_choice(event.ui_element.action)
 
-                if event.type == pygame.MOUSEBUTTONDOWN:
+                if event.type == pygame.MOUSEBUTTONDOWN and not self.is_ai_turn:
                     if self.state == "IDLE" and self.dice.rect.collidepoint((mx, my)):
                         self.roll_dice()
                     elif self.state in ("TARGET", "TARGET_FALLEN"):
@@ -572,6 +672,8 @@ class Game:
                 self.manager.process_events(event)
 
             # --- UPDATES ---
+            self.update_ai()
+
             # Calculate dice hover ONCE
             dice_hover = self.dice.rect.collidepoint((mx, my))
             
@@ -656,6 +758,9 @@ class Game:
             sx = self.sidebar_rect.x + 20
             self.screen.blit(t1, (sx, 20))
             self.screen.blit(t2, (sx, 56))
+            if self.bot_worker is not None and self.bot_worker.last_result is not None:
+                t3 = font_small.render(f"AI {self.bot_worker.rollouts_per_second:,.0f} rollouts/s", True, C_TEXT_DIM)
+                self.screen.blit(t3, (sx, 72))
             
             # B) Turn/Round Indicator Pill
             round_pill = pygame.Rect(self.w - 100, 25, 80, 28)
@@ -672,8 +777,7 @@ class Game:
 
             for i, record in enumerate(ranked_records):
                 # Find the visual for this player
-                p_name = record['player_name']
-                pv = next((x for x in self.player_visuals if x.player.name == p_name), None)
+                pv = self.visual_by_id.get(record['player_id'])
                 if not pv:
                     continue
 
@@ -707,6 +811,16 @@ class Game:
                     fill_rect = pygame.Rect(card_rect.x + 12, card_rect.y + 30, fill_w, 8)
                     hp_col = C_SUCCESS if pct > 0.4 else C_DANGER
                     pygame.draw.rect(self.screen, hp_col, fill_rect, border_radius=4)
+
+                # 2.5 Running totals from the history, O(1) per card whatever the game length
+                totals = self.history_service.player_totals(pv.player)
+                for row, line in enumerate((
+                    f"DMG {totals.damage_dealt}/{totals.damage_taken}",
+                    f"HEAL {totals.healing}",
+                    f"STEAL {totals.vp_stolen}",
+                )):
+                    st_surf = font_stats.render(line, True, C_TEXT_DIM)
+                    self.screen.blit(st_surf, (card_rect.x + 200, card_rect.y + 6 + row * 13))
                 
                 # 3. VP Badge
                 vp_surf = font_particle.render(f"{pv.vp}", True, C_GOLD)
@@ -743,7 +857,7 @@ class Game:
             pygame.display.flip()
 
 
-def run_game() -> None:
-    """Entry point function to run the game."""
-    game = Game()
+def run_game(ai_seats: Iterable[int] | None = None) -> None:
+    """Entry point function to run the game, `ai_seats` are the seats played by the bot, AI_SEATS when None."""
+    game = Game(ai_seats=AI_SEATS if ai_seats is None else ai_seats)
     game.run()
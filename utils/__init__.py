@@ -1,2 +1,3 @@
 from .exceptions import *
-__all__ = ['MaxPlayersValidator','InvalidPlayerActionValidator','GameStateValidator','InputDataValidator',]
\ No newline at end of file
+from .descriptors import hybridmethod
+__all__ = ['MaxPlayersValidator','InvalidPlayerActionValidator','GameStateValidator','InputDataValidator','hybridmethod',]
\ No newline at end of file
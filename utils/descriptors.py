@@ -0,0 +1,17 @@
+from types import MethodType
+from functools import update_wrapper
+
+
+class hybridmethod:
+    """
+    Method decorator binding to the instance when called on an instance and to the class when called on the class.
+    Services use it to keep their historical class level API (one default game per process) while every
+    instance created for a `GameSession` works on its own state.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        update_wrapper(self, func)
+
+    def __get__(self, obj, cls=None):
+        return MethodType(self.func, cls if obj is None else obj)